@@ -0,0 +1 @@
+"""Benchmarks and load-test tooling, run as modules from the repository root."""
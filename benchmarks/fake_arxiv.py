@@ -0,0 +1,188 @@
+"""Local stand-in for the arXiv export API, PDF server, and ar5iv, for load tests.
+
+Serves generated Atom feeds for searches and id_list lookups, PDF bodies,
+and ar5iv-style HTML pages, with configurable latency and error injection,
+so the proxy can be driven hard without touching arxiv.org. Point the proxy
+at it with::
+
+    arxiv:
+      base_url: "http://127.0.0.1:7272/api/query"
+      pdf_base_url: "http://127.0.0.1:7272/pdf"
+      html_base_url: "http://127.0.0.1:7272/html"
+
+Every response waits ``--latency-ms`` plus up to ``--jitter-ms`` first. A
+``--throttle-rate`` fraction of requests is answered 503 with a Retry-After
+header, the way arXiv throttles, and an ``--error-rate`` fraction 500.
+PDFs and pages carry an ETag and answer matching conditional requests
+with 304. IDs starting with ``9999.`` are unknown: lookups omit them and
+PDF and HTML requests get 404. ``GET /_stats`` returns request counts per
+endpoint and status.
+
+Run with ``uv run python -m benchmarks.fake_arxiv --port 7272`` from the
+repository root; the load test starts it on its own.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+from collections import Counter
+from dataclasses import dataclass
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from benchmarks.fixtures import make_ar5iv_page, make_id_feed, make_pdf
+
+_SEARCH_TOTAL_RESULTS = 10_000
+_UNKNOWN_PREFIX = "9999."
+_LAST_MODIFIED = "Mon, 02 Jan 2023 00:00:00 GMT"
+
+
+@dataclass(frozen=True)
+class FakeArxivSettings:
+    """Latency, error injection, and body sizes for the fake upstream."""
+
+    latency_ms: float
+    jitter_ms: float
+    throttle_rate: float
+    error_rate: float
+    retry_after_seconds: int
+    pdf_bytes: int
+    html_sections: int
+
+
+class _FakeUpstream:
+    """Request counters, canned bodies, and the behaviour shared by every endpoint."""
+
+    def __init__(self, settings: FakeArxivSettings, seed: int) -> None:
+        self.settings = settings
+        self.rng = random.Random(seed)
+        self.counts: Counter[str] = Counter()
+        self.pdf_body = make_pdf(settings.pdf_bytes)
+        self.html_body = make_ar5iv_page(settings.html_sections).encode()
+
+    async def delay_or_fail(self, endpoint: str) -> Response | None:
+        """Wait the configured latency, then return an injected failure or None to serve normally."""
+        await asyncio.sleep((self.settings.latency_ms + self.rng.random() * self.settings.jitter_ms) / 1000)
+        roll = self.rng.random()
+        if roll < self.settings.throttle_rate:
+            self.counts[f"{endpoint} 503"] += 1
+            return Response(status_code=503, headers={"Retry-After": str(self.settings.retry_after_seconds)})
+        if roll < self.settings.throttle_rate + self.settings.error_rate:
+            self.counts[f"{endpoint} 500"] += 1
+            return Response(status_code=500)
+        return None
+
+    def feed(self, request: Request) -> Response:
+        """Serve an Atom feed for an id_list lookup or one page of a search."""
+        params = request.query_params
+        id_list = params.get("id_list")
+        if id_list is not None:
+            found = [_versioned(arxiv_id) for arxiv_id in id_list.split(",") if not arxiv_id.startswith(_UNKNOWN_PREFIX)]
+            body = make_id_feed(found, len(found), 0)
+        else:
+            start = int(params["start"])
+            count = max(0, min(int(params["max_results"]), _SEARCH_TOTAL_RESULTS - start))
+            body = make_id_feed(_search_ids(params["search_query"], start, count), _SEARCH_TOTAL_RESULTS, start)
+        self.counts["api 200"] += 1
+        return Response(content=body, media_type="application/atom+xml")
+
+    def document(self, endpoint: str, request: Request, arxiv_id: str, body: bytes, media_type: str) -> Response:
+        """Serve a cacheable document, honouring If-None-Match."""
+        if arxiv_id.startswith(_UNKNOWN_PREFIX):
+            self.counts[f"{endpoint} 404"] += 1
+            return Response(status_code=404)
+        etag = f'"{arxiv_id}"'
+        headers = {"ETag": etag, "Last-Modified": _LAST_MODIFIED}
+        if request.headers.get("if-none-match") == etag:
+            self.counts[f"{endpoint} 304"] += 1
+            return Response(status_code=304, headers=headers)
+        self.counts[f"{endpoint} 200"] += 1
+        return Response(content=body, media_type=media_type, headers=headers)
+
+
+def create_fake_arxiv(settings: FakeArxivSettings, seed: int) -> FastAPI:
+    """Build the fake upstream app."""
+    app = FastAPI()
+    upstream = _FakeUpstream(settings, seed)
+
+    @app.get("/api/query")
+    async def query(request: Request) -> Response:
+        failure = await upstream.delay_or_fail("api")
+        if failure is not None:
+            return failure
+        return upstream.feed(request)
+
+    @app.get("/pdf/{arxiv_id}")
+    async def pdf(request: Request, arxiv_id: str) -> Response:
+        failure = await upstream.delay_or_fail("pdf")
+        if failure is not None:
+            return failure
+        return upstream.document("pdf", request, arxiv_id, upstream.pdf_body, "application/pdf")
+
+    @app.get("/html/{arxiv_id}")
+    async def html(request: Request, arxiv_id: str) -> Response:
+        failure = await upstream.delay_or_fail("html")
+        if failure is not None:
+            return failure
+        return upstream.document("html", request, arxiv_id, upstream.html_body, "text/html")
+
+    @app.get("/_stats")
+    async def stats() -> JSONResponse:
+        return JSONResponse(content=dict(upstream.counts))
+
+    return app
+
+
+def _versioned(arxiv_id: str) -> str:
+    """Resolve an unversioned ID to version 1, as arXiv resolves it to the latest version."""
+    if "v" in arxiv_id:
+        return arxiv_id
+    return f"{arxiv_id}v1"
+
+
+def _search_ids(query: str, start: int, count: int) -> list[str]:
+    """Return stable result IDs for one page of a query, so repeated searches see the same papers."""
+    prefix = 2000 + int(hashlib.sha256(query.encode()).hexdigest(), 16) % 400
+    return [f"{prefix:04d}.{index:05d}v1" for index in range(start, start + count)]
+
+
+def add_settings_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the fake upstream's tuning flags to a command-line parser."""
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="base upstream latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=50.0, help="random extra latency per request, up to this much")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered 503 with Retry-After")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 500")
+    parser.add_argument("--retry-after-seconds", type=int, default=1, help="Retry-After sent with injected 503s")
+    parser.add_argument("--pdf-kb", type=int, default=512, help="size of every PDF body")
+    parser.add_argument("--html-sections", type=int, default=12, help="sections in every ar5iv page")
+
+
+def settings_from_arguments(args: argparse.Namespace) -> FakeArxivSettings:
+    """Build settings from parsed ``add_settings_arguments`` flags."""
+    return FakeArxivSettings(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        retry_after_seconds=args.retry_after_seconds,
+        pdf_bytes=args.pdf_kb * 1024,
+        html_sections=args.html_sections,
+    )
+
+
+def main() -> None:
+    """Serve the fake upstream until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7272)
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency jitter and error injection")
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_fake_arxiv(settings_from_arguments(args), args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark: parsing large arXiv search feeds.
+
+Generates a synthetic Atom feed shaped like an export API response (see
+``fixtures.py``) and reports the best time to parse it whole with
+``parse_search_response`` and incrementally with ``SearchFeedParser``.
+
+Run with ``uv run python -m benchmarks.feed_parsing``.
+"""
+
+import time
+from collections.abc import Callable
+
+from arxivsmart.arxiv.parser import SearchFeedParser, parse_search_response
+from benchmarks.fixtures import make_feed
+
+_ENTRY_COUNTS = (100, 2_000)
+_REPEATS = 10
+_CHUNK_SIZE = 64 * 1024
+
+
+def _parse_streaming(feed: bytes) -> int:
+    """Push the feed through the incremental parser in network-sized chunks and count the items."""
+    parser = SearchFeedParser()
+    count = 0
+    for offset in range(0, len(feed), _CHUNK_SIZE):
+        count += len(parser.feed(feed[offset : offset + _CHUNK_SIZE]))
+    return count + len(parser.close())
+
+
+def _best_ms(parse: Callable[[bytes], object], feed: bytes) -> float:
+    """Return the fastest of several runs in milliseconds."""
+    best = float("inf")
+    for _ in range(_REPEATS):
+        started = time.perf_counter()
+        parse(feed)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    """Print one row per feed size."""
+    print(f"{'entries':>8} {'feed KB':>8} {'whole ms':>9} {'streamed ms':>12}")
+    for count in _ENTRY_COUNTS:
+        feed = make_feed(count)
+        whole = _best_ms(parse_search_response, feed)
+        streamed = _best_ms(_parse_streaming, feed)
+        print(f"{count:>8} {len(feed) // 1024:>8} {whole:>9.2f} {streamed:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
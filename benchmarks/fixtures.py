@@ -0,0 +1,117 @@
+"""Synthetic inputs shared by the benchmarks.
+
+Feeds are shaped like export API responses: five authors, three categories,
+two links, and the optional arXiv fields on every entry. Pages are shaped
+like ar5iv renderings: a title block, an abstract, sections of paragraphs
+with inline MathML, numbered equations, figures, tables, and a bibliography.
+Everything is generated deterministically, so runs compare like for like.
+"""
+
+_FEED_OPEN = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+      xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"
+      xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title type="html">ArXiv Query: search_query=all:benchmark</title>
+"""
+
+
+def _make_entry(arxiv_id: str, index: int) -> str:
+    """Render one entry with every field the parser reads."""
+    authors = "".join(
+        f"<author><name>Author {author}</name><arxiv:affiliation>Example University</arxiv:affiliation></author>" for author in range(5)
+    )
+    return f"""<entry>
+    <id>http://arxiv.org/abs/{arxiv_id}</id>
+    <updated>2023-01-02T00:00:00Z</updated>
+    <published>2023-01-01T00:00:00Z</published>
+    <title>A study of benchmark workloads,
+      part {index}</title>
+    <summary>  {"We measure feed parsing for large result pages. " * 18}</summary>
+    {authors}
+    <arxiv:doi>10.1234/example.{index}</arxiv:doi>
+    <link title="doi" href="http://dx.doi.org/10.1234/example.{index}" rel="related"/>
+    <link href="http://arxiv.org/abs/{arxiv_id}" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/{arxiv_id}" rel="related" type="application/pdf"/>
+    <arxiv:comment>12 pages, 4 figures</arxiv:comment>
+    <arxiv:journal_ref>Journal of Examples {index}</arxiv:journal_ref>
+    <arxiv:primary_category term="cs.DC" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.DC" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.PF" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>"""
+
+
+def make_feed(entry_count: int) -> bytes:
+    """Render a complete search feed with ``entry_count`` entries."""
+    return make_id_feed([f"2301.{index:05d}v1" for index in range(entry_count)], entry_count, 0)
+
+
+def make_id_feed(arxiv_ids: list[str], total_results: int, start_index: int) -> bytes:
+    """Render a feed page with one entry per ID, as for an id_list lookup or one page of a search."""
+    entries = "\n  ".join(_make_entry(arxiv_id, start_index + index) for index, arxiv_id in enumerate(arxiv_ids))
+    return f"""{_FEED_OPEN}  <opensearch:totalResults>{total_results}</opensearch:totalResults>
+  <opensearch:startIndex>{start_index}</opensearch:startIndex>
+  <opensearch:itemsPerPage>{len(arxiv_ids)}</opensearch:itemsPerPage>
+  {entries}
+</feed>""".encode()
+
+
+def make_pdf(size_bytes: int) -> bytes:
+    """Return a body of the given size that starts like a PDF; the proxy never parses it."""
+    header = b"%PDF-1.7\n"
+    return header + b"0" * max(0, size_bytes - len(header))
+
+
+def _make_paragraph(section: int, paragraph: int) -> str:
+    """Render a paragraph with inline math and citations, as ar5iv emits them."""
+    math = (
+        f'<math alttext="x_{{{paragraph}}}^2" class="ltx_Math" display="inline">'
+        f"<semantics><msubsup><mi>x</mi><mn>{paragraph}</mn><mn>2</mn></msubsup>"
+        f'<annotation encoding="application/x-tex">x_{{{paragraph}}}^2</annotation></semantics></math>'
+    )
+    citation = f'<cite class="ltx_cite">[<a class="ltx_ref" href="#bib.bib{paragraph + 1}">{paragraph + 1}</a>]</cite>'
+    text = "The measured latency grows with the number of queued requests under sustained load. " * 4
+    return f'<div class="ltx_para" id="S{section}.p{paragraph}"><p class="ltx_p">{text}Let {math} denote the load {citation}.</p></div>'
+
+
+def _make_section(section: int) -> str:
+    """Render a section with paragraphs, a numbered equation, a figure, and a table."""
+    paragraphs = "".join(_make_paragraph(section, paragraph) for paragraph in range(6))
+    equation = (
+        f'<table class="ltx_equation ltx_eqn_table" id="S{section}.E1"><tbody><tr class="ltx_equation ltx_eqn_row">'
+        f'<td class="ltx_eqn_cell"><math alttext="L = \\sum_i w_i" display="block"><mi>L</mi><mo>=</mo>'
+        f"<munder><mo>∑</mo><mi>i</mi></munder><msub><mi>w</mi><mi>i</mi></msub></math></td>"
+        f'<td class="ltx_eqn_cell ltx_eqn_eqno">({section}.1)</td></tr></tbody></table>'
+    )
+    figure = (
+        f'<figure class="ltx_figure" id="S{section}.F1"><img alt="" class="ltx_graphics" src="x{section}.png" width="461" height="200">'
+        f'<figcaption class="ltx_caption">Figure {section}: Throughput under load.</figcaption></figure>'
+    )
+    rows = "".join(f"<tr><td>{row}</td><td>{row * 1.5:.1f}</td><td>{row * 3}</td></tr>" for row in range(8))
+    table = (
+        f'<figure class="ltx_table" id="S{section}.T1"><table class="ltx_tabular"><thead><tr><th>n</th><th>ms</th><th>ops</th></tr></thead>'
+        f'<tbody>{rows}</tbody></table><figcaption class="ltx_caption">Table {section}: Results.</figcaption></figure>'
+    )
+    return (
+        f'<section class="ltx_section" id="S{section}"><h2 class="ltx_title ltx_title_section">'
+        f'<span class="ltx_tag ltx_tag_section">{section} </span>Section {section}</h2>{paragraphs}{equation}{figure}{table}</section>'
+    )
+
+
+def make_ar5iv_page(section_count: int) -> str:
+    """Render an ar5iv-style HTML page with ``section_count`` sections and a matching bibliography."""
+    sections = "".join(_make_section(section) for section in range(1, section_count + 1))
+    references = "".join(
+        f'<li class="ltx_bibitem" id="bib.bib{index}"><span class="ltx_bibblock">A. Author. Reference {index}. '
+        f"<em>Journal of Examples</em>, 2020.</span></li>"
+        for index in range(1, section_count * 6 + 1)
+    )
+    return f"""<!DOCTYPE html><html lang="en"><head><title>A study of benchmark workloads</title></head>
+<body><div class="ltx_page_main"><div class="ltx_page_content"><article class="ltx_document ltx_authors_1line">
+<h1 class="ltx_title ltx_title_document">A study of benchmark workloads</h1>
+<div class="ltx_authors"><span class="ltx_creator ltx_role_author"><span class="ltx_personname">Author 0</span></span></div>
+<div class="ltx_abstract"><h6 class="ltx_title ltx_title_abstract">Abstract</h6><p class="ltx_p">{"We measure things. " * 40}</p></div>
+{sections}
+<section class="ltx_bibliography" id="bib"><h2 class="ltx_title ltx_title_bibliography">References</h2>
+<ul class="ltx_biblist">{references}</ul></section>
+</article></div></div></body></html>"""
@@ -0,0 +1,397 @@
+"""Offline load test: drive the proxy against a local fake arXiv and report how it holds up.
+
+By default the script starts ``fake_arxiv.py`` and a proxy configured
+against it on free local ports, with its own cache directory, then runs
+``--concurrency`` clients for ``--duration`` seconds. Requests still in
+flight ``--drain-seconds`` after that are abandoned and counted, so a run
+never outlasts its duration by more than the drain window, even when
+injected throttling backs the proxy's rate limiter off. The proxy's
+backoff is capped at ``--rate-limit-max-seconds``. Both child processes
+are terminated when the run ends, fails, or the script receives SIGTERM. Each client loops over
+a weighted mix of ``/v1/search``, ``/v1/paper/{id}``, ``/v1/paper/{id}/pdf``,
+and ``/v1/paper/{id}/markdown`` requests drawn from fixed pools of queries
+and IDs, so later requests hit the caches the earlier ones filled.
+
+The report gives per-route throughput and p50/p95/p99 latency, the time
+requests spent waiting for rate-limiter slots (from the proxy's ``/v1/info``
+counters), the proxy's resident set size sampled during the run, and the
+requests the fake upstream served.
+
+Pass ``--proxy`` to drive an already running proxy instead, plus
+``--proxy-pid`` to sample its RSS and ``--upstream`` for the upstream
+counts; point its ``arxiv.*base_url`` settings at a
+``fake_arxiv.py`` you started yourself, never at arxiv.org.
+
+Run with ``uv run python -m benchmarks.load_test --duration 30`` from the repository root.
+"""
+
+import argparse
+import asyncio
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+
+import httpx
+import uvicorn
+import yaml
+
+from arxivsmart.api.app import create_app
+from arxivsmart.config import Config
+from benchmarks.fake_arxiv import add_settings_arguments
+
+_REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+_STARTUP_TIMEOUT_SECONDS = 20.0
+_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+_RSS_SAMPLE_SECONDS = 0.25
+_ROUTES = ("search", "paper", "pdf", "markdown")
+_PRIORITIES = ("interactive", "normal", "background")
+
+
+@dataclass
+class _RouteResults:
+    """Latencies and failures collected for one route."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    abandoned: int = 0
+
+
+@dataclass
+class _Workload:
+    """What the clients request and how often."""
+
+    weights: dict[str, float]
+    queries: list[str]
+    arxiv_ids: list[str]
+    max_results: int
+
+
+def _free_port() -> int:
+    """Return a local TCP port that is free right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        port: int = probe.getsockname()[1]
+        return port
+
+
+def _write_proxy_config(directory: Path, proxy_port: int, upstream_url: str, args: argparse.Namespace) -> Path:
+    """Write a proxy config based on the template that points at the fake upstream and a scratch cache."""
+    document = yaml.safe_load((_REPOSITORY_ROOT / "config.yaml.template").read_text(encoding="utf-8"))
+    document["service"].update({"port": proxy_port, "reload": False, "log_level": "WARNING"})
+    document["arxiv"].update(
+        {
+            "base_url": f"{upstream_url}/api/query",
+            "pdf_base_url": f"{upstream_url}/pdf",
+            "html_base_url": f"{upstream_url}/html",
+            "rate_limit_seconds": args.rate_limit_seconds,
+            "rate_limit_max_seconds": args.rate_limit_max_seconds,
+        },
+    )
+    document["cache"]["directory"] = str(directory / "cache")
+    path = directory / "config.yaml"
+    path.write_text(yaml.safe_dump(document), encoding="utf-8")
+    return path
+
+
+def _serve_proxy(config_path: Path) -> None:
+    """Run the proxy in this process with the given config; used for the spawned proxy process."""
+    config = Config.from_yaml(config_path)
+    service = config.get_service_config()
+    uvicorn.run(create_app(config=config), host=service.host, port=service.port, log_level="warning")
+
+
+def _wait_until_up(url: str) -> None:
+    """Poll a URL until it answers, or raise once the startup timeout has passed."""
+    deadline = time.monotonic() + _STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up within {_STARTUP_TIMEOUT_SECONDS:.0f} s")
+
+
+@contextmanager
+def _child_process(command: list[str]) -> Iterator[subprocess.Popen[bytes]]:
+    """Start a child process from the repository root and stop it on exit, killing it if it does not stop in time."""
+    process = subprocess.Popen(command, cwd=_REPOSITORY_ROOT)
+    try:
+        yield process
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _exit_on_sigterm(signum: int, frame: FrameType | None) -> None:
+    """Turn SIGTERM into SystemExit so the child processes are stopped on the way out."""
+    sys.exit(128 + signum)
+
+
+@contextmanager
+def _local_stack(args: argparse.Namespace) -> Iterator[tuple[str, int, str]]:
+    """Start the fake upstream and a proxy against it; yield the proxy URL and PID and the upstream URL, then stop both."""
+    upstream_port = _free_port()
+    proxy_port = _free_port()
+    upstream_url = f"http://127.0.0.1:{upstream_port}"
+    proxy_url = f"http://127.0.0.1:{proxy_port}"
+    upstream_command = [
+        sys.executable,
+        "-m",
+        "benchmarks.fake_arxiv",
+        f"--port={upstream_port}",
+        f"--latency-ms={args.latency_ms}",
+        f"--jitter-ms={args.jitter_ms}",
+        f"--throttle-rate={args.throttle_rate}",
+        f"--error-rate={args.error_rate}",
+        f"--retry-after-seconds={args.retry_after_seconds}",
+        f"--pdf-kb={args.pdf_kb}",
+        f"--html-sections={args.html_sections}",
+    ]
+    with tempfile.TemporaryDirectory() as scratch:
+        config_path = _write_proxy_config(Path(scratch), proxy_port, upstream_url, args)
+        proxy_command = [sys.executable, "-m", "benchmarks.load_test", "--serve-proxy", str(config_path)]
+        with _child_process(upstream_command), _child_process(proxy_command) as proxy:
+            _wait_until_up(f"{upstream_url}/_stats")
+            _wait_until_up(f"{proxy_url}/v1/health")
+            yield proxy_url, proxy.pid, upstream_url
+
+
+async def _request(client: httpx.AsyncClient, route: str, workload: _Workload, rng: random.Random) -> httpx.Response:
+    """Send one request for the given route with randomly drawn parameters."""
+    if route == "search":
+        page = rng.randrange(3)
+        body = {
+            "query": rng.choice(workload.queries),
+            "start": page * workload.max_results,
+            "max_results": workload.max_results,
+            "sort_by": "relevance",
+            "sort_order": "descending",
+        }
+        return await client.post("/v1/search", json=body)
+
+    arxiv_id = rng.choice(workload.arxiv_ids)
+    if route == "paper":
+        return await client.get(f"/v1/paper/{arxiv_id}")
+    return await client.get(f"/v1/paper/{arxiv_id}/{route}")
+
+
+async def _client_loop(
+    client: httpx.AsyncClient,
+    workload: _Workload,
+    deadline: float,
+    rng: random.Random,
+    results: dict[str, _RouteResults],
+) -> None:
+    """Send requests back to back until the deadline, recording each latency, failure, and abandoned request."""
+    routes = list(workload.weights)
+    weights = list(workload.weights.values())
+    while time.monotonic() < deadline:
+        route = rng.choices(routes, weights)[0]
+        started = time.perf_counter()
+        try:
+            response = await _request(client, route, workload, rng)
+            failed = response.status_code != 200
+        except httpx.HTTPError:
+            failed = True
+        except asyncio.CancelledError:
+            results[route].abandoned += 1
+            raise
+        results[route].latencies.append(time.perf_counter() - started)
+        if failed:
+            results[route].errors += 1
+
+
+async def _read_rss_kb(pid: int) -> int | None:
+    """Return a process's resident set size in KiB, or None once it has gone away."""
+    process = await asyncio.create_subprocess_exec("ps", "-o", "rss=", "-p", str(pid), stdout=asyncio.subprocess.PIPE)
+    output, _ = await process.communicate()
+    text = output.decode().strip()
+    if text == "":
+        return None
+    return int(text)
+
+
+async def _sample_rss(pid: int, samples: list[int], stop: asyncio.Event) -> None:
+    """Record the process's RSS periodically until stopped."""
+    while not stop.is_set():
+        rss = await _read_rss_kb(pid)
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=_RSS_SAMPLE_SECONDS)
+        except TimeoutError:
+            continue
+
+
+async def _limiter_stats(client: httpx.AsyncClient) -> dict[str, dict[str, float]]:
+    """Return the proxy's rate-limiter counters from /v1/info."""
+    response = await client.get("/v1/info")
+    stats: dict[str, dict[str, float]] = response.json()["data"]["stats"]
+    return {name: stats[name] for name in ("api_rate_limiter", "pdf_rate_limiter")}
+
+
+async def _run_load(
+    proxy_url: str,
+    proxy_pid: int | None,
+    workload: _Workload,
+    args: argparse.Namespace,
+) -> tuple[dict[str, _RouteResults], float, dict[str, dict[str, float]], dict[str, dict[str, float]], list[int]]:
+    """Drive the proxy and return per-route results, elapsed time, limiter counters before and after, and RSS samples."""
+    results = {route: _RouteResults() for route in workload.weights}
+    rss_samples: list[int] = []
+    stop = asyncio.Event()
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=proxy_url, timeout=args.request_timeout_seconds, limits=limits) as client:
+        before = await _limiter_stats(client)
+        sampler = None
+        if proxy_pid is not None:
+            sampler = asyncio.create_task(_sample_rss(proxy_pid, rss_samples, stop))
+        started = time.monotonic()
+        deadline = started + args.duration
+        clients = [
+            asyncio.create_task(_client_loop(client, workload, deadline, random.Random(args.seed + index), results))
+            for index in range(args.concurrency)
+        ]
+        _, unfinished = await asyncio.wait(clients, timeout=args.duration + args.drain_seconds)
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*clients, return_exceptions=True)
+        elapsed = time.monotonic() - started
+        stop.set()
+        if sampler is not None:
+            await sampler
+        after = await _limiter_stats(client)
+    return results, elapsed, before, after, rss_samples
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of already sorted values."""
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def _print_report(
+    results: dict[str, _RouteResults],
+    elapsed: float,
+    before: dict[str, dict[str, float]],
+    after: dict[str, dict[str, float]],
+    rss_samples: list[int],
+) -> None:
+    """Print throughput and latency per route, rate-limit waiting, and proxy memory."""
+    print(f"{'route':<10} {'requests':>9} {'errors':>7} {'abandoned':>9} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    everything = _RouteResults()
+    for route, result in [*results.items(), ("total", everything)]:
+        if route != "total":
+            everything.latencies.extend(result.latencies)
+            everything.errors += result.errors
+            everything.abandoned += result.abandoned
+        if not result.latencies:
+            continue
+        latencies = sorted(result.latencies)
+        p50, p95, p99 = (_percentile(latencies, fraction) * 1000 for fraction in (0.50, 0.95, 0.99))
+        print(
+            f"{route:<10} {len(latencies):>9} {result.errors:>7} {result.abandoned:>9} {len(latencies) / elapsed:>8.1f} "
+            f"{p50:>9.1f} {p95:>9.1f} {p99:>9.1f}",
+        )
+
+    print()
+    for name in ("api_rate_limiter", "pdf_rate_limiter"):
+        waited = after[name]["wait_seconds_total"] - before[name]["wait_seconds_total"]
+        slots = sum(after[name][f"{priority}_granted"] - before[name][f"{priority}_granted"] for priority in _PRIORITIES)
+        mean_ms = waited / slots * 1000 if slots > 0 else 0.0
+        print(
+            f"{name}: {slots:.0f} slots, {waited:.2f} s waiting ({mean_ms:.1f} ms mean), "
+            f"{after[name]['throttled'] - before[name]['throttled']:.0f} throttled, interval now {after[name]['interval_seconds']:.3f} s",
+        )
+
+    if rss_samples:
+        start, peak, end = (rss / 1024 for rss in (rss_samples[0], max(rss_samples), rss_samples[-1]))
+        print(f"proxy RSS: start {start:.1f} MiB, peak {peak:.1f} MiB, end {end:.1f} MiB")
+
+
+def _print_upstream_stats(upstream_url: str) -> None:
+    """Print how many requests the fake upstream answered, per endpoint and status."""
+    counts: dict[str, int] = httpx.get(f"{upstream_url}/_stats").json()
+    print("upstream: " + ", ".join(f"{key} x{count}" for key, count in sorted(counts.items())))
+
+
+def _parse_weights(text: str) -> dict[str, float]:
+    """Parse a ``route:weight,...`` mix, rejecting unknown routes."""
+    weights: dict[str, float] = {}
+    for part in text.split(","):
+        route, _, weight = part.partition(":")
+        if route not in _ROUTES:
+            raise ValueError(f"unknown route in --mix: {route}; expected one of {', '.join(_ROUTES)}")
+        weights[route] = float(weight)
+    return weights
+
+
+def _parse_arguments() -> argparse.Namespace:
+    """Parse the load test's command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--serve-proxy", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--proxy", help="URL of an already running proxy to drive instead of starting one")
+    parser.add_argument("--proxy-pid", type=int, help="PID of that proxy, to sample its RSS")
+    parser.add_argument("--upstream", help="URL of the fake_arxiv.py that proxy uses, to report its request counts")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to generate load for")
+    parser.add_argument("--drain-seconds", type=float, default=10.0, help="seconds to let in-flight requests finish before abandoning them")
+    parser.add_argument("--mix", default="search:4,paper:4,pdf:1,markdown:1", help="relative route weights")
+    parser.add_argument("--queries", type=int, default=50, help="distinct search queries to draw from")
+    parser.add_argument("--papers", type=int, default=500, help="distinct arXiv IDs to draw from")
+    parser.add_argument("--max-results", type=int, default=25, help="results per search request")
+    parser.add_argument("--rate-limit-seconds", type=float, default=0.05, help="proxy rate_limit_seconds when starting the proxy")
+    parser.add_argument(
+        "--rate-limit-max-seconds",
+        type=float,
+        default=1.0,
+        help="proxy rate_limit_max_seconds when starting the proxy, capping throttling backoff",
+    )
+    parser.add_argument("--request-timeout-seconds", type=float, default=120.0, help="client-side timeout per request")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the request mix")
+    add_settings_arguments(parser)
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the load test and print the report."""
+    args = _parse_arguments()
+    if args.serve_proxy is not None:
+        _serve_proxy(args.serve_proxy)
+        return
+
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    workload = _Workload(
+        weights=_parse_weights(args.mix),
+        queries=[f"all:topic{index}" for index in range(args.queries)],
+        arxiv_ids=[f"2301.{index:05d}" for index in range(args.papers)],
+        max_results=args.max_results,
+    )
+    if args.proxy is not None:
+        outcome = asyncio.run(_run_load(args.proxy, args.proxy_pid, workload, args))
+        _print_report(*outcome)
+        if args.upstream is not None:
+            _print_upstream_stats(args.upstream)
+        return
+
+    with _local_stack(args) as (proxy_url, proxy_pid, upstream_url):
+        outcome = asyncio.run(_run_load(proxy_url, proxy_pid, workload, args))
+        _print_report(*outcome)
+        _print_upstream_stats(upstream_url)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark: bytes held per cached paper.
+
+Stores N papers in a MetadataCache, then measures with tracemalloc how much
+memory the decoded papers retain when all N are held at once, as they are
+for a large search page or a batch lookup.
+
+"before" decodes the same payloads into the previous representation:
+regular frozen dataclasses with a per-instance ``__dict__``, lists for
+authors and categories, and a fresh string per category on every paper.
+"after" is ``MetadataCache.get``, which builds the slotted, tuple-backed
+types and interns category strings.
+
+Run with ``uv run python -m benchmarks.paper_memory``.
+"""
+
+import gc
+import json
+import random
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from arxivsmart.arxiv.types import Author, Paper
+from arxivsmart.cache.metadata import MetadataCache
+
+_PAPER_COUNTS = (100, 2_000, 10_000)
+_CATEGORIES = (
+    "cs.AI",
+    "cs.CL",
+    "cs.CV",
+    "cs.DC",
+    "cs.LG",
+    "cs.NE",
+    "cs.PF",
+    "cs.RO",
+    "math.OC",
+    "math.ST",
+    "physics.comp-ph",
+    "q-bio.NC",
+    "quant-ph",
+    "stat.ML",
+)
+
+
+@dataclass(frozen=True)
+class _LegacyAuthor:
+    name: str
+    affiliation: str
+
+
+@dataclass(frozen=True)
+class _LegacyPaper:
+    arxiv_id: str
+    title: str
+    summary: str
+    authors: list[_LegacyAuthor]
+    categories: list[str]
+    primary_category: str
+    published: str
+    updated: str
+    pdf_url: str
+    abstract_url: str
+    doi: str
+    comment: str
+    journal_ref: str
+
+
+def _make_papers(count: int) -> list[Paper]:
+    """Build papers with a short abstract, a few authors, and one to three categories each."""
+    rng = random.Random(count)
+    papers: list[Paper] = []
+    for index in range(count):
+        categories = tuple(rng.sample(_CATEGORIES, rng.randint(1, 3)))
+        papers.append(
+            Paper(
+                arxiv_id=f"2301.{index:05d}v1",
+                title=f"A study of cached workloads, part {index}",
+                summary="We measure the memory held by cached paper metadata. " * 4,
+                authors=tuple(Author(name=f"Author {author}", affiliation="") for author in range(4)),
+                categories=categories,
+                primary_category=categories[0],
+                published="2023-01-01T00:00:00Z",
+                updated="2023-01-02T00:00:00Z",
+                pdf_url=f"http://arxiv.org/pdf/2301.{index:05d}v1",
+                abstract_url=f"http://arxiv.org/abs/2301.{index:05d}v1",
+                doi="",
+                comment="",
+                journal_ref="",
+            ),
+        )
+    return papers
+
+
+def _decode_legacy(payload: str) -> _LegacyPaper:
+    """Rebuild a paper from its cache payload the way the metadata cache did before."""
+    data: dict[str, Any] = json.loads(payload)
+    return _LegacyPaper(
+        arxiv_id=data["arxiv_id"],
+        title=data["title"],
+        summary=data["summary"],
+        authors=[_LegacyAuthor(name=author["name"], affiliation=author["affiliation"]) for author in data["authors"]],
+        categories=list(data["categories"]),
+        primary_category=data["primary_category"],
+        published=data["published"],
+        updated=data["updated"],
+        pdf_url=data["pdf_url"],
+        abstract_url=data["abstract_url"],
+        doi=data["doi"],
+        comment=data["comment"],
+        journal_ref=data["journal_ref"],
+    )
+
+
+def _retained_bytes(build: Callable[[], list[object]]) -> int:
+    """Return the bytes still allocated after ``build`` returns, while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def _measure(count: int, cache_dir: Path) -> tuple[int, int]:
+    """Return retained bytes per paper for the previous and the current representation."""
+    papers = _make_papers(count)
+    payloads = [json.dumps(asdict(paper)) for paper in papers]
+    cache = MetadataCache(database_path=cache_dir / f"metadata-{count}.sqlite3", unversioned_ttl_seconds=60.0)
+    try:
+        for paper in papers:
+            cache.put(paper.arxiv_id, paper)
+        ids = [paper.arxiv_id for paper in papers]
+        before = _retained_bytes(lambda: [_decode_legacy(payload) for payload in payloads])
+        after = _retained_bytes(lambda: [cache.get(arxiv_id) for arxiv_id in ids])
+    finally:
+        cache.close()
+    return before // count, after // count
+
+
+def main() -> None:
+    """Print one before/after row per number of held papers."""
+    print(f"{'papers':>7} {'before B/paper':>15} {'after B/paper':>14} {'saved':>7}")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for count in _PAPER_COUNTS:
+            before, after = _measure(count, Path(cache_dir))
+            print(f"{count:>7} {before:>15} {after:>14} {1 - after / before:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark: deep rate-limiter queues cost coroutines, not threads.
+
+Queues N concurrent requests behind one RateLimiter with a tiny interval and
+a no-op upstream call, then reports how many threads the process used while
+the queue drained. With the previous blocking limiter every queued request
+held an ``asyncio.to_thread`` worker, so the default executor (at most
+``min(32, cpu_count + 4)`` threads) capped the queue depth.
+
+A second table measures interactive latency under bulk load: a steady
+trickle of interactive requests arrives while a deep background queue drains,
+and each one should wait about one interval, not for the whole queue.
+
+Run with ``uv run python -m benchmarks.queue_depth``.
+"""
+
+import asyncio
+import os
+import statistics
+import threading
+import time
+
+from arxivsmart.arxiv.rate_limiter import Priority, RateLimiter
+
+_QUEUE_DEPTHS = (100, 1_000, 5_000)
+_MAX_QUEUE_DEPTH = max(_QUEUE_DEPTHS)
+_INTERVAL_SECONDS = 0.0001
+_MIXED_INTERVAL_SECONDS = 0.002
+_MIXED_BACKGROUND_DEPTH = 500
+_MIXED_INTERACTIVE_COUNT = 50
+
+
+async def _queued_request(limiter: RateLimiter, priority: Priority) -> float:
+    """Wait for a limiter slot, perform a no-op upstream call inside it, and return the wait in seconds."""
+    started = time.perf_counter()
+    async with limiter.slot(priority):
+        waited = time.perf_counter() - started
+        await asyncio.sleep(0)
+    return waited
+
+
+def _make_rate_limiter(interval_seconds: float) -> RateLimiter:
+    """Build a limiter whose interval stays at its floor; nothing here is throttled."""
+    return RateLimiter(
+        min_interval_seconds=interval_seconds,
+        max_interval_seconds=interval_seconds,
+        backoff_factor=2.0,
+        recovery_successes=1,
+        max_queue_depth=_MAX_QUEUE_DEPTH,
+    )
+
+
+async def _run(depth: int) -> tuple[int, int, float]:
+    """Queue ``depth`` requests at once and return peak queue depth, peak thread count, and drain time."""
+    limiter = _make_rate_limiter(_INTERVAL_SECONDS)
+    peak_depth = 0
+    peak_threads = threading.active_count()
+
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(_queued_request(limiter, "normal")) for _ in range(depth)]
+    while not all(task.done() for task in tasks):
+        peak_depth = max(peak_depth, limiter.queue_depth())
+        peak_threads = max(peak_threads, threading.active_count())
+        await asyncio.sleep(0.001)
+    await asyncio.gather(*tasks)
+    return peak_depth, peak_threads, time.perf_counter() - started
+
+
+async def _run_mixed() -> tuple[float, float, float]:
+    """Trickle interactive requests into a deep background queue and return their p50/p99 wait and the background drain time."""
+    limiter = _make_rate_limiter(_MIXED_INTERVAL_SECONDS)
+    started = time.perf_counter()
+    background = [asyncio.create_task(_queued_request(limiter, "background")) for _ in range(_MIXED_BACKGROUND_DEPTH)]
+    interactive: list[asyncio.Task[float]] = []
+    for _ in range(_MIXED_INTERACTIVE_COUNT):
+        await asyncio.sleep(_MIXED_INTERVAL_SECONDS * 3)
+        interactive.append(asyncio.create_task(_queued_request(limiter, "interactive")))
+    waits = sorted(await asyncio.gather(*interactive))
+    await asyncio.gather(*background)
+    p99 = waits[min(len(waits) - 1, int(len(waits) * 0.99))]
+    return statistics.median(waits), p99, time.perf_counter() - started
+
+
+def main() -> None:
+    """Print one result row per queue depth."""
+    cpu_count = os.cpu_count()
+    if cpu_count is None:
+        cpu_count = 1
+    print(f"default to_thread executor size: {min(32, cpu_count + 4)} workers")
+    print(f"{'queued':>8} {'peak depth':>11} {'peak threads':>13} {'drain s':>9}")
+    for depth in _QUEUE_DEPTHS:
+        peak_depth, peak_threads, elapsed = asyncio.run(_run(depth))
+        print(f"{depth:>8} {peak_depth:>11} {peak_threads:>13} {elapsed:>9.2f}")
+
+    print()
+    print(f"interactive wait behind {_MIXED_BACKGROUND_DEPTH} background requests, interval {_MIXED_INTERVAL_SECONDS * 1000:.1f} ms")
+    p50, p99, elapsed = asyncio.run(_run_mixed())
+    print(f"p50 {p50 * 1000:.2f} ms  p99 {p99 * 1000:.2f} ms  background drained in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Benchmark: encoding large search and batch-lookup responses.
+
+Compares the previous response path, which copied every ``Paper`` into
+pydantic response models, dumped them back to dicts, and encoded the
+envelope with the stdlib ``json`` module, against the current path, which
+builds plain summary dicts (or passes the ``Paper`` dataclasses through
+untouched) and encodes the envelope with orjson.
+
+The previous models are reproduced here, since the API no longer has them.
+Both paths must produce byte-identical bodies; the benchmark stops if not.
+
+Run with ``uv run python -m benchmarks.response_encoding``.
+"""
+
+import time
+from collections.abc import Callable
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from arxivsmart.api.models.paper import PaperLookupResult, PapersResponse
+from arxivsmart.api.models.search import PaperSummary, SearchResponse
+from arxivsmart.api.utils import success_response
+from arxivsmart.arxiv.types import Author, Paper
+
+_RESULT_COUNTS = (100, 500, 2_000)
+_REPEATS = 20
+
+
+class _PaperSummaryModel(BaseModel):
+    arxiv_id: str
+    title: str
+    summary: str
+    authors: list[str]
+    primary_category: str
+    published: str
+    updated: str
+    pdf_url: str
+
+
+class _SearchResponseModel(BaseModel):
+    total_results: int
+    start_index: int
+    items_per_page: int
+    papers: list[_PaperSummaryModel]
+
+
+class _AuthorDetailModel(BaseModel):
+    name: str
+    affiliation: str
+
+
+class _PaperDetailModel(BaseModel):
+    arxiv_id: str
+    title: str
+    summary: str
+    authors: list[_AuthorDetailModel]
+    categories: list[str]
+    primary_category: str
+    published: str
+    updated: str
+    pdf_url: str
+    abstract_url: str
+    doi: str
+    comment: str
+    journal_ref: str
+
+
+class _PaperLookupModel(BaseModel):
+    arxiv_id: str
+    found: bool
+    paper: _PaperDetailModel | None
+
+
+class _PapersResponseModel(BaseModel):
+    papers: list[_PaperLookupModel]
+
+
+def _make_papers(count: int) -> list[Paper]:
+    """Build papers with realistic field sizes: a ~1 KB abstract and a handful of authors."""
+    return [
+        Paper(
+            arxiv_id=f"2301.{index:05d}v1",
+            title=f"A study of benchmark workloads, part {index}",
+            summary="We measure response encoding for large result pages. " * 18,
+            authors=tuple(Author(name=f"Author {author}", affiliation="Example University") for author in range(5)),
+            categories=("cs.DC", "cs.PF"),
+            primary_category="cs.DC",
+            published="2023-01-01T00:00:00Z",
+            updated="2023-01-02T00:00:00Z",
+            pdf_url=f"http://arxiv.org/pdf/2301.{index:05d}v1",
+            abstract_url=f"http://arxiv.org/abs/2301.{index:05d}v1",
+            doi="10.1234/example",
+            comment="12 pages, 4 figures",
+            journal_ref="",
+        )
+        for index in range(count)
+    ]
+
+
+def _search_before(papers: list[Paper]) -> bytes:
+    """Encode a search page the way the route did before orjson."""
+    response = _SearchResponseModel(
+        total_results=len(papers),
+        start_index=0,
+        items_per_page=len(papers),
+        papers=[
+            _PaperSummaryModel(
+                arxiv_id=paper.arxiv_id,
+                title=paper.title,
+                summary=paper.summary,
+                authors=[author.name for author in paper.authors],
+                primary_category=paper.primary_category,
+                published=paper.published,
+                updated=paper.updated,
+                pdf_url=paper.pdf_url,
+            )
+            for paper in papers
+        ],
+    )
+    return JSONResponse(status_code=200, content={"status": 200, "data": response.model_dump()}).body
+
+
+def _search_after(papers: list[Paper]) -> bytes:
+    """Encode a search page the way the route does now."""
+    response = SearchResponse(
+        total_results=len(papers),
+        start_index=0,
+        items_per_page=len(papers),
+        papers=[
+            PaperSummary(
+                arxiv_id=paper.arxiv_id,
+                title=paper.title,
+                summary=paper.summary,
+                authors=[author.name for author in paper.authors],
+                primary_category=paper.primary_category,
+                published=paper.published,
+                updated=paper.updated,
+                pdf_url=paper.pdf_url,
+            )
+            for paper in papers
+        ],
+    )
+    return success_response(status=200, data=response).body
+
+
+def _papers_before(papers: list[Paper]) -> bytes:
+    """Encode a batch lookup the way the route did before orjson."""
+    results = [
+        _PaperLookupModel(
+            arxiv_id=paper.arxiv_id,
+            found=True,
+            paper=_PaperDetailModel(
+                arxiv_id=paper.arxiv_id,
+                title=paper.title,
+                summary=paper.summary,
+                authors=[_AuthorDetailModel(name=author.name, affiliation=author.affiliation) for author in paper.authors],
+                categories=paper.categories,
+                primary_category=paper.primary_category,
+                published=paper.published,
+                updated=paper.updated,
+                pdf_url=paper.pdf_url,
+                abstract_url=paper.abstract_url,
+                doi=paper.doi,
+                comment=paper.comment,
+                journal_ref=paper.journal_ref,
+            ),
+        )
+        for paper in papers
+    ]
+    response = _PapersResponseModel(papers=results)
+    return JSONResponse(status_code=200, content={"status": 200, "data": response.model_dump()}).body
+
+
+def _papers_after(papers: list[Paper]) -> bytes:
+    """Encode a batch lookup the way the route does now."""
+    response = PapersResponse(papers=[PaperLookupResult(arxiv_id=paper.arxiv_id, found=True, paper=paper) for paper in papers])
+    return success_response(status=200, data=response).body
+
+
+def _best_of(encode: Callable[[list[Paper]], bytes], papers: list[Paper]) -> tuple[float, int]:
+    """Return the fastest of several runs in milliseconds and the encoded size."""
+    best = float("inf")
+    size = 0
+    for _ in range(_REPEATS):
+        started = time.perf_counter()
+        size = len(encode(papers))
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, size
+
+
+def main() -> None:
+    """Print one before/after row per response kind and result count."""
+    print(f"{'response':>8} {'papers':>7} {'before ms':>10} {'after ms':>9} {'speedup':>8} {'bytes':>10}")
+    cases = (("search", _search_before, _search_after), ("papers", _papers_before, _papers_after))
+    for name, before, after in cases:
+        for count in _RESULT_COUNTS:
+            papers = _make_papers(count)
+            if before(papers) != after(papers):
+                raise RuntimeError(f"{name} responses differ between the two paths")
+            before_ms, size = _best_of(before, papers)
+            after_ms, _ = _best_of(after, papers)
+            print(f"{name:>8} {count:>7} {before_ms:>10.2f} {after_ms:>9.2f} {before_ms / after_ms:>7.1f}x {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Micro-benchmark suite for the hot paths, compared against a locally recorded baseline.
+
+Cases:
+
+- ``parse_search_response`` on generated feeds of 10, 100, and 2000 entries
+- the single-paper lookup: ``parse_search_response`` on a one-entry id_list
+  feed, kept under its old name ``parse_single_paper_response`` so that
+  baselines recorded before that parser was removed still compare
+- search route serialization: summaries plus the orjson envelope for 2000 papers
+- ``markdownify`` on a small and a large generated ar5iv page
+
+Each case is timed in 25 repeats of enough calls to last about 50 ms, and
+the median per-call time is compared with the baseline's median. Timings
+on a shared machine wander from run to run, so a case only counts as a
+regression when it is slower than the baseline by more than
+``--max-regression`` and by more than twice the spread (interquartile
+range over median) of either run. The comparison is a report: the run
+fails on a regression only with ``--fail-on-regression``.
+
+Baselines are machine-specific and are not committed. ``--update-baseline``
+records the current results as the baseline; record one on the machine
+that will run the comparison.
+
+Run with ``just bench`` or ``just bench-baseline``, or directly with
+``uv run python -m benchmarks.suite --baseline reports/benchmarks/baseline.json``.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+import markdownify
+
+from arxivsmart.api.models.search import SearchResponse
+from arxivsmart.api.routes_search import paper_summary
+from arxivsmart.api.utils import success_response
+from arxivsmart.arxiv.parser import parse_search_response
+from arxivsmart.arxiv.types import SearchResult
+from benchmarks.fixtures import make_ar5iv_page, make_feed, make_id_feed
+
+_REPEATS = 25
+_TARGET_REPEAT_SECONDS = 0.05
+_NOISE_FACTOR = 2.0
+
+
+@dataclass(frozen=True)
+class _Case:
+    """One named benchmark: a call taking no arguments, timed as a whole."""
+
+    name: str
+    call: Callable[[], object]
+
+
+def _serialize_search(result: SearchResult) -> bytes:
+    """Build the search route's response body from a parsed result."""
+    response = SearchResponse(
+        total_results=result.total_results,
+        start_index=result.start_index,
+        items_per_page=result.items_per_page,
+        papers=[paper_summary(paper) for paper in result.papers],
+    )
+    return success_response(status=200, data=response).body
+
+
+def _build_cases() -> list[_Case]:
+    """Generate the fixtures and bind each case to its input."""
+    cases = [_Case(f"parse_search_response[{count}]", partial(parse_search_response, make_feed(count))) for count in (10, 100, 2_000)]
+    cases.append(_Case("parse_single_paper_response", partial(parse_search_response, make_id_feed(["2301.00000v1"], 1, 0))))
+    cases.append(_Case("serialize_search_response[2000]", partial(_serialize_search, parse_search_response(make_feed(2_000)))))
+    for label, sections in (("small", 4), ("large", 40)):
+        cases.append(_Case(f"markdownify[{label}]", partial(markdownify.markdownify, make_ar5iv_page(sections))))
+    return cases
+
+
+def _time_case(case: _Case) -> dict[str, float]:
+    """Return the median, interquartile range, and fastest per-call time of the case in milliseconds."""
+    started = time.perf_counter()
+    case.call()
+    single = time.perf_counter() - started
+    loops = max(1, int(_TARGET_REPEAT_SECONDS / max(single, 1e-9)))
+
+    per_call: list[float] = []
+    for _ in range(_REPEATS):
+        # Like timeit: start each repeat from a clean heap and keep collections out of the timing.
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            for _ in range(loops):
+                case.call()
+            per_call.append((time.perf_counter() - started) / loops * 1000)
+        finally:
+            gc.enable()
+    lower_quartile, _, upper_quartile = statistics.quantiles(per_call, n=4)
+    return {
+        "median_ms": statistics.median(per_call),
+        "iqr_ms": upper_quartile - lower_quartile,
+        "min_ms": min(per_call),
+        "loops": loops,
+    }
+
+
+def _load_baseline(path: Path) -> dict[str, dict[str, float]]:
+    """Return the stored results per case, or no results when there is no baseline yet."""
+    if not path.exists():
+        return {}
+    document: dict[str, dict[str, dict[str, float]]] = json.loads(path.read_text(encoding="utf-8"))
+    return document["results"]
+
+
+def _write_results(path: Path, results: dict[str, dict[str, float]]) -> None:
+    """Write results with the interpreter and machine they were measured on."""
+    document = {
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def _spread(result: dict[str, float]) -> float:
+    """Return the interquartile range of a result relative to its median."""
+    return result["iqr_ms"] / result["median_ms"]
+
+
+def _report(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], max_regression: float) -> list[str]:
+    """Print one comparison row per case and return the names of the cases that regressed.
+
+    A case regresses when its median is slower than the baseline's by more
+    than the larger of ``max_regression`` and the noise allowance, twice the
+    spread of whichever run was noisier.
+    """
+    regressions: list[str] = []
+    print(f"{'case':<34} {'median ms':>10} {'baseline ms':>12} {'change':>8} {'allowed':>8}  status")
+    for name, result in results.items():
+        current = result["median_ms"]
+        if name not in baseline or "iqr_ms" not in baseline[name]:
+            print(f"{name:<34} {current:>10.3f} {'-':>12} {'-':>8} {'-':>8}  new")
+            continue
+        reference = baseline[name]["median_ms"]
+        change = current / reference - 1
+        allowed = max(max_regression, _NOISE_FACTOR * max(_spread(result), _spread(baseline[name])))
+        status = "ok"
+        if change > allowed:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change < -allowed:
+            status = "faster"
+        print(f"{name:<34} {current:>10.3f} {reference:>12.3f} {change:>+8.1%} {allowed:>8.0%}  {status}")
+    return regressions
+
+
+def main() -> int:
+    """Run every case, then record a new baseline or report regressions against the stored one."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, required=True, help="baseline results JSON file, recorded on this machine")
+    parser.add_argument("--output", type=Path, help="also write this run's results to this JSON file")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="smallest slowdown, as a fraction of the baseline, reported")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 when any case regressed")
+    parser.add_argument("--update-baseline", action="store_true", help="record this run as the new baseline")
+    args = parser.parse_args()
+
+    results = {case.name: _time_case(case) for case in _build_cases()}
+    if args.output is not None:
+        _write_results(args.output, results)
+
+    if args.update_baseline:
+        _write_results(args.baseline, results)
+        _report(results, {}, args.max_regression)
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+
+    baseline = _load_baseline(args.baseline)
+    if not baseline:
+        print(f"no baseline at {args.baseline}; record one on this machine with --update-baseline\n")
+    regressions = _report(results, baseline, args.max_regression)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than the baseline beyond run-to-run noise: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,34 @@ import { z } from "zod";
 
 const REST_BASE = process.env.REST_BASE ?? "http://127.0.0.1:7171";
 const HEALTH_TIMEOUT_MS = 3000;
+// Tool calls come from a user waiting on the answer, so they overtake bulk
+// scripts queued on the proxy's rate limiter.
+const PRIORITY_HEADERS = { "X-Request-Priority": "interactive" };
 
 const server = new McpServer({
   name: "arxiv-smart-mcp",
   version: "0.1.0",
 });
 
+// The proxy breaks each response's time down into phases (rate-limiter
+// wait, upstream request, parsing or markdown conversion, serialization)
+// in its Server-Timing header. Tool results carry them in _meta as
+// milliseconds per phase, so a slow call can be attributed after the fact.
+function serverTiming(response: Response): { serverTiming: Record<string, number> } {
+  const timings: Record<string, number> = {};
+  const header = response.headers.get("server-timing");
+  if (header !== null) {
+    for (const entry of header.split(",")) {
+      const [name, ...params] = entry.trim().split(";");
+      const duration = params.find((param) => param.startsWith("dur="));
+      if (name && duration !== undefined) {
+        timings[name] = Number(duration.slice("dur=".length));
+      }
+    }
+  }
+  return { serverTiming: timings };
+}
+
 async function checkHealth(): Promise<boolean> {
   try {
     const response = await fetch(`${REST_BASE}/v1/health`, {
@@ -41,11 +63,11 @@ server.tool(
     try {
       const response = await fetch(`${REST_BASE}/v1/search`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...PRIORITY_HEADERS },
         body: JSON.stringify({ query, start: 0, max_results, sort_by, sort_order }),
       });
       const data = await response.json();
-      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }], _meta: serverTiming(response) };
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
       return { content: [{ type: "text", text: `Error: ${message}` }], isError: true };
@@ -65,9 +87,39 @@ server.tool(
     }
 
     try {
-      const response = await fetch(`${REST_BASE}/v1/paper/${arxiv_id}`);
+      const response = await fetch(`${REST_BASE}/v1/paper/${arxiv_id}`, { headers: PRIORITY_HEADERS });
+      const data = await response.json();
+      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }], _meta: serverTiming(response) };
+    } catch (error) {
+      const message = error instanceof Error ? error.message : String(error);
+      return { content: [{ type: "text", text: `Error: ${message}` }], isError: true };
+    }
+  },
+);
+
+server.tool(
+  "get_papers",
+  "Get full metadata for many arXiv papers in one call (batched upstream, missing IDs are marked not found)",
+  {
+    arxiv_ids: z
+      .array(z.string())
+      .min(1)
+      .max(2000)
+      .describe("arXiv paper IDs (e.g. ['2301.00001v1', '2302.00002'])"),
+  },
+  async ({ arxiv_ids }) => {
+    if (!(await checkHealth())) {
+      return { content: [{ type: "text", text: "arXiv proxy service is currently offline." }], isError: true };
+    }
+
+    try {
+      const response = await fetch(`${REST_BASE}/v1/papers`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json", ...PRIORITY_HEADERS },
+        body: JSON.stringify({ arxiv_ids }),
+      });
       const data = await response.json();
-      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }], _meta: serverTiming(response) };
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
       return { content: [{ type: "text", text: `Error: ${message}` }], isError: true };
@@ -87,13 +139,17 @@ server.tool(
     }
 
     try {
-      const response = await fetch(`${REST_BASE}/v1/paper/${arxiv_id}/pdf`);
+      const response = await fetch(`${REST_BASE}/v1/paper/${arxiv_id}/pdf`, { headers: PRIORITY_HEADERS });
       if (!response.ok) {
-        return { content: [{ type: "text", text: `PDF download failed: ${response.status}` }], isError: true };
+        return {
+          content: [{ type: "text", text: `PDF download failed: ${response.status}` }],
+          isError: true,
+          _meta: serverTiming(response),
+        };
       }
       const buffer = await response.arrayBuffer();
       const base64 = Buffer.from(buffer).toString("base64");
-      return { content: [{ type: "text", text: base64 }] };
+      return { content: [{ type: "text", text: base64 }], _meta: serverTiming(response) };
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
       return { content: [{ type: "text", text: `Error: ${message}` }], isError: true };
@@ -115,7 +171,7 @@ server.tool(
     try {
       const response = await fetch(`${REST_BASE}/v1/paper/${arxiv_id}/html`);
       const data = await response.json();
-      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }], _meta: serverTiming(response) };
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
       return { content: [{ type: "text", text: `Error: ${message}` }], isError: true };
@@ -137,7 +193,7 @@ server.tool(
     try {
       const response = await fetch(`${REST_BASE}/v1/paper/${arxiv_id}/markdown`);
       const data = await response.json();
-      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }] };
+      return { content: [{ type: "text", text: JSON.stringify(data, null, 2) }], _meta: serverTiming(response) };
     } catch (error) {
       const message = error instanceof Error ? error.message : String(error);
       return { content: [{ type: "text", text: `Error: ${message}` }], isError: true };
@@ -1,22 +1,33 @@
 """FastAPI application factory."""
 
 import logging
+import tracemalloc
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from arxivsmart.api.metrics import RequestMetrics, RequestMetricsMiddleware
 from arxivsmart.api.routes_info import router as info_router
 from arxivsmart.api.routes_paper import router as paper_router
 from arxivsmart.api.routes_search import router as search_router
+from arxivsmart.api.server_timing import ServerTimingMiddleware
 from arxivsmart.api.utils import error_response
 from arxivsmart.arxiv.client import ArxivClient
 from arxivsmart.arxiv.rate_limiter import RateLimiter
+from arxivsmart.cache.blob_store import BlobStore
+from arxivsmart.cache.metadata import MetadataCache
+from arxivsmart.cache.search import SearchCache
 from arxivsmart.config import Config
+from arxivsmart.profiler import SamplingProfiler
 
 logger = logging.getLogger(__name__)
 
+# 200 samples per second: fine enough for request-scale hot spots, cheap enough to leave running for a minute.
+_PROFILER_INTERVAL_SECONDS = 0.005
+
 
 async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Wrap uncaught errors in the standard error envelope."""
@@ -27,10 +38,28 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """Manage application lifecycle — close HTTP connection on shutdown."""
-    yield
+    """Manage application lifecycle — warm up upstream connections on startup, close them and the caches on shutdown.
+
+    Memory tracing for /v1/debug/memory runs while the app is up when
+    ``debug.tracemalloc_enabled`` is set.
+    """
     arxiv_client: ArxivClient = app.state.arxiv_client
-    arxiv_client.close()
+    config: Config = app.state.config
+    trace_memory = config.get_debug_config().tracemalloc_enabled and not tracemalloc.is_tracing()
+    if trace_memory:
+        tracemalloc.start()
+    if config.get_arxiv_config().warm_up_connections:
+        await arxiv_client.warm_up()
+    yield
+    if trace_memory:
+        tracemalloc.stop()
+    await arxiv_client.close()
+    metadata_cache: MetadataCache = app.state.metadata_cache
+    metadata_cache.close()
+    pdf_store: BlobStore = app.state.pdf_store
+    pdf_store.close()
+    html_store: BlobStore = app.state.html_store
+    html_store.close()
 
 
 def create_app(config: Config) -> FastAPI:
@@ -38,20 +67,69 @@ def create_app(config: Config) -> FastAPI:
     config.validate_startup()
 
     arxiv_config = config.get_arxiv_config()
+    cache_config = config.get_cache_config()
+    cache_directory = Path(cache_config.directory)
 
-    api_rate_limiter = RateLimiter(min_interval_seconds=arxiv_config.rate_limit_seconds)
-    pdf_rate_limiter = RateLimiter(min_interval_seconds=arxiv_config.rate_limit_seconds)
+    api_rate_limiter = RateLimiter(
+        min_interval_seconds=arxiv_config.rate_limit_seconds,
+        max_interval_seconds=arxiv_config.rate_limit_max_seconds,
+        backoff_factor=arxiv_config.rate_limit_backoff_factor,
+        recovery_successes=arxiv_config.rate_limit_recovery_successes,
+        max_queue_depth=arxiv_config.api_max_queue_depth,
+    )
+    pdf_rate_limiter = RateLimiter(
+        min_interval_seconds=arxiv_config.rate_limit_seconds,
+        max_interval_seconds=arxiv_config.rate_limit_max_seconds,
+        backoff_factor=arxiv_config.rate_limit_backoff_factor,
+        recovery_successes=arxiv_config.rate_limit_recovery_successes,
+        max_queue_depth=arxiv_config.pdf_max_queue_depth,
+    )
+    metadata_cache = MetadataCache(
+        database_path=cache_directory / "metadata.sqlite3",
+        unversioned_ttl_seconds=cache_config.metadata_unversioned_ttl_seconds,
+    )
+    pdf_store = BlobStore(
+        directory=cache_directory / "pdf",
+        suffix=".pdf",
+        max_bytes=cache_config.pdf_max_bytes,
+        unversioned_ttl_seconds=cache_config.pdf_unversioned_ttl_seconds,
+    )
+    html_store = BlobStore(
+        directory=cache_directory / "html",
+        suffix=".html",
+        max_bytes=cache_config.html_max_bytes,
+        unversioned_ttl_seconds=cache_config.html_unversioned_ttl_seconds,
+    )
+    search_cache = SearchCache(
+        soft_ttl_seconds=cache_config.search_soft_ttl_seconds,
+        hard_ttl_seconds=cache_config.search_hard_ttl_seconds,
+        max_entries=cache_config.search_max_entries,
+    )
     arxiv_client = ArxivClient(
         config=arxiv_config,
         api_rate_limiter=api_rate_limiter,
         pdf_rate_limiter=pdf_rate_limiter,
+        metadata_cache=metadata_cache,
+        pdf_store=pdf_store,
+        html_store=html_store,
+        search_cache=search_cache,
+        search_overfetch_window=cache_config.search_overfetch_window,
     )
 
+    request_metrics = RequestMetrics()
+
     app = FastAPI(lifespan=lifespan)
     app.state.config = config
     app.state.arxiv_client = arxiv_client
+    app.state.metadata_cache = metadata_cache
+    app.state.pdf_store = pdf_store
+    app.state.html_store = html_store
+    app.state.request_metrics = request_metrics
+    app.state.profiler = SamplingProfiler(interval_seconds=_PROFILER_INTERVAL_SECONDS)
     app.state.app_status = "healthy"
     app.add_exception_handler(Exception, unhandled_exception_handler)
+    app.add_middleware(ServerTimingMiddleware)
+    app.add_middleware(RequestMetricsMiddleware, metrics=request_metrics)
 
     app.include_router(info_router)
     app.include_router(search_router)
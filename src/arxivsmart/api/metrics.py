@@ -0,0 +1,262 @@
+"""Request metrics middleware and the Prometheus exposition served at /v1/metrics."""
+
+import time
+from collections import Counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from arxivsmart.arxiv.client import ArxivClient
+from arxivsmart.arxiv.rate_limiter import PRIORITIES
+from arxivsmart.metrics import LATENCY_BUCKETS_SECONDS, Exposition, Histogram, Labels
+
+_UNMATCHED_ROUTE = "unmatched"
+
+# Cache stats keys from ArxivClient.stats(), by the label they are exported under.
+_CACHES = {"metadata": "metadata_cache", "search": "search_cache", "pdf": "pdf_store", "html": "html_store"}
+
+
+class RequestMetrics:
+    """Request counts, latency, and response bytes per route.
+
+    Routes are recorded by their path template, such as
+    ``/v1/paper/{arxiv_id}``, so label values stay bounded; requests that
+    match no route share the ``unmatched`` label.
+    """
+
+    def __init__(self) -> None:
+        """Start with no recorded requests."""
+        self._durations: dict[tuple[str, str], Histogram] = {}
+        self._responses: Counter[tuple[str, str, str]] = Counter()
+        self._response_bytes: Counter[tuple[str, str]] = Counter()
+
+    def record(self, method: str, route: str, status: str, seconds: float, body_bytes: int) -> None:
+        """Record one finished request."""
+        key = (method, route)
+        if key not in self._durations:
+            self._durations[key] = Histogram(LATENCY_BUCKETS_SECONDS)
+        self._durations[key].observe(seconds)
+        self._responses[(method, route, status)] += 1
+        self._response_bytes[key] += body_bytes
+
+    def write(self, exposition: Exposition) -> None:
+        """Add the request families to an exposition."""
+        exposition.counter(
+            "arxivsmart_http_requests_total",
+            "Requests served, by method, route, and response status.",
+            [({"method": method, "route": route, "status": status}, count) for (method, route, status), count in self._responses.items()],
+        )
+        exposition.histogram(
+            "arxivsmart_http_request_duration_seconds",
+            "Time from receiving a request until the last byte of its response was sent.",
+            [({"method": method, "route": route}, histogram) for (method, route), histogram in self._durations.items()],
+        )
+        exposition.counter(
+            "arxivsmart_http_response_bytes_total",
+            "Response body bytes sent to clients.",
+            [({"method": method, "route": route}, count) for (method, route), count in self._response_bytes.items()],
+        )
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware that records every HTTP request in a RequestMetrics.
+
+    Requests are timed until their last body chunk is sent, so streamed
+    search results and PDFs count their full transfer time.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics) -> None:
+        """Wrap the app and record into the given metrics."""
+        self._app = app
+        self._metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Pass the request through, watching the response messages for its status and body size."""
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        started = time.monotonic()
+        # Stays 500 when the app raises before starting a response; the error middleware outside answers 500.
+        status = "500"
+        body_bytes = 0
+
+        async def send_and_measure(message: Message) -> None:
+            nonlocal status, body_bytes
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            elif message["type"] == "http.response.body" and "body" in message:
+                body_bytes += len(message["body"])
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_and_measure)
+        finally:
+            self._metrics.record(scope["method"], _route_template(scope), status, time.monotonic() - started, body_bytes)
+
+
+def _route_template(scope: Scope) -> str:
+    """Return the path template of the route that handled the request."""
+    if "route" not in scope:
+        return _UNMATCHED_ROUTE
+    path: str = scope["route"].path
+    return path
+
+
+def render_metrics(request_metrics: RequestMetrics, arxiv_client: ArxivClient) -> str:
+    """Render request, rate-limiter, upstream, worker, body, and cache metrics as exposition text."""
+    exposition = Exposition()
+    request_metrics.write(exposition)
+    _write_rate_limiters(exposition, arxiv_client)
+    _write_upstreams(exposition, arxiv_client)
+    _write_bodies(exposition, arxiv_client)
+    _write_caches(exposition, arxiv_client)
+    return exposition.render()
+
+
+def _write_rate_limiters(exposition: Exposition, arxiv_client: ArxivClient) -> None:
+    """Add queue depth, wait time, grants, rejections, throttling, and pacing per rate limiter."""
+    limiters = arxiv_client.rate_limiters()
+    stats = {name: limiter.stats() for name, limiter in limiters.items()}
+    exposition.gauge(
+        "arxivsmart_rate_limiter_queue_depth",
+        "Callers waiting for a rate-limit slot, by priority class.",
+        [
+            ({"limiter": name, "priority": priority}, values[f"{priority}_waiting"])
+            for name, values in stats.items()
+            for priority in PRIORITIES
+        ],
+    )
+    exposition.histogram(
+        "arxivsmart_rate_limiter_wait_seconds",
+        "Time from asking for a rate-limit slot until its window opened.",
+        [({"limiter": name}, limiter.wait_histogram()) for name, limiter in limiters.items()],
+    )
+    exposition.counter(
+        "arxivsmart_rate_limiter_granted_total",
+        "Rate-limit slots granted, by priority class.",
+        [
+            ({"limiter": name, "priority": priority}, values[f"{priority}_granted"])
+            for name, values in stats.items()
+            for priority in PRIORITIES
+        ],
+    )
+    exposition.counter(
+        "arxivsmart_rate_limiter_rejected_total",
+        "Callers turned away with a 429 because the queue was full, by priority class.",
+        [
+            ({"limiter": name, "priority": priority}, values[f"{priority}_rejected"])
+            for name, values in stats.items()
+            for priority in PRIORITIES
+        ],
+    )
+    exposition.counter(
+        "arxivsmart_rate_limiter_throttled_total",
+        "Throttling responses (429, 503) received from upstream.",
+        [({"limiter": name}, values["throttled"]) for name, values in stats.items()],
+    )
+    exposition.gauge(
+        "arxivsmart_rate_limiter_interval_seconds",
+        "Current adaptive interval between requests.",
+        [({"limiter": name}, values["interval_seconds"]) for name, values in stats.items()],
+    )
+
+
+def _write_upstreams(exposition: Exposition, arxiv_client: ArxivClient) -> None:
+    """Add response statuses and times, bytes, concurrency, and worker task times per upstream host."""
+    pools = arxiv_client.upstream_pools()
+    stats = {name: pool.stats() for name, pool in pools.items()}
+    exposition.counter(
+        "arxivsmart_upstream_responses_total",
+        "Upstream responses by status code; requests that failed without a response count as error.",
+        [
+            ({"upstream": name, "status": status}, count)
+            for name, pool in pools.items()
+            for status, count in pool.response_statuses().items()
+        ],
+    )
+    exposition.histogram(
+        "arxivsmart_upstream_response_seconds",
+        "Upstream response time, to the headers for streamed bodies and to the full body otherwise.",
+        [({"upstream": name}, pool.response_histogram()) for name, pool in pools.items()],
+    )
+    exposition.counter(
+        "arxivsmart_upstream_received_bytes_total",
+        "Response body bytes received from upstream.",
+        [({"upstream": name}, values["bytes_received"]) for name, values in stats.items()],
+    )
+    exposition.gauge(
+        "arxivsmart_upstream_in_flight",
+        "Upstream requests currently holding a pool permit.",
+        [({"upstream": name}, values["in_flight"]) for name, values in stats.items()],
+    )
+    exposition.gauge(
+        "arxivsmart_upstream_waiting",
+        "Requests waiting for an upstream pool permit.",
+        [({"upstream": name}, values["waiting"]) for name, values in stats.items()],
+    )
+    worker_samples: list[tuple[Labels, Histogram]] = []
+    for name, pool in pools.items():
+        worker_samples.extend(({"upstream": name, "task": task}, histogram) for task, histogram in pool.task_histograms().items())
+    exposition.histogram(
+        "arxivsmart_worker_task_seconds",
+        "Time spent on a pool's worker threads: feed parsing, markdown conversion, and cache reads and writes.",
+        worker_samples,
+    )
+
+
+def _write_bodies(exposition: Exposition, arxiv_client: ArxivClient) -> None:
+    """Add the bytes held by in-flight upstream bodies now and at their peak, per kind."""
+    ledger = arxiv_client.body_ledger()
+    exposition.gauge(
+        "arxivsmart_body_bytes",
+        "Bytes held by in-flight upstream bodies and the HTML or markdown text derived from them.",
+        [({"kind": kind}, size) for kind, size in ledger.held_bytes().items()],
+    )
+    exposition.gauge(
+        "arxivsmart_body_peak_bytes",
+        "Most bytes held at once by in-flight bodies since startup.",
+        [({"kind": kind}, size) for kind, size in ledger.peak_bytes().items()],
+    )
+
+
+def _write_caches(exposition: Exposition, arxiv_client: ArxivClient) -> None:
+    """Add hits, misses, hit ratio, and size per cache; stale search hits count as hits."""
+    client_stats = arxiv_client.stats()
+    stats = {name: client_stats[key] for name, key in _CACHES.items()}
+    hits = {name: values["hits"] + _stale_hits(values) for name, values in stats.items()}
+    exposition.counter(
+        "arxivsmart_cache_hits_total",
+        "Lookups answered from the cache.",
+        [({"cache": name}, count) for name, count in hits.items()],
+    )
+    exposition.counter(
+        "arxivsmart_cache_misses_total",
+        "Lookups the cache could not answer.",
+        [({"cache": name}, values["misses"]) for name, values in stats.items()],
+    )
+    exposition.gauge(
+        "arxivsmart_cache_hit_ratio",
+        "Share of lookups answered from the cache since startup; absent until the first lookup.",
+        [
+            ({"cache": name}, hits[name] / (hits[name] + values["misses"]))
+            for name, values in stats.items()
+            if hits[name] + values["misses"] > 0
+        ],
+    )
+    exposition.gauge(
+        "arxivsmart_cache_entries",
+        "Entries currently stored.",
+        [({"cache": name}, values["entries"]) for name, values in stats.items()],
+    )
+    exposition.gauge(
+        "arxivsmart_cache_bytes",
+        "Bytes currently stored on disk.",
+        [({"cache": name}, values["bytes"]) for name, values in stats.items() if "bytes" in values],
+    )
+
+
+def _stale_hits(values: dict[str, int | float]) -> int | float:
+    """Return the stale hits a cache reports, which only the search cache tracks."""
+    if "stale_hits" not in values:
+        return 0
+    return values["stale_hits"]
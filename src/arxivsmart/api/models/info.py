@@ -2,7 +2,7 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class HealthResponse(BaseModel):
@@ -19,6 +19,85 @@ class InfoResponse(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     config: dict[str, object]
+    stats: dict[str, dict[str, int | float]]
+
+
+class AllocatorResponse(BaseModel):
+    """Traced memory held by one source line."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    location: str
+    size_bytes: int
+    blocks: int
+
+
+class TracedMemoryResponse(BaseModel):
+    """Traced memory totals and top allocators."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    traced_bytes: int
+    peak_traced_bytes: int
+    top_allocators: list[AllocatorResponse]
+
+
+class MemoryResponse(BaseModel):
+    """Memory report payload."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    rss_bytes: int | None
+    peak_rss_bytes: int
+    body_bytes: dict[str, int]
+    body_peak_bytes: dict[str, int]
+    cache_bytes: dict[str, int]
+    tracemalloc: TracedMemoryResponse | None
+
+
+class ProfileRequest(BaseModel):
+    """Profile request payload."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    seconds: float
+    include_idle: bool
+
+    @field_validator("seconds")
+    @classmethod
+    def validate_seconds(cls, value: float) -> float:
+        """Ensure the recording duration is positive."""
+        if value <= 0:
+            raise ValueError("seconds must be greater than 0")
+        return value
+
+
+class QueuedCallerResponse(BaseModel):
+    """A caller waiting for a rate-limit slot."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    priority: Literal["interactive", "normal", "background"]
+    waited_seconds: float
+    eta_seconds: float
+
+
+class LimiterQueueResponse(BaseModel):
+    """One rate limiter's queue, in the order its callers will get the slot."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_queue_depth: int
+    interval_seconds: float
+    waiters: list[QueuedCallerResponse]
+
+
+class QueueResponse(BaseModel):
+    """Queue response payload."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    limiters: dict[str, LimiterQueueResponse]
 
 
 class ShutdownResponse(BaseModel):
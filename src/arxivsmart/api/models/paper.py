@@ -1,44 +1,54 @@
 """Paper endpoint API models."""
 
-from typing import Literal
+from typing import Literal, TypedDict
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
+from arxivsmart.arxiv.types import Paper
 
-class AuthorDetail(BaseModel):
-    """Detailed author information."""
 
-    model_config = ConfigDict(extra="forbid")
+class PaperContentResponse(TypedDict):
+    """Paper content response for HTML or markdown."""
 
-    name: str
-    affiliation: str
+    arxiv_id: str
+    content: str
+    content_type: Literal["markdown", "html"]
 
 
-class PaperDetailResponse(BaseModel):
-    """Full paper metadata response."""
+class PapersRequest(BaseModel):
+    """Batch paper metadata request payload."""
 
     model_config = ConfigDict(extra="forbid")
 
-    arxiv_id: str
-    title: str
-    summary: str
-    authors: list[AuthorDetail]
-    categories: list[str]
-    primary_category: str
-    published: str
-    updated: str
-    pdf_url: str
-    abstract_url: str
-    doi: str
-    comment: str
-    journal_ref: str
-
-
-class PaperContentResponse(BaseModel):
-    """Paper content response for HTML or markdown."""
+    arxiv_ids: list[str]
 
-    model_config = ConfigDict(extra="forbid")
+    @field_validator("arxiv_ids")
+    @classmethod
+    def validate_arxiv_ids(cls, value: list[str]) -> list[str]:
+        """Ensure the ID list is non-empty, bounded, and free of blank IDs."""
+        if len(value) < 1:
+            raise ValueError("arxiv_ids must contain at least one ID")
+        if len(value) > 2000:
+            raise ValueError("arxiv_ids must contain at most 2000 IDs")
+        for arxiv_id in value:
+            if arxiv_id.strip() == "":
+                raise ValueError("arxiv_ids must not contain empty IDs")
+        return value
+
+
+class PaperLookupResult(TypedDict):
+    """One entry of a batch lookup: the paper, or a not-found marker.
+
+    The paper is the domain object itself; the response encoder writes its
+    fields, including nested authors, in declaration order.
+    """
 
     arxiv_id: str
-    content: str
-    content_type: Literal["markdown", "html"]
+    found: bool
+    paper: Paper | None
+
+
+class PapersResponse(TypedDict):
+    """Batch paper metadata response in request order."""
+
+    papers: list[PaperLookupResult]
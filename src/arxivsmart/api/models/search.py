@@ -1,6 +1,6 @@
 """Search endpoint API models."""
 
-from typing import Literal
+from typing import Literal, TypedDict
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
@@ -43,11 +43,9 @@ class SearchRequest(BaseModel):
         return value
 
 
-class PaperSummary(BaseModel):
+class PaperSummary(TypedDict):
     """Abbreviated paper metadata for search results."""
 
-    model_config = ConfigDict(extra="forbid")
-
     arxiv_id: str
     title: str
     summary: str
@@ -58,10 +56,16 @@ class PaperSummary(BaseModel):
     pdf_url: str
 
 
-class SearchResponse(BaseModel):
-    """Search response payload."""
+class SearchFeedSummary(TypedDict):
+    """Result counts sent as the first line of a streamed search."""
 
-    model_config = ConfigDict(extra="forbid")
+    total_results: int
+    start_index: int
+    items_per_page: int
+
+
+class SearchResponse(TypedDict):
+    """Search response payload."""
 
     total_results: int
     start_index: int
@@ -1,16 +1,42 @@
-"""Administrative routes for health, info, and shutdown."""
+"""Administrative routes for health, info, metrics, queues, memory, profiling, and shutdown."""
 
+import asyncio
 import os
 import signal
 
 from fastapi import APIRouter, BackgroundTasks, Request
-from fastapi.responses import JSONResponse
-
-from arxivsmart.api.models.info import HealthResponse, InfoResponse, ShutdownResponse
-from arxivsmart.api.utils import ensure_healthy, get_config, success_response
+from fastapi.responses import JSONResponse, Response
+
+from arxivsmart.api.metrics import render_metrics
+from arxivsmart.api.models.info import (
+    AllocatorResponse,
+    HealthResponse,
+    InfoResponse,
+    LimiterQueueResponse,
+    MemoryResponse,
+    ProfileRequest,
+    QueuedCallerResponse,
+    QueueResponse,
+    ShutdownResponse,
+    TracedMemoryResponse,
+)
+from arxivsmart.api.utils import (
+    ensure_healthy,
+    error_response,
+    get_arxiv_client,
+    get_config,
+    get_profiler,
+    get_request_metrics,
+    success_response,
+)
+from arxivsmart.memory import TracedMemory, peak_resident_set_bytes, resident_set_bytes, traced_memory
+from arxivsmart.profiler import ProfilerBusyError
 
 router = APIRouter(prefix="/v1")
 
+_EXPOSITION_MEDIA_TYPE = "text/plain; version=0.0.4"
+_PROFILE_FILENAME = "arxivsmart.collapsed"
+
 
 def _shutdown_process_tree(reload_enabled: bool) -> None:
     """Terminate current process and uvicorn reload parent when present."""
@@ -36,12 +62,116 @@ async def health(request: Request) -> JSONResponse:
 
 @router.get("/info")
 async def info(request: Request) -> JSONResponse:
-    """Return full service configuration."""
+    """Return full service configuration and cache statistics."""
+    config = get_config(request)
+    arxiv_client = get_arxiv_client(request)
+    response = InfoResponse(config=config.model_dump(), stats=arxiv_client.stats())
+    return success_response(status=200, data=response.model_dump())
+
+
+@router.get("/metrics")
+async def metrics(request: Request) -> Response:
+    """Return request, rate-limiter, upstream, and cache metrics in the Prometheus text exposition format."""
+    body = render_metrics(get_request_metrics(request), get_arxiv_client(request))
+    return Response(content=body, media_type=_EXPOSITION_MEDIA_TYPE)
+
+
+@router.get("/queue")
+async def queue(request: Request) -> JSONResponse:
+    """Return each rate limiter's waiting callers in the order they will get the slot, with estimated waits."""
+    arxiv_client = get_arxiv_client(request)
+    limiters: dict[str, LimiterQueueResponse] = {}
+    for name, limiter in arxiv_client.rate_limiters().items():
+        stats = limiter.stats()
+        limiters[name] = LimiterQueueResponse(
+            max_queue_depth=int(stats["max_queue_depth"]),
+            interval_seconds=stats["interval_seconds"],
+            waiters=[
+                QueuedCallerResponse(priority=caller.priority, waited_seconds=caller.waited_seconds, eta_seconds=caller.eta_seconds)
+                for caller in limiter.waiters()
+            ],
+        )
+    response = QueueResponse(limiters=limiters)
+    return success_response(status=200, data=response.model_dump())
+
+
+@router.get("/debug/memory")
+async def memory(request: Request) -> JSONResponse:
+    """Return the process RSS, bytes held by in-flight upstream bodies and in-memory caches, and top allocators.
+
+    Cache sizes and the tracemalloc snapshot are measured when requested, on
+    a worker thread. The ``tracemalloc`` section is null unless tracing is
+    on, via ``debug.tracemalloc_enabled`` or ``PYTHONTRACEMALLOC``.
+    """
     config = get_config(request)
-    response = InfoResponse(config=config.model_dump())
+    arxiv_client = get_arxiv_client(request)
+    ledger = arxiv_client.body_ledger()
+    response = MemoryResponse(
+        rss_bytes=resident_set_bytes(),
+        peak_rss_bytes=peak_resident_set_bytes(),
+        body_bytes=ledger.held_bytes(),
+        body_peak_bytes=ledger.peak_bytes(),
+        cache_bytes=await asyncio.to_thread(arxiv_client.cache_memory_bytes),
+        tracemalloc=_traced_memory_response(
+            await asyncio.to_thread(traced_memory, config.get_debug_config().tracemalloc_top_allocators),
+        ),
+    )
     return success_response(status=200, data=response.model_dump())
 
 
+def _traced_memory_response(traced: TracedMemory | None) -> TracedMemoryResponse | None:
+    """Build the tracemalloc section of the memory report, or None when not tracing."""
+    if traced is None:
+        return None
+    return TracedMemoryResponse(
+        traced_bytes=traced.traced_bytes,
+        peak_traced_bytes=traced.peak_traced_bytes,
+        top_allocators=[
+            AllocatorResponse(location=allocator.location, size_bytes=allocator.size_bytes, blocks=allocator.blocks)
+            for allocator in traced.top_allocators
+        ],
+    )
+
+
+@router.post("/profile", response_model=None)
+async def profile(request: Request) -> JSONResponse | Response:
+    """Sample every thread's stack for the requested seconds and return them as collapsed stacks.
+
+    The output is one ``thread;outer;...;inner count`` line per distinct
+    stack, ready for flamegraph.pl or speedscope. The endpoint answers 403
+    unless ``debug.profiler_enabled`` is set, and 409 while another profile
+    is still recording.
+    """
+    debug_config = get_config(request).get_debug_config()
+    if not debug_config.profiler_enabled:
+        return error_response(status=403, message="profiler is disabled; set debug.profiler_enabled to enable it")
+
+    try:
+        body: object = await request.json()
+        profile_request = ProfileRequest.model_validate(body)
+    except Exception as exc:
+        return error_response(status=400, message=str(exc))
+
+    if profile_request.seconds > debug_config.profiler_max_seconds:
+        return error_response(
+            status=400,
+            message=f"seconds must not exceed debug.profiler_max_seconds ({debug_config.profiler_max_seconds})",
+        )
+
+    # Sampling runs off the event loop so the loop keeps serving requests while it is being profiled.
+    profiler = get_profiler(request)
+    try:
+        stacks = await asyncio.to_thread(profiler.profile, profile_request.seconds, profile_request.include_idle)
+    except ProfilerBusyError as exc:
+        return error_response(status=409, message=str(exc))
+
+    return Response(
+        content=stacks,
+        media_type="text/plain",
+        headers={"Content-Disposition": f'attachment; filename="{_PROFILE_FILENAME}"'},
+    )
+
+
 @router.post("/shutdown")
 async def shutdown(request: Request, background_tasks: BackgroundTasks) -> JSONResponse:
     """Initiate graceful shutdown and reject subsequent guarded requests."""
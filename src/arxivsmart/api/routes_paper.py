@@ -1,31 +1,52 @@
 """Paper routes for arXiv paper detail and content retrieval."""
 
-import asyncio
+import sys
+from pathlib import Path
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse, Response
-
-from arxivsmart.api.models.paper import AuthorDetail, PaperContentResponse, PaperDetailResponse
-from arxivsmart.api.utils import ensure_healthy, error_response, get_arxiv_client, success_response
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+
+from arxivsmart.api.models.paper import PaperContentResponse, PaperLookupResult, PapersRequest, PapersResponse
+from arxivsmart.api.utils import (
+    ensure_healthy,
+    error_response,
+    get_arxiv_client,
+    get_request_priority,
+    queue_full_response,
+    success_response,
+)
+from arxivsmart.arxiv.client import InvalidIdError
+from arxivsmart.arxiv.rate_limiter import RateLimiterFullError
 
 router = APIRouter(prefix="/v1")
 
 
 @router.get("/paper/{arxiv_id}/pdf", response_model=None)
-async def get_paper_pdf(request: Request, arxiv_id: str) -> JSONResponse | Response:
-    """Download PDF for a paper by arXiv ID."""
+async def get_paper_pdf(request: Request, arxiv_id: str) -> JSONResponse | FileResponse | StreamingResponse:
+    """Serve the PDF for a paper from the local PDF store, or stream it through from arXiv on a miss."""
     guard_response = ensure_healthy(request)
     if guard_response is not None:
         return guard_response
 
+    try:
+        priority = get_request_priority(request)
+    except ValueError as exc:
+        return error_response(status=400, message=str(exc))
+
     arxiv_client = get_arxiv_client(request)
 
     try:
-        pdf_bytes = await asyncio.to_thread(arxiv_client.download_pdf, arxiv_id)
+        pdf = await arxiv_client.download_pdf(arxiv_id, priority)
+    except RateLimiterFullError as exc:
+        return queue_full_response(exc)
     except Exception as exc:
         return error_response(status=502, message=str(exc))
 
-    return Response(content=pdf_bytes, media_type="application/pdf")
+    if isinstance(pdf, Path):
+        return FileResponse(path=pdf, media_type="application/pdf")
+
+    return StreamingResponse(content=pdf, media_type="application/pdf", background=BackgroundTask(pdf.aclose))
 
 
 @router.get("/paper/{arxiv_id}/html")
@@ -38,7 +59,7 @@ async def get_paper_html(request: Request, arxiv_id: str) -> JSONResponse:
     arxiv_client = get_arxiv_client(request)
 
     try:
-        html_content = await asyncio.to_thread(arxiv_client.fetch_html, arxiv_id)
+        html_content = await arxiv_client.fetch_html(arxiv_id)
     except Exception as exc:
         return error_response(status=502, message=str(exc))
 
@@ -48,7 +69,8 @@ async def get_paper_html(request: Request, arxiv_id: str) -> JSONResponse:
         content_type="html",
     )
 
-    return success_response(status=200, data=response.model_dump())
+    with arxiv_client.body_ledger().hold("html", sys.getsizeof(html_content)):
+        return success_response(status=200, data=response)
 
 
 @router.get("/paper/{arxiv_id}/markdown")
@@ -61,7 +83,7 @@ async def get_paper_markdown(request: Request, arxiv_id: str) -> JSONResponse:
     arxiv_client = get_arxiv_client(request)
 
     try:
-        markdown_content = await asyncio.to_thread(arxiv_client.fetch_markdown, arxiv_id)
+        markdown_content = await arxiv_client.fetch_markdown(arxiv_id)
     except Exception as exc:
         return error_response(status=502, message=str(exc))
 
@@ -71,7 +93,8 @@ async def get_paper_markdown(request: Request, arxiv_id: str) -> JSONResponse:
         content_type="markdown",
     )
 
-    return success_response(status=200, data=response.model_dump())
+    with arxiv_client.body_ledger().hold("markdown", sys.getsizeof(markdown_content)):
+        return success_response(status=200, data=response)
 
 
 @router.get("/paper/{arxiv_id}")
@@ -81,29 +104,52 @@ async def get_paper(request: Request, arxiv_id: str) -> JSONResponse:
     if guard_response is not None:
         return guard_response
 
+    try:
+        priority = get_request_priority(request)
+    except ValueError as exc:
+        return error_response(status=400, message=str(exc))
+
     arxiv_client = get_arxiv_client(request)
 
     try:
-        paper = await asyncio.to_thread(arxiv_client.get_paper, arxiv_id)
+        paper = await arxiv_client.get_paper(arxiv_id, priority)
+    except InvalidIdError as exc:
+        return error_response(status=400, message=str(exc))
+    except RateLimiterFullError as exc:
+        return queue_full_response(exc)
     except Exception as exc:
         return error_response(status=502, message=str(exc))
 
-    authors = [AuthorDetail(name=a.name, affiliation=a.affiliation) for a in paper.authors]
-
-    response = PaperDetailResponse(
-        arxiv_id=paper.arxiv_id,
-        title=paper.title,
-        summary=paper.summary,
-        authors=authors,
-        categories=paper.categories,
-        primary_category=paper.primary_category,
-        published=paper.published,
-        updated=paper.updated,
-        pdf_url=paper.pdf_url,
-        abstract_url=paper.abstract_url,
-        doi=paper.doi,
-        comment=paper.comment,
-        journal_ref=paper.journal_ref,
-    )
+    return success_response(status=200, data=paper)
+
+
+@router.post("/papers")
+async def get_papers(request: Request) -> JSONResponse:
+    """Get metadata for many papers in one call, in request order with not-found markers."""
+    guard_response = ensure_healthy(request)
+    if guard_response is not None:
+        return guard_response
+
+    try:
+        body: object = await request.json()
+        papers_request = PapersRequest.model_validate(body)
+        priority = get_request_priority(request)
+    except Exception as exc:
+        return error_response(status=400, message=str(exc))
+
+    arxiv_client = get_arxiv_client(request)
+
+    try:
+        papers = await arxiv_client.get_papers(papers_request.arxiv_ids, priority)
+    except RateLimiterFullError as exc:
+        return queue_full_response(exc)
+    except Exception as exc:
+        return error_response(status=502, message=str(exc))
+
+    results = [
+        PaperLookupResult(arxiv_id=arxiv_id, found=paper is not None, paper=paper)
+        for arxiv_id, paper in zip(papers_request.arxiv_ids, papers, strict=True)
+    ]
 
-    return success_response(status=200, data=response.model_dump())
+    response = PapersResponse(papers=results)
+    return success_response(status=200, data=response)
@@ -1,19 +1,36 @@
 """Search routes for arXiv paper queries."""
 
-import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
 
+import orjson
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
-from arxivsmart.api.models.search import PaperSummary, SearchRequest, SearchResponse
-from arxivsmart.api.utils import ensure_healthy, error_response, get_arxiv_client, success_response
+from arxivsmart.api.models.search import PaperSummary, SearchFeedSummary, SearchRequest, SearchResponse
+from arxivsmart.api.utils import (
+    ensure_healthy,
+    error_response,
+    get_arxiv_client,
+    get_request_priority,
+    queue_full_response,
+    success_response,
+)
+from arxivsmart.arxiv.rate_limiter import RateLimiterFullError
+from arxivsmart.arxiv.types import Paper, SearchFeedHeader
 
 router = APIRouter(prefix="/v1")
 
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
-@router.post("/search")
-async def search(request: Request) -> JSONResponse:
-    """Search arXiv for papers matching query."""
+
+@router.post("/search", response_model=None)
+async def search(request: Request) -> JSONResponse | StreamingResponse:
+    """Search arXiv for papers matching query.
+
+    Clients sending ``Accept: application/x-ndjson`` receive the results as
+    newline-delimited envelopes streamed while the upstream feed is parsed.
+    """
     guard_response = ensure_healthy(request)
     if guard_response is not None:
         return guard_response
@@ -21,42 +38,91 @@ async def search(request: Request) -> JSONResponse:
     try:
         body: object = await request.json()
         search_request = SearchRequest.model_validate(body)
+        priority = get_request_priority(request)
     except Exception as exc:
         return error_response(status=400, message=str(exc))
 
     arxiv_client = get_arxiv_client(request)
 
+    if _accepts_ndjson(request):
+        try:
+            items = await arxiv_client.stream_search(
+                query=search_request.query,
+                start=search_request.start,
+                max_results=search_request.max_results,
+                sort_by=search_request.sort_by,
+                sort_order=search_request.sort_order,
+                priority=priority,
+            )
+        except RateLimiterFullError as exc:
+            return queue_full_response(exc)
+        except Exception as exc:
+            return error_response(status=502, message=str(exc))
+
+        return StreamingResponse(content=_ndjson_lines(items), media_type=_NDJSON_MEDIA_TYPE, background=BackgroundTask(items.aclose))
+
     try:
-        result = await asyncio.to_thread(
-            arxiv_client.search,
+        result = await arxiv_client.search(
             query=search_request.query,
             start=search_request.start,
             max_results=search_request.max_results,
             sort_by=search_request.sort_by,
             sort_order=search_request.sort_order,
+            priority=priority,
         )
+    except RateLimiterFullError as exc:
+        return queue_full_response(exc)
     except Exception as exc:
         return error_response(status=502, message=str(exc))
 
-    papers = [
-        PaperSummary(
-            arxiv_id=paper.arxiv_id,
-            title=paper.title,
-            summary=paper.summary,
-            authors=[author.name for author in paper.authors],
-            primary_category=paper.primary_category,
-            published=paper.published,
-            updated=paper.updated,
-            pdf_url=paper.pdf_url,
-        )
-        for paper in result.papers
-    ]
-
     response = SearchResponse(
         total_results=result.total_results,
         start_index=result.start_index,
         items_per_page=result.items_per_page,
-        papers=papers,
+        papers=[paper_summary(paper) for paper in result.papers],
+    )
+
+    return success_response(status=200, data=response)
+
+
+def paper_summary(paper: Paper) -> PaperSummary:
+    """Build the abbreviated search representation of a paper."""
+    return PaperSummary(
+        arxiv_id=paper.arxiv_id,
+        title=paper.title,
+        summary=paper.summary,
+        authors=[author.name for author in paper.authors],
+        primary_category=paper.primary_category,
+        published=paper.published,
+        updated=paper.updated,
+        pdf_url=paper.pdf_url,
     )
 
-    return success_response(status=200, data=response.model_dump())
+
+def _accepts_ndjson(request: Request) -> bool:
+    """Return whether the client asked for a newline-delimited JSON stream."""
+    accept = request.headers.get("accept")
+    return accept is not None and _NDJSON_MEDIA_TYPE in accept
+
+
+async def _ndjson_lines(items: AsyncIterable[SearchFeedHeader | Paper]) -> AsyncIterator[bytes]:
+    """Encode streamed search items as one envelope per line.
+
+    The first line carries ``{"feed": {...}}`` with the result counts, each
+    following line ``{"paper": {...}}``. A failure mid-stream is reported as
+    a final error envelope because the status code has already been sent.
+    """
+    try:
+        async for item in items:
+            if isinstance(item, SearchFeedHeader):
+                feed = SearchFeedSummary(
+                    total_results=item.total_results,
+                    start_index=item.start_index,
+                    items_per_page=item.items_per_page,
+                )
+                data: dict[str, object] = {"feed": feed}
+            else:
+                data = {"paper": paper_summary(item)}
+            yield orjson.dumps({"status": 200, "data": data}, option=orjson.OPT_APPEND_NEWLINE)
+    except Exception as exc:
+        yield orjson.dumps({"status": 502, "error": str(exc)}, option=orjson.OPT_APPEND_NEWLINE)
@@ -0,0 +1,40 @@
+"""Middleware adding the Server-Timing header to every response."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from arxivsmart.server_timing import collect_server_timing
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware that collects a request's phase timings and reports them in a Server-Timing header.
+
+    The header is written when the response starts, so it covers the
+    phases finished by then (rate-limit and pool waits, upstream requests,
+    parsing or markdown conversion, serialization) plus a ``total`` up to
+    that point. Streamed responses, such as NDJSON search results and PDFs
+    on a cache miss, start once the upstream headers arrive; time spent
+    streaming the body afterwards is not included.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the app."""
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request with a fresh timing and add the header to its response start message."""
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        started = time.monotonic()
+        with collect_server_timing() as timing:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    header = timing.header_value(time.monotonic() - started)
+                    message["headers"] = [*message["headers"], (b"server-timing", header.encode("latin-1"))]
+                await send(message)
+
+            await self._app(scope, receive, send_with_timing)
@@ -1,22 +1,57 @@
 """API response and app-state guard helpers."""
 
+import math
+import time
 from typing import cast
 
+import orjson
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
+from arxivsmart.api.metrics import RequestMetrics
 from arxivsmart.arxiv.client import ArxivClient
+from arxivsmart.arxiv.rate_limiter import PRIORITIES, Priority, RateLimiterFullError
 from arxivsmart.config import Config
+from arxivsmart.profiler import SamplingProfiler
+from arxivsmart.server_timing import record_phase
 
 
-def success_response(status: int, data: dict[str, object]) -> JSONResponse:
-    """Build a success envelope response."""
-    return JSONResponse(status_code=status, content={"status": status, "data": data})
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson.
+
+    orjson writes dataclasses such as ``Paper`` field by field in declaration
+    order, so routes can put domain objects into the envelope as they are
+    instead of copying them into response models first.
+    """
+
+    def render(self, content: object) -> bytes:
+        """Encode the envelope to compact UTF-8 JSON."""
+        return orjson.dumps(content)
+
+
+def success_response(status: int, data: object) -> JSONResponse:
+    """Build a success envelope response around a dict, TypedDict payload, or domain dataclass."""
+    return _encode_envelope(status, {"status": status, "data": data})
 
 
 def error_response(status: int, message: str) -> JSONResponse:
     """Build an error envelope response."""
-    return JSONResponse(status_code=status, content={"status": status, "error": message})
+    return _encode_envelope(status, {"status": status, "error": message})
+
+
+def queue_full_response(exc: RateLimiterFullError) -> JSONResponse:
+    """Build a 429 envelope for a caller the rate limiter turned away, with its wait estimate as Retry-After."""
+    response = error_response(status=429, message=str(exc))
+    response.headers["Retry-After"] = str(max(1, math.ceil(exc.retry_after_seconds)))
+    return response
+
+
+def _encode_envelope(status: int, envelope: dict[str, object]) -> JSONResponse:
+    """Encode an envelope, recording the time as the request's serialize phase."""
+    started = time.monotonic()
+    response = FastJSONResponse(status_code=status, content=envelope)
+    record_phase("serialize", time.monotonic() - started)
+    return response
 
 
 def ensure_healthy(request: Request) -> JSONResponse | None:
@@ -40,3 +75,34 @@ def get_config(request: Request) -> Config:
     if not hasattr(request.app.state, "config"):
         raise RuntimeError("config is not initialized on app state")
     return cast(Config, request.app.state.config)
+
+
+def get_request_metrics(request: Request) -> RequestMetrics:
+    """Get request metrics instance from FastAPI app state."""
+    if not hasattr(request.app.state, "request_metrics"):
+        raise RuntimeError("request_metrics is not initialized on app state")
+    return cast(RequestMetrics, request.app.state.request_metrics)
+
+
+def get_profiler(request: Request) -> SamplingProfiler:
+    """Get sampling profiler instance from FastAPI app state."""
+    if not hasattr(request.app.state, "profiler"):
+        raise RuntimeError("profiler is not initialized on app state")
+    return cast(SamplingProfiler, request.app.state.profiler)
+
+
+def get_request_priority(request: Request) -> Priority:
+    """Read the rate-limit priority class from the X-Request-Priority header.
+
+    Requests without the header are scheduled as ``normal``; an unknown value
+    raises ValueError so the route can answer 400.
+    """
+    header = request.headers.get("x-request-priority")
+    if header is None:
+        return "normal"
+
+    for priority in PRIORITIES:
+        if header == priority:
+            return priority
+
+    raise ValueError(f"X-Request-Priority must be one of {', '.join(PRIORITIES)}, got: {header}")
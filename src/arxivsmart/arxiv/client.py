@@ -1,23 +1,64 @@
-"""arXiv API client with rate limiting and persistent connection."""
+"""Asyncio arXiv API client with rate limiting and persistent per-host connections."""
 
+import asyncio
 import logging
+import sys
+import time
+from collections.abc import AsyncGenerator, Awaitable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import partial
+from pathlib import Path
 
 import httpx
 import markdownify
 
-from arxivsmart.arxiv.parser import parse_search_response, parse_single_paper_response
-from arxivsmart.arxiv.rate_limiter import RateLimiter
-from arxivsmart.arxiv.types import Paper, SearchResult
+from arxivsmart.arxiv.ids import is_valid_id, is_versioned_id, strip_version
+from arxivsmart.arxiv.paper_batcher import PaperBatcher
+from arxivsmart.arxiv.parser import parse_search_response
+from arxivsmart.arxiv.pdf_stream import PdfStream
+from arxivsmart.arxiv.query import canonicalize_query
+from arxivsmart.arxiv.rate_limiter import Priority, RateLimiter, UpstreamThrottledError
+from arxivsmart.arxiv.search_stream import SearchFeedStream
+from arxivsmart.arxiv.single_flight import SingleFlight
+from arxivsmart.arxiv.types import Paper, SearchFeedHeader, SearchResult
+from arxivsmart.arxiv.upstream_pool import UpstreamPool
+from arxivsmart.cache.blob_store import BlobStore, BlobValidators, ExpiredBlob
+from arxivsmart.cache.metadata import MetadataCache
+from arxivsmart.cache.search import SearchCache, SearchKey
 from arxivsmart.config import ArxivConfig
+from arxivsmart.memory import BodyLedger
 
 logger = logging.getLogger(__name__)
 
+_THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+class IdListRejectedError(RuntimeError):
+    """arXiv refused an id_list query, as it does when one of the IDs is malformed."""
+
+
+class InvalidIdError(ValueError):
+    """A caller asked for an ID outside arXiv's identifier grammar."""
+
 
 class ArxivClient:
-    """HTTP client for the arXiv API with rate limiting.
+    """Asyncio HTTP client for the arXiv API with rate limiting.
+
+    Keeps one HTTP client per upstream host. The API host gets a single
+    persistent connection as required by arXiv API terms: "limit requests
+    to a single connection at a time." The PDF and ar5iv hosts get up to
+    their pool's concurrency in kept-alive connections. Requests queued for
+    a rate-limit slot are suspended coroutines, not parked worker threads.
+    Throttling responses (429, 503) slow the rate limiter down and are
+    retried in a later slot, up to ``throttle_max_retries`` times.
 
-    Maintains a single persistent connection as required by arXiv API terms:
-    "limit requests to a single connection at a time."
+    Each upstream host has its own UpstreamPool of request permits and
+    worker threads (feed parsing for the API, chunk writes for PDFs,
+    markdown conversion for ar5iv), so a queue on one host cannot delay
+    another. The metadata cache and the PDF and HTML stores are SQLite and
+    disk I/O, so they are read and written on their host's worker threads
+    and never stall the event loop.
     """
 
     def __init__(
@@ -25,79 +66,648 @@ class ArxivClient:
         config: ArxivConfig,
         api_rate_limiter: RateLimiter,
         pdf_rate_limiter: RateLimiter,
+        metadata_cache: MetadataCache,
+        pdf_store: BlobStore,
+        html_store: BlobStore,
+        search_cache: SearchCache,
+        search_overfetch_window: int | None,
     ) -> None:
-        """Initialize client with config, per-host rate limiters, and persistent HTTP connection."""
+        """Initialize client with config, per-host rate limiters, local caches, and persistent HTTP connection.
+
+        When ``search_overfetch_window`` is set, searches that fit inside an
+        aligned window of that many results are fetched as the whole window
+        and later pages are answered from the cached window.
+        """
+        if search_overfetch_window is not None and search_overfetch_window > config.max_results_limit:
+            raise ValueError("search_overfetch_window must not exceed max_results_limit")
+        if config.api_max_concurrency > 1 and not config.api_http2:
+            raise ValueError("api_max_concurrency above 1 requires api_http2, since the API host allows a single connection")
+
         self._config = config
         self._api_rate_limiter = api_rate_limiter
         self._pdf_rate_limiter = pdf_rate_limiter
-        self._http = httpx.Client(timeout=config.request_timeout_seconds)
+        self._metadata_cache = metadata_cache
+        self._pdf_store = pdf_store
+        self._html_store = html_store
+        self._search_cache = search_cache
+        self._search_overfetch_window = search_overfetch_window
+        self._search_flight: SingleFlight[SearchKey, SearchResult] = SingleFlight()
+        self._paper_flight: SingleFlight[str, Paper] = SingleFlight()
+        self._pdf_flight: SingleFlight[str, Path] = SingleFlight()
+        self._html_flight: SingleFlight[str, str] = SingleFlight()
+        self._paper_batcher = PaperBatcher(
+            rate_limiter=api_rate_limiter,
+            fetch_batch=self._request_paper_batch,
+            max_batch_size=config.id_list_batch_size,
+            max_retries=config.throttle_max_retries,
+        )
+        self._api_pool = UpstreamPool(name="api", max_concurrency=config.api_max_concurrency, workers=config.api_workers)
+        self._pdf_pool = UpstreamPool(name="pdf", max_concurrency=config.pdf_max_concurrency, workers=config.pdf_workers)
+        self._html_pool = UpstreamPool(name="html", max_concurrency=config.html_max_concurrency, workers=config.html_workers)
+        self._body_ledger = BodyLedger()
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._api_http = _make_http_client(config, max_connections=1, http2=config.api_http2)
+        self._pdf_http = _make_http_client(config, max_connections=config.pdf_max_concurrency, http2=config.pdf_http2)
+        self._html_http = _make_http_client(config, max_connections=config.html_max_concurrency, http2=config.html_http2)
+
+    async def close(self) -> None:
+        """Cancel background refreshes, close the persistent HTTP connections, and stop the pool workers."""
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        for http in (self._api_http, self._pdf_http, self._html_http):
+            await http.aclose()
+        for pool in (self._api_pool, self._pdf_pool, self._html_pool):
+            pool.close()
+
+    async def warm_up(self) -> None:
+        """Open a connection to every upstream host so the first real request skips DNS and the TLS handshake.
 
-    def close(self) -> None:
-        """Close the persistent HTTP connection."""
-        self._http.close()
+        Each host gets one HEAD request. API and PDF warm-ups take an idle
+        slot from their rate limiter, like any other request to those hosts,
+        and are skipped when the limiter is already busy. Failures are
+        logged and leave the host to connect on first use.
+        """
+        await asyncio.gather(
+            self._warm_up_host(self._api_http, self._api_rate_limiter, self._config.base_url),
+            self._warm_up_host(self._pdf_http, self._pdf_rate_limiter, self._config.pdf_base_url),
+            self._warm_up_host(self._html_http, None, self._config.html_base_url),
+        )
+
+    async def _warm_up_host(self, http: httpx.AsyncClient, rate_limiter: RateLimiter | None, url: str) -> None:
+        """Send one HEAD request to a host, in an idle rate-limiter slot when the host is rate limited."""
+        if rate_limiter is not None and not await rate_limiter.acquire_if_idle():
+            return
+        try:
+            response = await http.head(url)
+        except httpx.HTTPError as exc:
+            logger.warning("Connection warm-up for %s failed: %s", url, exc)
+            return
+        finally:
+            if rate_limiter is not None:
+                rate_limiter.release()
+        logger.info("Warmed up connection to %s (status %d)", url, response.status_code)
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """Return counters for the client's caches and request coalescing."""
+        return {
+            "metadata_cache": self._metadata_cache.stats(),
+            "pdf_store": self._pdf_store.stats(),
+            "html_store": self._html_store.stats(),
+            "search_cache": self._search_cache.stats(),
+            "search_flight": self._search_flight.stats(),
+            "paper_flight": self._paper_flight.stats(),
+            "pdf_flight": self._pdf_flight.stats(),
+            "html_flight": self._html_flight.stats(),
+            "paper_batcher": self._paper_batcher.stats(),
+            "api_rate_limiter": self._api_rate_limiter.stats(),
+            "pdf_rate_limiter": self._pdf_rate_limiter.stats(),
+            "api_pool": self._api_pool.stats(),
+            "pdf_pool": self._pdf_pool.stats(),
+            "html_pool": self._html_pool.stats(),
+            "bodies": self._body_ledger.stats(),
+        }
 
-    def search(
+    def rate_limiters(self) -> dict[str, RateLimiter]:
+        """Return the rate limiters by the host they pace."""
+        return {"api": self._api_rate_limiter, "pdf": self._pdf_rate_limiter}
+
+    def upstream_pools(self) -> dict[str, UpstreamPool]:
+        """Return the upstream pools by the host they serve."""
+        return {"api": self._api_pool, "pdf": self._pdf_pool, "html": self._html_pool}
+
+    def body_ledger(self) -> BodyLedger:
+        """Return the ledger of bytes held by in-flight upstream bodies."""
+        return self._body_ledger
+
+    def cache_memory_bytes(self) -> dict[str, int]:
+        """Measure the memory held by in-memory caches; the metadata, PDF, and HTML caches live on disk."""
+        return {"search": self._search_cache.memory_bytes()}
+
+    async def search(
         self,
         query: str,
         start: int,
         max_results: int,
         sort_by: str,
         sort_order: str,
+        priority: Priority,
     ) -> SearchResult:
-        """Search arXiv for papers matching the query."""
-        params: dict[str, str | int] = {
-            "search_query": query,
-            "start": start,
-            "max_results": max_results,
-            "sortBy": sort_by,
-            "sortOrder": sort_order,
-        }
+        """Search arXiv for papers matching the query, serving repeats from the search cache.
+
+        Stale cache entries are returned immediately and refreshed in the
+        background once the API rate limiter has an idle slot. With over-fetch
+        enabled, pages that fit inside an aligned window are sliced from the
+        cached window instead of costing their own upstream request.
+        """
+        canonical_query = canonicalize_query(query)
+        window_size = self._search_overfetch_window
+        if window_size is not None:
+            window_start = (start // window_size) * window_size
+            if start + max_results <= window_start + window_size:
+                window_key = SearchKey(
+                    query=canonical_query,
+                    upstream_query=query,
+                    start=window_start,
+                    max_results=window_size,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                )
+                window = await self._cached_search(window_key, priority)
+                return _slice_window(window, start=start, max_results=max_results)
+
+        key = SearchKey(
+            query=canonical_query,
+            upstream_query=query,
+            start=start,
+            max_results=max_results,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+        return await self._cached_search(key, priority)
+
+    async def stream_search(
+        self,
+        query: str,
+        start: int,
+        max_results: int,
+        sort_by: str,
+        sort_order: str,
+        priority: Priority,
+    ) -> SearchFeedStream | AsyncGenerator[SearchFeedHeader | Paper, None]:
+        """Search arXiv and return an async iterable yielding the feed header and then each paper as it is parsed.
+
+        The upstream request is sent before this method returns, so request
+        and status errors raise here rather than mid-iteration. The body is
+        read off the API connection as fast as arXiv sends it, so a slow
+        client never holds the API pool permit. A cached result for the same
+        canonical key is replayed instead, and a feed read to the end is
+        stored in the search cache.
+        """
+        key = SearchKey(
+            query=canonicalize_query(query),
+            upstream_query=query,
+            start=start,
+            max_results=max_results,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+        lookup = self._search_cache.get(key)
+        if lookup is not None:
+            return _replay_search(lookup.result)
 
-        with self._api_rate_limiter:
-            response = self._http.get(self._config.base_url, params=params)
+        request = self._api_http.build_request("GET", self._config.base_url, params=_search_params(key))
+        response = await self._api_rate_limiter.run(
+            priority,
+            partial(self._send_streaming, self._api_http, self._api_pool, request),
+            self._config.throttle_max_retries,
+        )
 
         if response.status_code != 200:
+            try:
+                await response.aread()
+            finally:
+                await _close_streaming(self._api_pool, response)
             raise RuntimeError(f"arXiv API returned status {response.status_code}: {response.text}")
 
-        return parse_search_response(response.content)
+        return SearchFeedStream(key=key, response=response, search_cache=self._search_cache, pool=self._api_pool)
+
+    async def _cached_search(self, key: SearchKey, priority: Priority) -> SearchResult:
+        """Answer a search key from the cache, refreshing stale entries, or fetch it once upstream."""
+        lookup = self._search_cache.get(key)
+        if lookup is not None:
+            if lookup.is_stale and self._search_cache.begin_refresh(key):
+                task = asyncio.create_task(self._refresh_search(key))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            return lookup.result
+
+        return await self._search_flight.do(key, partial(self._fetch_search, key, priority))
+
+    async def _fetch_search(self, key: SearchKey, priority: Priority) -> SearchResult:
+        """Run a search against the arXiv API and store the result in the search cache."""
+        response = await self._api_rate_limiter.run(
+            priority,
+            partial(self._get_unthrottled, self._api_pool, self._config.base_url, _search_params(key)),
+            self._config.throttle_max_retries,
+        )
+
+        result = await _parse_search(self._api_pool, self._body_ledger, response)
+        self._search_cache.put(key, result)
+        return result
+
+    async def _refresh_search(self, key: SearchKey) -> None:
+        """Re-run a stale search in an idle rate-limiter slot, leaving the entry stale when busy or throttled."""
+        refreshed = False
+        try:
+            if await self._api_rate_limiter.acquire_if_idle():
+                try:
+                    response = await self._get_unthrottled(self._api_pool, self._config.base_url, _search_params(key))
+                except UpstreamThrottledError as exc:
+                    self._api_rate_limiter.record_throttle(exc.retry_after_seconds)
+                    raise
+                else:
+                    self._api_rate_limiter.record_success()
+                finally:
+                    self._api_rate_limiter.release()
+                self._search_cache.put(key, await _parse_search(self._api_pool, self._body_ledger, response))
+                refreshed = True
+        except Exception:
+            logger.exception("Background refresh failed for search %s", key.query)
+        finally:
+            self._search_cache.end_refresh(key, refreshed)
+
+    async def get_paper(self, arxiv_id: str, priority: Priority) -> Paper:
+        """Fetch metadata for a single paper by arXiv ID, serving repeats from the metadata cache.
+
+        An ID outside arXiv's identifier grammar is refused here, so it can
+        never spoil the id_list request it would otherwise share.
+        """
+        if not is_valid_id(arxiv_id):
+            raise InvalidIdError(f"invalid arXiv ID: {arxiv_id}")
+
+        cached_paper = await self._api_pool.run_in_worker("lookup_metadata", partial(self._metadata_cache.get, arxiv_id))
+        if cached_paper is not None:
+            return cached_paper
+
+        return await self._paper_flight.do(arxiv_id, partial(self._fetch_paper, arxiv_id, priority))
 
-    def get_paper(self, arxiv_id: str) -> Paper:
-        """Fetch metadata for a single paper by arXiv ID."""
-        params: dict[str, str] = {
-            "id_list": arxiv_id,
+    async def _fetch_paper(self, arxiv_id: str, priority: Priority) -> Paper:
+        """Fetch one paper through the micro-batcher, sharing an id_list request with concurrent lookups.
+
+        When arXiv rejects the shared batch, the paper is asked for alone,
+        since another ID in the batch may be the one arXiv refused.
+        """
+        try:
+            paper = await self._paper_batcher.lookup(arxiv_id, priority)
+        except IdListRejectedError:
+            paper = (await self._fetch_paper_batch([arxiv_id], priority)).get(arxiv_id)
+        if paper is None:
+            raise ValueError(f"no paper found with arXiv ID: {arxiv_id}")
+        return paper
+
+    async def get_papers(self, arxiv_ids: list[str], priority: Priority) -> list[Paper | None]:
+        """Fetch metadata for many papers, returning them in request order with None for IDs arXiv does not know.
+
+        Cached IDs are answered locally and IDs outside arXiv's identifier
+        grammar are marked missing without asking upstream; the rest are sent
+        as comma-separated ``id_list`` queries of up to ``id_list_batch_size``
+        IDs, one rate-limit slot per chunk.
+        """
+        valid_ids = list(dict.fromkeys(arxiv_id for arxiv_id in arxiv_ids if is_valid_id(arxiv_id)))
+        found = await self._api_pool.run_in_worker("lookup_metadata", partial(_cached_papers, self._metadata_cache, valid_ids))
+        missing_ids = [arxiv_id for arxiv_id in valid_ids if arxiv_id not in found]
+
+        batch_size = self._config.id_list_batch_size
+        for offset in range(0, len(missing_ids), batch_size):
+            chunk = missing_ids[offset : offset + batch_size]
+            found.update(await self._fetch_paper_batch(chunk, priority))
+
+        results: list[Paper | None] = []
+        for arxiv_id in arxiv_ids:
+            if arxiv_id in found:
+                results.append(found[arxiv_id])
+            else:
+                results.append(None)
+        return results
+
+    async def _fetch_paper_batch(self, arxiv_ids: list[str], priority: Priority) -> dict[str, Paper]:
+        """Fetch one id_list chunk from the arXiv API in its own rate-limit slot.
+
+        If arXiv rejects the chunk, each ID is asked for alone in its own
+        slot, and an ID rejected on its own is reported as not found.
+        """
+        try:
+            return await self._api_rate_limiter.run(
+                priority,
+                partial(self._request_paper_batch, arxiv_ids),
+                self._config.throttle_max_retries,
+            )
+        except IdListRejectedError:
+            if len(arxiv_ids) == 1:
+                return {}
+
+        papers: dict[str, Paper] = {}
+        for arxiv_id in arxiv_ids:
+            papers.update(await self._fetch_paper_batch([arxiv_id], priority))
+        return papers
+
+    async def _request_paper_batch(self, arxiv_ids: list[str]) -> dict[str, Paper]:
+        """Send one id_list query and cache every paper it returns; the caller holds the rate-limit slot."""
+        params: dict[str, str | int] = {
+            "id_list": ",".join(arxiv_ids),
+            "max_results": len(arxiv_ids),
         }
+        response = await self._get_unthrottled(self._api_pool, self._config.base_url, params)
+        if response.status_code == 400:
+            raise IdListRejectedError(f"arXiv rejected id_list {params['id_list']}: {response.text}")
 
-        with self._api_rate_limiter:
-            response = self._http.get(self._config.base_url, params=params)
+        result = await _parse_search(self._api_pool, self._body_ledger, response)
+        by_versioned_id = {paper.arxiv_id: paper for paper in result.papers}
+        by_base_id = {strip_version(paper.arxiv_id): paper for paper in result.papers}
 
-        if response.status_code != 200:
-            raise RuntimeError(f"arXiv API returned status {response.status_code}: {response.text}")
+        papers: dict[str, Paper] = {}
+        for arxiv_id in arxiv_ids:
+            index = by_versioned_id if is_versioned_id(arxiv_id) else by_base_id
+            paper = index.get(arxiv_id)
+            if paper is not None:
+                papers[arxiv_id] = paper
+        await self._api_pool.run_in_worker("store_metadata", partial(_cache_papers, self._metadata_cache, papers))
+        return papers
 
-        return parse_single_paper_response(response.content, arxiv_id)
+    async def download_pdf(self, arxiv_id: str, priority: Priority) -> Path | PdfStream:
+        """Return a paper's PDF as a stored file, or as a pass-through stream on a cache miss.
 
-    def download_pdf(self, arxiv_id: str) -> bytes:
-        """Download PDF bytes for a paper."""
-        url = f"{self._config.pdf_base_url}/{arxiv_id}"
+        The stream holds the PDF rate-limit slot only until the upstream
+        response headers arrive. Concurrent requests for the same ID wait for
+        the stream to finish and then receive the stored file. An expired PDF
+        that is still on disk is revalidated with a conditional request and
+        reused when upstream answers 304 Not Modified.
+        """
+        cached_path = await self._pdf_pool.run_in_worker("lookup_pdf", partial(self._pdf_store.lookup, arxiv_id))
+        if cached_path is not None:
+            return cached_path
 
-        with self._pdf_rate_limiter:
-            response = self._http.get(url)
+        in_flight = self._pdf_flight.claim(arxiv_id)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
 
-        if response.status_code != 200:
-            raise RuntimeError(f"PDF download failed with status {response.status_code}")
+        try:
+            expired = await self._pdf_pool.run_in_worker("lookup_pdf", partial(self._pdf_store.lookup_expired, arxiv_id))
+            url = f"{self._config.pdf_base_url}/{arxiv_id}"
+            request = self._pdf_http.build_request("GET", url, headers=_conditional_headers(expired))
+            response = await self._pdf_rate_limiter.run(
+                priority,
+                partial(self._send_streaming, self._pdf_http, self._pdf_pool, request),
+                self._config.throttle_max_retries,
+            )
+
+            if response.status_code == 304 and expired is not None:
+                await _close_streaming(self._pdf_pool, response)
+                validators = _revalidated_validators(expired.validators, response)
+                path = await self._pdf_pool.run_in_worker("store_pdf", partial(self._pdf_store.renew, arxiv_id, validators))
+                if path is None:
+                    raise RuntimeError(f"stored PDF for {arxiv_id} was evicted during revalidation")
+                self._pdf_flight.resolve(arxiv_id, path)
+                return path
+
+            if response.status_code != 200:
+                await _close_streaming(self._pdf_pool, response)
+                raise RuntimeError(f"PDF download failed with status {response.status_code}")
+
+            try:
+                writer = await self._pdf_pool.run_in_worker("store_pdf", self._pdf_store.open_writer)
+            except BaseException:
+                await _close_streaming(self._pdf_pool, response)
+                raise
+        except Exception as exc:
+            self._pdf_flight.fail(arxiv_id, exc)
+            raise
+        except asyncio.CancelledError:
+            self._pdf_flight.fail(arxiv_id, RuntimeError("upstream call was cancelled"))
+            raise
+
+        return PdfStream(
+            arxiv_id=arxiv_id,
+            response=response,
+            writer=writer,
+            flight=self._pdf_flight,
+            pool=self._pdf_pool,
+            ledger=self._body_ledger,
+            validators=_response_validators(response),
+        )
+
+    async def _get_unthrottled(self, pool: UpstreamPool, url: str, params: dict[str, str | int]) -> httpx.Response:
+        """Send a GET request to the API host under a pool permit, raising UpstreamThrottledError for a throttling response."""
+        async with pool.slot():
+            response = await _timed(pool, self._api_http.get(url, params=params))
+        pool.record_bytes(len(response.content))
+        return await _raise_if_throttled(response)
+
+    async def _send_streaming(self, http: httpx.AsyncClient, pool: UpstreamPool, request: httpx.Request) -> httpx.Response:
+        """Send a request and return once headers arrive, raising UpstreamThrottledError for a throttling response.
 
-        return response.content
+        The pool permit stays held for the returned response; the caller
+        releases it once the body has been read or the response is closed.
+        """
+        await pool.acquire()
+        try:
+            return await _raise_if_throttled(await _timed(pool, http.send(request, stream=True)))
+        except BaseException:
+            pool.release()
+            raise
 
-    def fetch_html(self, arxiv_id: str) -> str:
-        """Fetch HTML rendering of a paper from ar5iv.labs.arxiv.org (no rate limit — separate service)."""
+    async def fetch_html(self, arxiv_id: str) -> str:
+        """Fetch HTML rendering of a paper from ar5iv.labs.arxiv.org (no rate limit — separate service, separate pool)."""
+        return await self._html_flight.do(arxiv_id, partial(self._fetch_html, arxiv_id))
+
+    async def _fetch_html(self, arxiv_id: str) -> str:
+        """Fetch one HTML rendering, from the HTML store when fresh, otherwise from ar5iv.
+
+        An expired rendering that is still on disk is revalidated with a
+        conditional request and reused when ar5iv answers 304 Not Modified.
+        """
+        cached_path = await self._html_pool.run_in_worker("lookup_html", partial(self._html_store.lookup, arxiv_id))
+        if cached_path is not None:
+            return await self._html_pool.run_in_worker("read_html", partial(cached_path.read_text, encoding="utf-8"))
+
+        expired = await self._html_pool.run_in_worker("lookup_html", partial(self._html_store.lookup_expired, arxiv_id))
         url = f"{self._config.html_base_url}/{arxiv_id}"
-        response = self._http.get(url)
+        async with self._html_pool.slot():
+            response = await _timed(self._html_pool, self._html_http.get(url, headers=_conditional_headers(expired)))
+        self._html_pool.record_bytes(len(response.content))
+
+        if response.status_code == 304 and expired is not None:
+            validators = _revalidated_validators(expired.validators, response)
+            path = await self._html_pool.run_in_worker("store_html", partial(self._html_store.renew, arxiv_id, validators))
+            if path is None:
+                raise RuntimeError(f"stored HTML for {arxiv_id} was evicted during revalidation")
+            return await self._html_pool.run_in_worker("read_html", partial(path.read_text, encoding="utf-8"))
 
         if response.status_code != 200:
             raise RuntimeError(f"HTML fetch failed with status {response.status_code}")
 
-        return response.text
+        html_content = response.text
+        body = html_content.encode("utf-8")
+        with self._body_ledger.hold("html", len(response.content) + sys.getsizeof(html_content) + len(body)):
+            await self._html_pool.run_in_worker(
+                "store_html",
+                partial(_store_document, self._html_store, arxiv_id, body, _response_validators(response)),
+            )
+        return html_content
+
+    async def fetch_markdown(self, arxiv_id: str) -> str:
+        """Fetch HTML rendering and convert to markdown on the HTML pool's worker threads."""
+        html_content = await self.fetch_html(arxiv_id)
+        with self._body_ledger.hold("html", sys.getsizeof(html_content)):
+            return await self._html_pool.run_in_worker("markdown", partial(markdownify.markdownify, html_content))
+
+
+def _make_http_client(config: ArxivConfig, max_connections: int, http2: bool) -> httpx.AsyncClient:
+    """Build the HTTP client for one upstream host, keeping idle connections open between paced requests.
+
+    The keep-alive expiry should outlast the rate-limit interval, so paced
+    requests reuse the open connection instead of reconnecting each time.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=config.keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(timeout=config.request_timeout_seconds, limits=limits, http2=http2)
+
+
+def _conditional_headers(expired: ExpiredBlob | None) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a stored document's validators."""
+    headers: dict[str, str] = {}
+    if expired is None:
+        return headers
+    if expired.validators.etag is not None:
+        headers["If-None-Match"] = expired.validators.etag
+    if expired.validators.last_modified is not None:
+        headers["If-Modified-Since"] = expired.validators.last_modified
+    return headers
+
+
+def _response_validators(response: httpx.Response) -> BlobValidators:
+    """Read the ETag and Last-Modified validators from a response."""
+    return BlobValidators(etag=response.headers.get("etag"), last_modified=response.headers.get("last-modified"))
+
+
+def _revalidated_validators(stored: BlobValidators, response: httpx.Response) -> BlobValidators:
+    """Combine stored validators with any updated ones sent on a 304 response."""
+    received = _response_validators(response)
+    etag = stored.etag
+    if received.etag is not None:
+        etag = received.etag
+    last_modified = stored.last_modified
+    if received.last_modified is not None:
+        last_modified = received.last_modified
+    return BlobValidators(etag=etag, last_modified=last_modified)
+
+
+def _cached_papers(cache: MetadataCache, arxiv_ids: list[str]) -> dict[str, Paper]:
+    """Return the cached paper for each ID that has a fresh cache entry."""
+    papers: dict[str, Paper] = {}
+    for arxiv_id in arxiv_ids:
+        paper = cache.get(arxiv_id)
+        if paper is not None:
+            papers[arxiv_id] = paper
+    return papers
+
+
+def _cache_papers(cache: MetadataCache, papers: dict[str, Paper]) -> None:
+    """Store each paper in the metadata cache under the ID it was requested by."""
+    for arxiv_id, paper in papers.items():
+        cache.put(arxiv_id, paper)
+
+
+def _store_document(store: BlobStore, key: str, body: bytes, validators: BlobValidators) -> Path:
+    """Write a complete document body into a blob store."""
+    writer = store.open_writer()
+    try:
+        writer.write(body)
+    except Exception:
+        writer.abort()
+        raise
+    return writer.commit(key, validators)
+
+
+async def _timed(pool: UpstreamPool, send: Awaitable[httpx.Response]) -> httpx.Response:
+    """Await an upstream request and record its status and time to response on the host's pool.
+
+    Streamed responses are timed to their headers, others to their complete
+    body. Requests that fail without a response are recorded as ``error``.
+    """
+    started = time.monotonic()
+    try:
+        response = await send
+    except httpx.HTTPError:
+        pool.record_response("error", time.monotonic() - started)
+        raise
+    pool.record_response(str(response.status_code), time.monotonic() - started)
+    return response
+
+
+async def _close_streaming(pool: UpstreamPool, response: httpx.Response) -> None:
+    """Close a streamed response that will not be read and return its pool permit."""
+    try:
+        await response.aclose()
+    finally:
+        pool.release()
+
+
+def _search_params(key: SearchKey) -> dict[str, str | int]:
+    """Build arXiv API query parameters for a search key."""
+    return {
+        "search_query": key.upstream_query,
+        "start": key.start,
+        "max_results": key.max_results,
+        "sortBy": key.sort_by,
+        "sortOrder": key.sort_order,
+    }
+
+
+async def _raise_if_throttled(response: httpx.Response) -> httpx.Response:
+    """Return a response unless upstream throttled it, in which case close it and raise UpstreamThrottledError."""
+    if response.status_code not in _THROTTLE_STATUS_CODES:
+        return response
+
+    await response.aclose()
+    raise UpstreamThrottledError(
+        f"arXiv returned status {response.status_code}",
+        retry_after_seconds=_parse_retry_after(response.headers.get("retry-after")),
+    )
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delay seconds or an HTTP date, ignoring values that are neither."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except ValueError:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def _slice_window(window: SearchResult, start: int, max_results: int) -> SearchResult:
+    """Cut the requested page out of a larger over-fetched search window."""
+    offset = start - window.start_index
+    return SearchResult(
+        total_results=window.total_results,
+        start_index=start,
+        items_per_page=max_results,
+        papers=window.papers[offset : offset + max_results],
+    )
+
+
+async def _replay_search(result: SearchResult) -> AsyncGenerator[SearchFeedHeader | Paper, None]:
+    """Yield a cached search result in the same order as a streamed feed."""
+    yield SearchFeedHeader(
+        total_results=result.total_results,
+        start_index=result.start_index,
+        items_per_page=result.items_per_page,
+    )
+    for paper in result.papers:
+        yield paper
+
+
+async def _parse_search(pool: UpstreamPool, ledger: BodyLedger, response: httpx.Response) -> SearchResult:
+    """Validate an arXiv API search response and parse its Atom feed on the pool's worker threads.
+
+    Feeds of up to 2000 entries take long enough to parse that doing it on
+    the event loop would stall every other in-flight request. The feed body
+    is held in the ledger while it is parsed.
+    """
+    if response.status_code != 200:
+        raise RuntimeError(f"arXiv API returned status {response.status_code}: {response.text}")
 
-    def fetch_markdown(self, arxiv_id: str) -> str:
-        """Fetch HTML rendering and convert to markdown."""
-        html_content = self.fetch_html(arxiv_id)
-        return markdownify.markdownify(html_content)
+    with ledger.hold("feed", len(response.content)):
+        return await pool.run_in_worker("parse_feed", partial(parse_search_response, response.content))
@@ -0,0 +1,22 @@
+"""Helpers for arXiv identifier handling."""
+
+import re
+
+_VERSION_SUFFIX = re.compile(r"v\d+$")
+# New-style IDs such as 2301.00001v2, and old-style IDs such as hep-th/9901001 or math.GT/0309136.
+_ID_PATTERN = re.compile(r"(\d{4}\.\d{4,5}|[a-z]+(-[a-z]+)*(\.[A-Z]{2})?/\d{7})(v\d+)?")
+
+
+def is_valid_id(arxiv_id: str) -> bool:
+    """Return True when the ID follows arXiv's identifier grammar, old or new style."""
+    return _ID_PATTERN.fullmatch(arxiv_id) is not None
+
+
+def is_versioned_id(arxiv_id: str) -> bool:
+    """Return True when the ID pins an explicit version, e.g. ``2301.00001v2``."""
+    return _VERSION_SUFFIX.search(arxiv_id) is not None
+
+
+def strip_version(arxiv_id: str) -> str:
+    """Return the ID without its version suffix, e.g. ``2301.00001v2`` becomes ``2301.00001``."""
+    return _VERSION_SUFFIX.sub("", arxiv_id)
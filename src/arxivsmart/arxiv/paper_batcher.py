@@ -0,0 +1,130 @@
+"""Micro-batching of concurrent single-paper lookups into shared id_list requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from arxivsmart.arxiv.rate_limiter import PRIORITIES, Priority, RateLimiter
+from arxivsmart.arxiv.types import Paper
+from arxivsmart.server_timing import ServerTiming, collect_server_timing, record_phases
+
+
+class PaperBatcher:
+    """Collects pending single-ID lookups and sends them upstream together.
+
+    Callers enqueue their ID and wait. A single dispatcher task waits for a
+    rate-limit slot, then takes every pending ID (up to the batch size) and
+    resolves them all with one request, repeating until nothing is pending.
+    IDs that arrive while the dispatcher waits for its slot ride along for free.
+    The dispatcher queues in the most urgent priority class among the IDs
+    pending when it starts waiting. A throttled batch is retried as a whole
+    in a slot the limiter schedules. Each batch's rate-limit wait, upstream
+    request, and parsing are timed once and added to the Server-Timing of
+    every lookup the batch answered.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        fetch_batch: Callable[[list[str]], Awaitable[dict[str, Paper]]],
+        max_batch_size: int,
+        max_retries: int,
+    ) -> None:
+        """Initialize with the limiter guarding the upstream, the batch fetch function, and the throttle retry budget."""
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be greater than 0")
+
+        self._rate_limiter = rate_limiter
+        self._fetch_batch = fetch_batch
+        self._max_batch_size = max_batch_size
+        self._max_retries = max_retries
+        self._pending: dict[str, asyncio.Future[tuple[Paper | None, ServerTiming]]] = {}
+        self._pending_priorities: dict[str, Priority] = {}
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._batches = 0
+        self._lookups = 0
+        self._largest_batch = 0
+
+    async def lookup(self, arxiv_id: str, priority: Priority) -> Paper | None:
+        """Return the paper for an ID, or None when arXiv does not know it."""
+        future = self._pending.get(arxiv_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[arxiv_id] = future
+            self._pending_priorities[arxiv_id] = priority
+        elif PRIORITIES.index(priority) < PRIORITIES.index(self._pending_priorities[arxiv_id]):
+            self._pending_priorities[arxiv_id] = priority
+
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch_pending())
+
+        paper, timing = await asyncio.shield(future)
+        record_phases(timing)
+        return paper
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the number of upstream batches, IDs sent, and the largest batch so far."""
+        return {
+            "batches": self._batches,
+            "lookups": self._lookups,
+            "largest_batch": self._largest_batch,
+            "pending": len(self._pending),
+        }
+
+    async def _dispatch_pending(self) -> None:
+        """Send batches until no lookups are pending, then let the next caller start a new dispatcher."""
+        try:
+            while self._pending:
+                await self._dispatch_batch()
+        finally:
+            self._dispatcher = None
+
+    async def _dispatch_batch(self) -> None:
+        """Wait for a rate-limit slot, then fetch every pending ID that fits into one batch."""
+        priority = min(self._pending_priorities.values(), key=PRIORITIES.index)
+        batch_ids: list[str] = []
+        futures: list[asyncio.Future[tuple[Paper | None, ServerTiming]]] = []
+
+        async def fetch() -> dict[str, Paper]:
+            if not batch_ids:
+                batch_ids.extend(list(self._pending)[: self._max_batch_size])
+                futures.extend(self._pending.pop(arxiv_id) for arxiv_id in batch_ids)
+                for arxiv_id in batch_ids:
+                    del self._pending_priorities[arxiv_id]
+                self._batches += 1
+                self._lookups += len(batch_ids)
+                self._largest_batch = max(self._largest_batch, len(batch_ids))
+            return await self._fetch_batch(batch_ids)
+
+        with collect_server_timing() as timing:
+            try:
+                papers = await self._rate_limiter.run(priority, fetch, self._max_retries)
+            except Exception as exc:
+                if not futures:
+                    # Failed before taking a batch, such as turned away by a full limiter queue: every
+                    # pending lookup was waiting for this slot, so fail them all rather than retry at once.
+                    futures.extend(self._take_all_pending())
+                _fail_lookups(futures, exc)
+                return
+            except asyncio.CancelledError:
+                # No dispatcher is left to answer the batch or anything still pending.
+                futures.extend(self._take_all_pending())
+                _fail_lookups(futures, RuntimeError("paper lookup was cancelled"))
+                raise
+
+        for arxiv_id, future in zip(batch_ids, futures, strict=True):
+            future.set_result((papers.get(arxiv_id), timing))
+
+    def _take_all_pending(self) -> list[asyncio.Future[tuple[Paper | None, ServerTiming]]]:
+        """Remove and return the futures of every pending lookup."""
+        futures = list(self._pending.values())
+        self._pending.clear()
+        self._pending_priorities.clear()
+        return futures
+
+
+def _fail_lookups(futures: list[asyncio.Future[tuple[Paper | None, ServerTiming]]], exc: Exception) -> None:
+    """Raise the exception in every lookup waiting on the futures."""
+    for future in futures:
+        future.set_exception(exc)
+        # Mark retrieved: a caller that was cancelled no longer awaits it.
+        future.exception()
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+
+# Only the tree builder comes from the stdlib; XML is parsed by defusedxml's XMLParser.
+from xml.etree.ElementTree import TreeBuilder  # nosec B405
+
 from defusedxml import ElementTree
 
-from arxivsmart.arxiv.types import Author, Paper, SearchResult
+from arxivsmart.arxiv.types import Author, Paper, SearchFeedHeader, SearchResult
 
 _NS: dict[str, str] = {
     "atom": "http://www.w3.org/2005/Atom",
@@ -12,6 +17,40 @@ _NS: dict[str, str] = {
     "arxiv": "http://arxiv.org/schemas/atom",
 }
 
+_ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
+_TOTAL_RESULTS_TAG = "{http://a9.com/-/spec/opensearch/1.1/}totalResults"
+_START_INDEX_TAG = "{http://a9.com/-/spec/opensearch/1.1/}startIndex"
+_ITEMS_PER_PAGE_TAG = "{http://a9.com/-/spec/opensearch/1.1/}itemsPerPage"
+_ID_TAG = "{http://www.w3.org/2005/Atom}id"
+_TITLE_TAG = "{http://www.w3.org/2005/Atom}title"
+_SUMMARY_TAG = "{http://www.w3.org/2005/Atom}summary"
+_PUBLISHED_TAG = "{http://www.w3.org/2005/Atom}published"
+_UPDATED_TAG = "{http://www.w3.org/2005/Atom}updated"
+_AUTHOR_TAG = "{http://www.w3.org/2005/Atom}author"
+_NAME_TAG = "{http://www.w3.org/2005/Atom}name"
+_CATEGORY_TAG = "{http://www.w3.org/2005/Atom}category"
+_LINK_TAG = "{http://www.w3.org/2005/Atom}link"
+_PRIMARY_CATEGORY_TAG = "{http://arxiv.org/schemas/atom}primary_category"
+_AFFILIATION_TAG = "{http://arxiv.org/schemas/atom}affiliation"
+_DOI_TAG = "{http://arxiv.org/schemas/atom}doi"
+_COMMENT_TAG = "{http://arxiv.org/schemas/atom}comment"
+_JOURNAL_REF_TAG = "{http://arxiv.org/schemas/atom}journal_ref"
+_ENTRY_TEXT_TAG_NAMES: dict[str, str] = {
+    _ID_TAG: "atom:id",
+    _TITLE_TAG: "atom:title",
+    _SUMMARY_TAG: "atom:summary",
+    _PUBLISHED_TAG: "atom:published",
+    _UPDATED_TAG: "atom:updated",
+    _DOI_TAG: "arxiv:doi",
+    _COMMENT_TAG: "arxiv:comment",
+    _JOURNAL_REF_TAG: "arxiv:journal_ref",
+}
+_HEADER_TAG_NAMES: dict[str, str] = {
+    _TOTAL_RESULTS_TAG: "opensearch:totalResults",
+    _START_INDEX_TAG: "opensearch:startIndex",
+    _ITEMS_PER_PAGE_TAG: "opensearch:itemsPerPage",
+}
+
 
 def _find_text(element: ElementTree.Element, tag: str) -> str:
     """Find text content of a child element, raising if missing."""
@@ -23,20 +62,19 @@ def _find_text(element: ElementTree.Element, tag: str) -> str:
     return child.text.strip()
 
 
-def _find_text_optional(element: ElementTree.Element, tag: str) -> str:
-    """Find text content of an optional child element, returning empty string if absent."""
-    child = element.find(tag, _NS)
-    if child is None:
-        return ""
-    if child.text is None:
-        return ""
-    return child.text.strip()
-
-
 def parse_author(author_element: ElementTree.Element) -> Author:
     """Parse a single <author> element into an Author."""
-    name = _find_text(author_element, "atom:name")
-    affiliation = _find_text_optional(author_element, "arxiv:affiliation")
+    name: str | None = None
+    affiliation: str | None = None
+    for child in author_element:
+        if child.tag == _NAME_TAG and name is None:
+            name = _element_text(child)
+        elif child.tag == _AFFILIATION_TAG and affiliation is None:
+            affiliation = _element_text(child)
+    if name is None:
+        raise ValueError("missing required element: atom:name")
+    if affiliation is None:
+        return Author(name=name, affiliation="")
     return Author(name=name, affiliation=affiliation)
 
 
@@ -49,77 +87,102 @@ def _extract_arxiv_id(entry_id: str) -> str:
     return parts[1]
 
 
-def _extract_pdf_url(entry: ElementTree.Element) -> str:
-    """Extract PDF URL from entry links."""
-    for link in entry.findall("atom:link", _NS):
-        if link.get("title") == "pdf":
-            href = link.get("href")
-            if href is not None:
-                return href
-    return ""
+class _EntryChildren:
+    """The children of one <entry>, sorted by tag in a single walk.
 
+    Single-valued fields keep their first occurrence, as ``find`` would.
+    """
 
-def parse_entry(entry: ElementTree.Element) -> Paper:
-    """Parse a single <entry> element into a Paper."""
-    entry_id = _find_text(entry, "atom:id")
-    arxiv_id = _extract_arxiv_id(entry_id)
-    title = _find_text(entry, "atom:title")
-    # Normalize whitespace in title
-    title = " ".join(title.split())
-    summary = _find_text(entry, "atom:summary").strip()
+    def __init__(self, entry: ElementTree.Element) -> None:
+        """Walk the entry's children once, dispatching on their Clark-notation tags."""
+        self.texts: dict[str, str] = {}
+        self.authors: list[ElementTree.Element] = []
+        self.categories: list[str] = []
+        self.primary_category: ElementTree.Element | None = None
+        self.pdf_link: str | None = None
+        for child in entry:
+            tag = child.tag
+            if tag in _ENTRY_TEXT_TAG_NAMES:
+                if tag not in self.texts:
+                    self.texts[tag] = _element_text(child)
+            elif tag == _AUTHOR_TAG:
+                self.authors.append(child)
+            elif tag == _CATEGORY_TAG:
+                self._add_category(child)
+            elif tag == _PRIMARY_CATEGORY_TAG:
+                if self.primary_category is None:
+                    self.primary_category = child
+            elif tag == _LINK_TAG:
+                self._add_link(child)
 
-    authors = [parse_author(a) for a in entry.findall("atom:author", _NS)]
-
-    categories: list[str] = []
-    for cat in entry.findall("atom:category", _NS):
-        term = cat.get("term")
+    def _add_category(self, category: ElementTree.Element) -> None:
+        """Record a category term, interned so papers share one string per category."""
+        term = category.get("term")
         if term is not None:
-            categories.append(term)
+            self.categories.append(sys.intern(term))
+
+    def _add_link(self, link: ElementTree.Element) -> None:
+        """Record the href of the first PDF link that carries one."""
+        if self.pdf_link is None and link.get("title") == "pdf":
+            self.pdf_link = link.get("href")
+
+    def pdf_url(self) -> str:
+        """Return the PDF link, or an empty string if the entry has none."""
+        if self.pdf_link is None:
+            return ""
+        return self.pdf_link
 
-    primary_cat_elem = entry.find("arxiv:primary_category", _NS)
-    if primary_cat_elem is not None:
-        primary_term = primary_cat_elem.get("term")
-        if primary_term is None:
+    def required_text(self, tag: str) -> str:
+        """Return the text of a required child, raising if the entry has none."""
+        text = self.texts.get(tag)
+        if text is None:
+            raise ValueError(f"missing required element: {_ENTRY_TEXT_TAG_NAMES[tag]}")
+        return text
+
+    def optional_text(self, tag: str) -> str:
+        """Return the text of an optional child, or an empty string if absent."""
+        if tag in self.texts:
+            return self.texts[tag]
+        return ""
+
+    def primary_category_term(self) -> str:
+        """Return the interned primary category, raising if it or its term is missing."""
+        if self.primary_category is None:
+            raise ValueError("missing arxiv:primary_category element")
+        term = self.primary_category.get("term")
+        if term is None:
             raise ValueError("primary_category element missing term attribute")
-        primary_category = primary_term
-    else:
-        raise ValueError("missing arxiv:primary_category element")
+        return sys.intern(term)
 
-    published = _find_text(entry, "atom:published")
-    updated = _find_text(entry, "atom:updated")
-    pdf_url = _extract_pdf_url(entry)
-    abstract_url = entry_id
 
-    doi = _find_text_optional(entry, "arxiv:doi")
-    comment = _find_text_optional(entry, "arxiv:comment")
-    journal_ref = _find_text_optional(entry, "arxiv:journal_ref")
+def parse_entry(entry: ElementTree.Element) -> Paper:
+    """Parse a single <entry> element into a Paper, visiting each child element once."""
+    children = _EntryChildren(entry)
+    entry_id = children.required_text(_ID_TAG)
+    arxiv_id = _extract_arxiv_id(entry_id)
+    # Normalize whitespace in title
+    title = " ".join(children.required_text(_TITLE_TAG).split())
+    summary = children.required_text(_SUMMARY_TAG)
+    authors = tuple(parse_author(author) for author in children.authors)
+    primary_category = children.primary_category_term()
 
     return Paper(
         arxiv_id=arxiv_id,
         title=title,
         summary=summary,
         authors=authors,
-        categories=categories,
+        categories=tuple(children.categories),
         primary_category=primary_category,
-        published=published,
-        updated=updated,
-        pdf_url=pdf_url,
-        abstract_url=abstract_url,
-        doi=doi,
-        comment=comment,
-        journal_ref=journal_ref,
+        published=children.required_text(_PUBLISHED_TAG),
+        updated=children.required_text(_UPDATED_TAG),
+        pdf_url=children.pdf_url(),
+        abstract_url=entry_id,
+        doi=children.optional_text(_DOI_TAG),
+        comment=children.optional_text(_COMMENT_TAG),
+        journal_ref=children.optional_text(_JOURNAL_REF_TAG),
     )
 
 
-def parse_single_paper_response(xml_bytes: bytes, arxiv_id: str) -> Paper:
-    """Parse an Atom feed expected to contain exactly one paper entry."""
-    root = ElementTree.fromstring(xml_bytes)
-    entries = root.findall("{http://www.w3.org/2005/Atom}entry")
-    if len(entries) == 0:
-        raise ValueError(f"no paper found with arXiv ID: {arxiv_id}")
-    return parse_entry(entries[0])
-
-
 def parse_search_response(xml_bytes: bytes) -> SearchResult:
     """Parse a full Atom feed from arXiv search API."""
     root = ElementTree.fromstring(xml_bytes)
@@ -132,7 +195,7 @@ def parse_search_response(xml_bytes: bytes) -> SearchResult:
     start_index = int(start_text)
     items_per_page = int(per_page_text)
 
-    papers = [parse_entry(entry) for entry in root.findall("atom:entry", _NS)]
+    papers = tuple(parse_entry(entry) for entry in root.findall("atom:entry", _NS))
 
     return SearchResult(
         total_results=total_results,
@@ -140,3 +203,100 @@ def parse_search_response(xml_bytes: bytes) -> SearchResult:
         items_per_page=items_per_page,
         papers=papers,
     )
+
+
+class _FeedBuilder:
+    """XML parser target that builds the feed tree and collects header and entries as they close."""
+
+    def __init__(self) -> None:
+        """Start with an empty tree and nothing collected."""
+        self._builder = TreeBuilder()
+        self._root: ElementTree.Element | None = None
+        self.header_values: dict[str, int] = {}
+        self.header_sent = False
+        self.items: list[SearchFeedHeader | Paper] = []
+
+    def start(self, tag: str, attrs: dict[str, str]) -> ElementTree.Element:
+        """Open an element, emitting the header before the first entry."""
+        element = self._builder.start(tag, attrs)
+        if self._root is None:
+            self._root = element
+        if tag == _ENTRY_TAG and not self.header_sent:
+            self.emit_header()
+        return element
+
+    def end(self, tag: str) -> ElementTree.Element:
+        """Close an element, recording header values and emitting finished entries."""
+        element = self._builder.end(tag)
+        if tag in _HEADER_TAG_NAMES:
+            self.header_values[tag] = int(_element_text(element))
+        elif tag == _ENTRY_TAG and self._root is not None:
+            self.items.append(parse_entry(element))
+            self._root.remove(element)
+        return element
+
+    def data(self, data: str) -> None:
+        """Collect element text."""
+        self._builder.data(data)
+
+    def close(self) -> None:
+        """Finish the tree once the parser has seen the end of the document."""
+        self._builder.close()
+
+    def emit_header(self) -> None:
+        """Queue the feed header built from the opensearch values seen so far."""
+        self.header_sent = True
+        self.items.append(_build_header(self.header_values))
+
+
+class SearchFeedParser:
+    """Push parser that turns an arXiv search feed into items as its bytes arrive.
+
+    Feed it chunks in order; each call returns the items completed so far:
+    the feed header first, then one Paper per entry as soon as the entry's
+    closing tag has been read. Parsed entries are detached from the tree, so
+    memory stays bounded by the largest single entry.
+    """
+
+    def __init__(self) -> None:
+        """Create the underlying defused XML parser with an entry-emitting target."""
+        self._builder = _FeedBuilder()
+        self._parser = ElementTree.XMLParser(target=self._builder)
+
+    def feed(self, chunk: bytes) -> list[SearchFeedHeader | Paper]:
+        """Parse the next chunk of the feed and return the items it completed."""
+        self._parser.feed(chunk)
+        return self._take_items()
+
+    def close(self) -> list[SearchFeedHeader | Paper]:
+        """Finish parsing, raising if the feed is incomplete, and return the remaining items."""
+        self._parser.close()
+        if not self._builder.header_sent:
+            self._builder.emit_header()
+        return self._take_items()
+
+    def _take_items(self) -> list[SearchFeedHeader | Paper]:
+        """Return and clear the items completed since the last call."""
+        items = self._builder.items
+        self._builder.items = []
+        return items
+
+
+def _element_text(element: ElementTree.Element) -> str:
+    """Return the stripped text content of an element."""
+    if element.text is None:
+        return ""
+    return element.text.strip()
+
+
+def _build_header(header_values: dict[str, int]) -> SearchFeedHeader:
+    """Build the feed header from the opensearch values seen so far, raising if any is missing."""
+    for tag, name in _HEADER_TAG_NAMES.items():
+        if tag not in header_values:
+            raise ValueError(f"missing required element: {name}")
+
+    return SearchFeedHeader(
+        total_results=header_values[_TOTAL_RESULTS_TAG],
+        start_index=header_values[_START_INDEX_TAG],
+        items_per_page=header_values[_ITEMS_PER_PAGE_TAG],
+    )
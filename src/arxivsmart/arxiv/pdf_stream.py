@@ -0,0 +1,93 @@
+"""Pass-through stream of an upstream PDF body that is written to the PDF store on the way."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from functools import partial
+from pathlib import Path
+
+import httpx
+
+from arxivsmart.arxiv.single_flight import SingleFlight
+from arxivsmart.arxiv.upstream_pool import UpstreamPool
+from arxivsmart.cache.blob_store import BlobValidators, BlobWriter
+from arxivsmart.memory import BodyLedger
+
+
+class PdfStream:
+    """Yields upstream PDF chunks to the caller while teeing them into the PDF store.
+
+    When the body has been read completely the document is committed to the
+    store and concurrent requests for the same ID, which are waiting on the
+    single-flight entry, receive the stored path. Closing the stream before
+    the end discards the partial document and fails those waiters. Chunks
+    are written and hashed, and the document committed or discarded, on the
+    PDF pool's worker threads. The pool permit is released once the body has
+    been read or abandoned. Each chunk is held in the ledger until the caller
+    has taken it.
+    """
+
+    def __init__(
+        self,
+        arxiv_id: str,
+        response: httpx.Response,
+        writer: BlobWriter,
+        flight: SingleFlight[str, Path],
+        pool: UpstreamPool,
+        ledger: BodyLedger,
+        validators: BlobValidators,
+    ) -> None:
+        """Wrap an open streaming response whose status has already been checked and whose pool permit is held.
+
+        The validators are stored with the document for later revalidation.
+        """
+        self._arxiv_id = arxiv_id
+        self._response = response
+        self._writer = writer
+        self._flight = flight
+        self._pool = pool
+        self._ledger = ledger
+        self._validators = validators
+        self._finished = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield body chunks as they arrive from upstream."""
+        try:
+            async for chunk in self._response.aiter_bytes():
+                self._pool.record_bytes(len(chunk))
+                with self._ledger.hold("pdf", len(chunk)):
+                    await self._pool.run_in_worker("write_pdf", partial(self._writer.write, chunk))
+                    yield chunk
+        except Exception as exc:
+            await self._finish(exc)
+            raise
+        finally:
+            await self._response.aclose()
+
+        await self._finish(None)
+
+    async def aclose(self) -> None:
+        """Release the upstream response, discarding the document if it was not fully read."""
+        await self._finish(RuntimeError(f"PDF stream for {self._arxiv_id} closed before completion"))
+        await self._response.aclose()
+
+    async def _finish(self, error: Exception | None) -> None:
+        """Commit or discard the document exactly once and settle the single-flight entry."""
+        if self._finished:
+            return
+        self._finished = True
+        self._pool.release()
+
+        if error is not None:
+            self._flight.fail(self._arxiv_id, error)
+            await self._pool.run_in_worker("store_pdf", self._writer.abort)
+            return
+
+        try:
+            path = await self._pool.run_in_worker("store_pdf", partial(self._writer.commit, self._arxiv_id, self._validators))
+        except Exception as exc:
+            self._flight.fail(self._arxiv_id, exc)
+            raise
+        except asyncio.CancelledError:
+            self._flight.fail(self._arxiv_id, RuntimeError(f"PDF stream for {self._arxiv_id} was cancelled while storing"))
+            raise
+        self._flight.resolve(self._arxiv_id, path)
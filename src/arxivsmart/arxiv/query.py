@@ -0,0 +1,47 @@
+"""Canonicalization of arXiv search query strings."""
+
+import re
+
+_WORD_PATTERN = re.compile(r'[^\s()"]*"[^"]*"?|[()]|[^\s()"]+')
+_FIELD_PATTERN = re.compile(r"^([A-Za-z]+):(.*)$", re.DOTALL)
+_FIELD_PREFIXES = frozenset({"ti", "au", "abs", "co", "jr", "cat", "rn", "id", "all"})
+_BOOLEAN_OPERATORS = frozenset({"AND", "OR", "ANDNOT"})
+
+
+def _normalize_term(word: str) -> str:
+    """Lower-case a known field prefix and collapse whitespace inside quoted phrases."""
+    if '"' in word:
+        prefix, _, phrase = word.partition('"')
+        word = f'{prefix}"{" ".join(phrase.split())}'
+
+    match = _FIELD_PATTERN.match(word)
+    if match is not None and match.group(1).lower() in _FIELD_PREFIXES:
+        return f"{match.group(1).lower()}:{match.group(2)}"
+    return word
+
+
+def canonicalize_query(query: str) -> str:
+    """Return a canonical spelling of an arXiv query for use as a cache key.
+
+    Whitespace is collapsed, field prefixes such as ``TI:`` become ``ti:``,
+    and ``AND NOT`` becomes ``ANDNOT``, so trivially different spellings of
+    the same query compare equal. Only upper-case operators are operators to
+    arXiv; lower-case ``and``/``or``/``not`` are search words and are kept
+    as written. The canonical form is a key only: arXiv is always sent the
+    query as the caller wrote it.
+    """
+    words: list[str] = []
+    for word in _WORD_PATTERN.findall(query):
+        if word == "NOT" and len(words) > 0 and words[-1] == "AND":
+            words[-1] = "ANDNOT"
+        elif word in _BOOLEAN_OPERATORS:
+            words.append(word)
+        else:
+            words.append(_normalize_term(word))
+
+    parts: list[str] = []
+    for index, word in enumerate(words):
+        if index > 0 and words[index - 1] != "(" and not words[index - 1].endswith(":") and word != ")":
+            parts.append(" ")
+        parts.append(word)
+    return "".join(parts)
@@ -1,49 +1,333 @@
-"""Thread-safe rate limiter for arXiv API requests."""
+"""Priority-aware asyncio rate limiter with adaptive pacing for arXiv API requests."""
 
-import threading
+import asyncio
+import logging
 import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from types import TracebackType
+from typing import Literal
+
+from arxivsmart.metrics import LATENCY_BUCKETS_SECONDS, Histogram
+from arxivsmart.server_timing import record_phase
+
+type Priority = Literal["interactive", "normal", "background"]
+
+PRIORITIES: tuple[Priority, ...] = ("interactive", "normal", "background")
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamThrottledError(RuntimeError):
+    """Raised when upstream answers with a throttling status such as 429 or 503."""
+
+    def __init__(self, message: str, retry_after_seconds: float | None) -> None:
+        """Store the message and the upstream's Retry-After delay, if it sent one."""
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class RateLimiterFullError(RuntimeError):
+    """Raised when a caller is turned away because the limiter's queue is full."""
+
+    def __init__(self, message: str, retry_after_seconds: float) -> None:
+        """Store the message and the estimated wait before a retry could be admitted."""
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(frozen=True)
+class QueuedCaller:
+    """A caller waiting for the slot, with how long it has waited and its estimated remaining wait."""
+
+    priority: Priority
+    waited_seconds: float
+    eta_seconds: float
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _Waiter:
+    """A queued caller's wake-up future and the monotonic time it joined the queue."""
+
+    future: asyncio.Future[None]
+    queued_at: float
 
 
 class RateLimiter:
-    """Enforces minimum time gap between arXiv API requests.
+    """Enforces minimum time gap between arXiv API requests, granting slots by priority.
+
+    Holds a single slot so requests use one connection at a time, and tracks
+    the last request time to enforce the rate limit window. Waiters queue per
+    priority class; a released slot goes to the oldest waiter of the most
+    urgent non-empty class, so interactive lookups overtake queued bulk work
+    while each class stays FIFO. Queued callers are suspended coroutines, so
+    a deep queue costs no threads.
 
-    Uses a threading lock to ensure single-connection access and
-    tracks the last request time to enforce the rate limit window.
+    The interval adapts to upstream throttling: each throttled response
+    multiplies it by ``backoff_factor`` up to ``max_interval_seconds`` and
+    holds the next slot back for any Retry-After delay, and every
+    ``recovery_successes`` consecutive successes divide it again, down to
+    ``min_interval_seconds``.
+
+    Admission is bounded: at most ``max_queue_depth`` callers wait. When the
+    queue is full, a new caller that outranks a queued one takes the place
+    of the newest waiter of the least urgent class, which is turned away;
+    otherwise the new caller is. Turned-away callers get a
+    RateLimiterFullError carrying an estimate of how long the queue ahead of
+    them would take, so they can retry later instead of timing out.
     """
 
-    def __init__(self, min_interval_seconds: float) -> None:
-        """Initialize rate limiter with explicit interval."""
+    def __init__(
+        self,
+        min_interval_seconds: float,
+        max_interval_seconds: float,
+        backoff_factor: float,
+        recovery_successes: int,
+        max_queue_depth: int,
+    ) -> None:
+        """Initialize rate limiter with explicit interval floor, ceiling, adaptation speed, and queue bound."""
         if min_interval_seconds <= 0.0:
             raise ValueError("min_interval_seconds must be greater than 0")
+        if max_interval_seconds < min_interval_seconds:
+            raise ValueError("max_interval_seconds must not be less than min_interval_seconds")
+        if backoff_factor <= 1.0:
+            raise ValueError("backoff_factor must be greater than 1")
+        if recovery_successes <= 0:
+            raise ValueError("recovery_successes must be greater than 0")
+        if max_queue_depth <= 0:
+            raise ValueError("max_queue_depth must be greater than 0")
 
         self._min_interval_seconds = min_interval_seconds
-        self._lock = threading.Lock()
+        self._max_interval_seconds = max_interval_seconds
+        self._backoff_factor = backoff_factor
+        self._recovery_successes = recovery_successes
+        self._max_queue_depth = max_queue_depth
+        self._interval_seconds = min_interval_seconds
+        self._not_before: float = 0.0
+        self._consecutive_successes = 0
+        self._throttled = 0
+        self._retried = 0
+        self._queues: dict[Priority, deque[_Waiter]] = {priority: deque() for priority in PRIORITIES}
+        self._held = False
         self._last_request_time: float = 0.0
+        self._grants: dict[Priority, int] = dict.fromkeys(PRIORITIES, 0)
+        self._rejected: dict[Priority, int] = dict.fromkeys(PRIORITIES, 0)
+        self._wait_seconds = 0.0
+        self._wait_histogram = Histogram(LATENCY_BUCKETS_SECONDS)
+
+    async def acquire(self, priority: Priority) -> None:
+        """Wait for the slot in the given priority class, then for the rate limit window.
+
+        Raises RateLimiterFullError when the queue is full, immediately or
+        later when a more urgent caller takes this caller's place.
+        """
+        started = time.monotonic()
+        if self._held or self.queue_depth() > 0:
+            if self.queue_depth() >= self._max_queue_depth:
+                self._make_room(priority)
+            waiter = _Waiter(future=asyncio.get_running_loop().create_future(), queued_at=started)
+            queue = self._queues[priority]
+            queue.append(waiter)
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                # Pass the slot on only if it was granted; a caller turned away never held it.
+                if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                    self._hand_over()
+                elif waiter in queue:
+                    queue.remove(waiter)
+                raise
+        self._held = True
+        self._grants[priority] += 1
+        await self._wait_for_window()
+        self._record_wait(time.monotonic() - started)
 
-    def acquire(self) -> None:
-        """Block until the rate limit window has passed, then acquire the lock."""
-        self._lock.acquire()
-        elapsed = time.monotonic() - self._last_request_time
-        remaining = self._min_interval_seconds - elapsed
-        if remaining > 0:
-            time.sleep(remaining)
+    async def acquire_if_idle(self) -> bool:
+        """Acquire the next slot only when nobody holds or waits for the limiter.
+
+        Returns False without queueing when the limiter is busy, so background
+        work never delays callers that are already queued.
+        """
+        if self._held or self.queue_depth() > 0:
+            return False
+        started = time.monotonic()
+        self._held = True
+        self._grants["background"] += 1
+        await self._wait_for_window()
+        self._record_wait(time.monotonic() - started)
+        return True
+
+    async def run[R](self, priority: Priority, call: Callable[[], Awaitable[R]], max_retries: int) -> R:
+        """Run an upstream call in a slot, retrying throttled attempts in newly scheduled slots.
+
+        The call raises UpstreamThrottledError for a throttling response. Each
+        retry queues again behind the callers already waiting, so it lands in
+        a slot paced by the grown interval. The error from the last attempt is
+        raised once ``max_retries`` retries are used up.
+        """
+        attempt = 0
+        while True:
+            async with self.slot(priority):
+                try:
+                    result = await call()
+                except UpstreamThrottledError as exc:
+                    self.record_throttle(exc.retry_after_seconds)
+                    if attempt >= max_retries:
+                        raise
+                    attempt += 1
+                    self._retried += 1
+                    logger.warning("Upstream throttled request, retry %d of %d: %s", attempt, max_retries, exc)
+                    continue
+                self.record_success()
+                return result
+
+    def record_throttle(self, retry_after_seconds: float | None) -> None:
+        """Grow the interval after a throttling response and hold slots back for any Retry-After delay."""
+        self._throttled += 1
+        self._consecutive_successes = 0
+        self._interval_seconds = min(self._max_interval_seconds, self._interval_seconds * self._backoff_factor)
+        if retry_after_seconds is not None:
+            self._not_before = max(self._not_before, time.monotonic() + retry_after_seconds)
+
+    def record_success(self) -> None:
+        """Count a successful request and shrink the interval after enough of them in a row."""
+        self._consecutive_successes += 1
+        if self._consecutive_successes >= self._recovery_successes:
+            self._consecutive_successes = 0
+            self._interval_seconds = max(self._min_interval_seconds, self._interval_seconds / self._backoff_factor)
+
+    async def _wait_for_window(self) -> None:
+        """Sleep until the current interval since the previous request, and any Retry-After delay, has passed.
+
+        The slot is handed on if the caller is cancelled while sleeping.
+        """
+        now = time.monotonic()
+        remaining = max(self._last_request_time + self._interval_seconds, self._not_before) - now
+        if remaining <= 0:
+            return
+        try:
+            await asyncio.sleep(remaining)
+        except BaseException:
+            self._hand_over()
+            raise
+
+    def _record_wait(self, seconds: float) -> None:
+        """Add one caller's time from asking for a slot until its window opened to the wait totals."""
+        self._wait_seconds += seconds
+        self._wait_histogram.observe(seconds)
+        record_phase("limiter", seconds)
 
     def release(self) -> None:
-        """Record current time and release the lock."""
+        """Record current time and hand the slot to the next waiter."""
         self._last_request_time = time.monotonic()
-        self._lock.release()
+        self._hand_over()
+
+    def _hand_over(self) -> None:
+        """Give the slot to the oldest waiter of the most urgent class, or free it."""
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.future.done():
+                    waiter.future.set_result(None)
+                    return
+        self._held = False
+
+    def _make_room(self, priority: Priority) -> None:
+        """Free a queue place for a caller by turning away the newest waiter of a less urgent class, or reject the caller."""
+        for queued_priority in reversed(PRIORITIES[PRIORITIES.index(priority) + 1 :]):
+            queue = self._queues[queued_priority]
+            while queue:
+                waiter = queue.pop()
+                if not waiter.future.done():
+                    waiter.future.set_exception(self._full_error(queued_priority))
+                    return
+        raise self._full_error(priority)
+
+    def _full_error(self, priority: Priority) -> RateLimiterFullError:
+        """Count a turned-away caller and build its error, estimating the wait for a caller of its class."""
+        self._rejected[priority] += 1
+        position = sum(len(self._queues[queued]) for queued in PRIORITIES[: PRIORITIES.index(priority) + 1])
+        retry_after_seconds = self._estimated_wait(position, time.monotonic())
+        return RateLimiterFullError(
+            f"rate limiter queue is full ({self.queue_depth()} waiting); retry in about {retry_after_seconds:.0f}s",
+            retry_after_seconds,
+        )
+
+    def _estimated_wait(self, position: int, now: float) -> float:
+        """Estimate the seconds until the caller at a queue position, 0 being next, gets its rate-limit window.
+
+        Requests ahead are assumed to finish as soon as their window opens,
+        so the estimate runs short when upstream responses are slow.
+        """
+        next_window = max(self._last_request_time + self._interval_seconds, self._not_before)
+        if self._held:
+            next_window = max(next_window, now + self._interval_seconds)
+        return max(0.0, next_window - now) + position * self._interval_seconds
+
+    def waiters(self) -> list[QueuedCaller]:
+        """Return the queued callers in the order they will get the slot, with their estimated remaining waits."""
+        now = time.monotonic()
+        callers: list[QueuedCaller] = []
+        for priority in PRIORITIES:
+            for waiter in self._queues[priority]:
+                if waiter.future.done():
+                    continue
+                callers.append(
+                    QueuedCaller(
+                        priority=priority,
+                        waited_seconds=now - waiter.queued_at,
+                        eta_seconds=self._estimated_wait(len(callers), now),
+                    ),
+                )
+        return callers
+
+    def queue_depth(self) -> int:
+        """Return the number of callers waiting for the slot across all classes."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def stats(self) -> dict[str, int | float]:
+        """Return queue depth, granted slots, and turned-away callers per priority class, the pacing state, and total wait."""
+        stats: dict[str, int | float] = {
+            "max_queue_depth": self._max_queue_depth,
+            "interval_seconds": self._interval_seconds,
+            "throttled": self._throttled,
+            "retried": self._retried,
+            "wait_seconds_total": self._wait_seconds,
+        }
+        for priority in PRIORITIES:
+            stats[f"{priority}_waiting"] = len(self._queues[priority])
+            stats[f"{priority}_granted"] = self._grants[priority]
+            stats[f"{priority}_rejected"] = self._rejected[priority]
+        return stats
+
+    def wait_histogram(self) -> Histogram:
+        """Return the distribution of time callers waited for a slot and its rate-limit window."""
+        return self._wait_histogram
+
+    def slot(self, priority: Priority) -> "RateLimiterSlot":
+        """Return an async context manager that holds one slot in the given priority class."""
+        return RateLimiterSlot(limiter=self, priority=priority)
+
+
+class RateLimiterSlot:
+    """Async context manager holding one rate-limiter slot for a priority class."""
+
+    def __init__(self, limiter: RateLimiter, priority: Priority) -> None:
+        """Bind the slot to its limiter and priority class."""
+        self._limiter = limiter
+        self._priority = priority
 
-    def __enter__(self) -> "RateLimiter":
-        """Context manager entry — acquire the rate limiter."""
-        self.acquire()
-        return self
+    async def __aenter__(self) -> None:
+        """Acquire the slot."""
+        await self._limiter.acquire(self._priority)
 
-    def __exit__(
+    async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Context manager exit — release the rate limiter."""
-        self.release()
+        """Release the slot."""
+        self._limiter.release()
@@ -0,0 +1,102 @@
+"""Incrementally parsed stream of an upstream search feed that is cached once complete."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+
+from arxivsmart.arxiv.parser import SearchFeedParser
+from arxivsmart.arxiv.types import Paper, SearchFeedHeader, SearchResult
+from arxivsmart.arxiv.upstream_pool import UpstreamPool
+from arxivsmart.cache.search import SearchCache, SearchKey
+
+
+class SearchFeedStream:
+    """Yields the feed header and then each paper as its entry is parsed from the upstream body.
+
+    A background task reads and parses the upstream body as fast as arXiv
+    sends it and queues the parsed items, so the response and its pool
+    permit are released once the page has arrived, however slowly the
+    client reads. A slow consumer holds at most one page of parsed papers,
+    never the API connection. A feed read to the end is stored in the
+    search cache. Closing the stream stops a read still in progress;
+    the permit is released exactly once, including when the stream is
+    closed without ever being iterated.
+    """
+
+    def __init__(self, key: SearchKey, response: httpx.Response, search_cache: SearchCache, pool: UpstreamPool) -> None:
+        """Start reading an open streaming response whose status has already been checked and whose pool permit is held."""
+        self._key = key
+        self._response = response
+        self._search_cache = search_cache
+        self._pool = pool
+        self._released = False
+        # Parsed items in feed order, then None once the feed is complete or the exception that ended it.
+        self._items: asyncio.Queue[SearchFeedHeader | Paper | Exception | None] = asyncio.Queue()
+        self._reader = asyncio.create_task(self._read_upstream())
+
+    async def __aiter__(self) -> AsyncIterator[SearchFeedHeader | Paper]:
+        """Yield parsed feed items as the reader queues them."""
+        try:
+            while True:
+                item = await self._items.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop reading upstream if the page has not fully arrived, and release the response and pool permit."""
+        if not self._reader.done():
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+        await self._release()
+
+    async def _read_upstream(self) -> None:
+        """Read and parse the whole body, queueing each item, then release the permit and cache the page."""
+        parser = SearchFeedParser()
+        header: SearchFeedHeader | None = None
+        papers: list[Paper] = []
+        try:
+            async for chunk in self._response.aiter_bytes():
+                self._pool.record_bytes(len(chunk))
+                for item in parser.feed(chunk):
+                    if isinstance(item, SearchFeedHeader):
+                        header = item
+                    else:
+                        papers.append(item)
+                    self._items.put_nowait(item)
+            for item in parser.close():
+                if isinstance(item, SearchFeedHeader):
+                    header = item
+                self._items.put_nowait(item)
+        except Exception as exc:
+            self._items.put_nowait(exc)
+            return
+        finally:
+            await self._release()
+
+        if header is not None:
+            self._search_cache.put(
+                self._key,
+                SearchResult(
+                    total_results=header.total_results,
+                    start_index=header.start_index,
+                    items_per_page=header.items_per_page,
+                    papers=tuple(papers),
+                ),
+            )
+        self._items.put_nowait(None)
+
+    async def _release(self) -> None:
+        """Close the upstream response and return its pool permit exactly once."""
+        if self._released:
+            return
+        self._released = True
+        try:
+            await self._response.aclose()
+        finally:
+            self._pool.release()
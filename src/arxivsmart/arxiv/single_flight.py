@@ -0,0 +1,72 @@
+"""Request coalescing for identical in-flight upstream calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight[K: Hashable, V]:
+    """Collapses concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running await the same future and receive its result or
+    exception. Once the call finishes the key is forgotten, so later callers
+    start a fresh execution.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[K, asyncio.Future[V]] = {}
+        self._executions = 0
+        self._merged = 0
+
+    async def do(self, key: K, function: Callable[[], Awaitable[V]]) -> V:
+        """Run the function for a key, or wait for the identical call already running."""
+        in_flight = self.claim(key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        try:
+            result = await function()
+        except Exception as exc:
+            self.fail(key, exc)
+            raise
+        except asyncio.CancelledError:
+            self.fail(key, RuntimeError("upstream call was cancelled"))
+            raise
+
+        self.resolve(key, result)
+        return result
+
+    def claim(self, key: K) -> asyncio.Future[V] | None:
+        """Become the leader for a key, or get the future of the call already running.
+
+        Returns None when the caller is now the leader and must later call
+        ``resolve`` or ``fail``. Used directly when the leader's work outlives
+        a single function call, such as a streamed download. Followers should
+        await the future through ``asyncio.shield`` so their own cancellation
+        does not cancel it for everyone.
+        """
+        in_flight = self._calls.get(key)
+        if in_flight is not None:
+            self._merged += 1
+            return in_flight
+
+        self._calls[key] = asyncio.get_running_loop().create_future()
+        self._executions += 1
+        return None
+
+    def resolve(self, key: K, result: V) -> None:
+        """Finish the leader's call for a key and hand the result to every merged caller."""
+        self._calls.pop(key).set_result(result)
+
+    def fail(self, key: K, exc: Exception) -> None:
+        """Finish the leader's call for a key and raise the exception in every merged caller."""
+        future = self._calls.pop(key)
+        future.set_exception(exc)
+        # The leader already raises exc itself; mark it retrieved so a call
+        # nobody merged into does not log "exception was never retrieved".
+        future.exception()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return how many upstream executions ran and how many callers were merged into them."""
+        return {"executions": self._executions, "merged": self._merged, "in_flight": len(self._calls)}
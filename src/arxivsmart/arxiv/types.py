@@ -1,9 +1,14 @@
-"""Domain dataclasses for arXiv paper metadata."""
+"""Domain dataclasses for arXiv paper metadata.
+
+The types are slotted and hold tuples, so a large cached result set costs
+no per-instance ``__dict__`` and no list over-allocation. Parsers intern
+category strings, so every paper in ``cs.LG`` points at the same string.
+"""
 
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Author:
     """An arXiv paper author."""
 
@@ -11,15 +16,15 @@ class Author:
     affiliation: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Paper:
     """Full metadata for an arXiv paper."""
 
     arxiv_id: str
     title: str
     summary: str
-    authors: list["Author"]
-    categories: list[str]
+    authors: tuple[Author, ...]
+    categories: tuple[str, ...]
     primary_category: str
     published: str
     updated: str
@@ -30,11 +35,20 @@ class Paper:
     journal_ref: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class SearchFeedHeader:
+    """Result counts from the head of an arXiv search feed."""
+
+    total_results: int
+    start_index: int
+    items_per_page: int
+
+
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """Result set from an arXiv search query."""
 
     total_results: int
     start_index: int
     items_per_page: int
-    papers: list[Paper]
+    papers: tuple[Paper, ...]
@@ -0,0 +1,154 @@
+"""Per-upstream concurrency limits and worker threads."""
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+
+from arxivsmart.metrics import LATENCY_BUCKETS_SECONDS, Histogram
+from arxivsmart.server_timing import record_phase
+
+
+class UpstreamPool:
+    """Bounds concurrent requests to one upstream host and owns the threads for its CPU-bound follow-up work.
+
+    Each host (the export API, the PDF server, ar5iv) gets its own pool, so a
+    backlog on one host never delays requests to another: permits and worker
+    threads are not shared. Saturation is tracked per pool, along with the
+    upstream's response times, statuses, and bytes received, and how long
+    each kind of worker task takes. Permit waits, upstream responses, and
+    worker tasks are also recorded as phases of the current request's
+    Server-Timing.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, workers: int) -> None:
+        """Initialize with the number of concurrent upstream requests and worker threads allowed."""
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+
+        self._max_concurrency = max_concurrency
+        self._workers = workers
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"arxivsmart-{name}")
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._waiting = 0
+        self._acquired = 0
+        self._saturated = 0
+        self._wait_seconds = 0.0
+        self._worker_tasks = 0
+        self._peak_worker_tasks = 0
+        self._response_histogram = Histogram(LATENCY_BUCKETS_SECONDS)
+        self._response_statuses: Counter[str] = Counter()
+        self._bytes_received = 0
+        self._task_histograms: dict[str, Histogram] = {}
+
+    async def acquire(self) -> None:
+        """Wait for a free request permit."""
+        saturated = self._semaphore.locked()
+        if saturated:
+            self._saturated += 1
+        self._waiting += 1
+        started = time.monotonic()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+            waited = time.monotonic() - started
+            self._wait_seconds += waited
+            if saturated:
+                record_phase("pool", waited)
+        self._acquired += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def release(self) -> None:
+        """Return a request permit."""
+        self._in_flight -= 1
+        self._semaphore.release()
+
+    def slot(self) -> "UpstreamPoolSlot":
+        """Return an async context manager that holds one request permit."""
+        return UpstreamPoolSlot(pool=self)
+
+    async def run_in_worker[R](self, task: str, function: Callable[[], R]) -> R:
+        """Run a blocking function on this pool's worker threads, timing it under the given task name."""
+        self._worker_tasks += 1
+        self._peak_worker_tasks = max(self._peak_worker_tasks, self._worker_tasks)
+        started = time.monotonic()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function)
+        finally:
+            self._worker_tasks -= 1
+            if task not in self._task_histograms:
+                self._task_histograms[task] = Histogram(LATENCY_BUCKETS_SECONDS)
+            elapsed = time.monotonic() - started
+            self._task_histograms[task].observe(elapsed)
+            record_phase(task, elapsed)
+
+    def record_response(self, status: str, seconds: float) -> None:
+        """Count an upstream response, or ``error`` for a request that failed, and the time it took to arrive."""
+        self._response_statuses[status] += 1
+        self._response_histogram.observe(seconds)
+        record_phase("upstream", seconds)
+
+    def record_bytes(self, count: int) -> None:
+        """Count body bytes received from the upstream."""
+        self._bytes_received += count
+
+    def response_histogram(self) -> Histogram:
+        """Return the distribution of upstream response times."""
+        return self._response_histogram
+
+    def response_statuses(self) -> dict[str, int]:
+        """Return the number of upstream responses per status code, with failed requests under ``error``."""
+        return dict(self._response_statuses)
+
+    def task_histograms(self) -> dict[str, Histogram]:
+        """Return the distribution of worker task durations per task name."""
+        return self._task_histograms
+
+    def close(self) -> None:
+        """Stop the worker threads, dropping work that has not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, int | float]:
+        """Return permit usage, how often callers found the pool saturated, worker thread load, and bytes received."""
+        return {
+            "max_concurrency": self._max_concurrency,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "waiting": self._waiting,
+            "acquired": self._acquired,
+            "saturated": self._saturated,
+            "wait_seconds_total": self._wait_seconds,
+            "workers": self._workers,
+            "worker_tasks": self._worker_tasks,
+            "peak_worker_tasks": self._peak_worker_tasks,
+            "bytes_received": self._bytes_received,
+        }
+
+
+class UpstreamPoolSlot:
+    """Async context manager holding one upstream pool permit."""
+
+    def __init__(self, pool: UpstreamPool) -> None:
+        """Bind the slot to its pool."""
+        self._pool = pool
+
+    async def __aenter__(self) -> None:
+        """Acquire the permit."""
+        await self._pool.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the permit."""
+        self._pool.release()
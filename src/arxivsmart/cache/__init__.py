@@ -0,0 +1 @@
+"""Local caches for arXiv metadata and content."""
@@ -0,0 +1,289 @@
+"""Content-addressed on-disk store for downloaded documents."""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from arxivsmart.arxiv.ids import is_versioned_id
+
+
+@dataclass(frozen=True)
+class BlobValidators:
+    """HTTP cache validators the upstream sent with a stored document."""
+
+    etag: str | None
+    last_modified: str | None
+
+
+@dataclass(frozen=True)
+class ExpiredBlob:
+    """A stored document whose key has expired, with the validators needed to revalidate it."""
+
+    path: Path
+    validators: BlobValidators
+
+
+class BlobWriter:
+    """Streams one document into a temporary file while hashing it."""
+
+    def __init__(self, store: "BlobStore", temp_path: Path) -> None:
+        """Open the temporary file that receives the document bytes."""
+        self._store = store
+        self._temp_path = temp_path
+        self._file = temp_path.open("wb")
+        self._hasher = hashlib.sha256()
+        self._size = 0
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk of document bytes."""
+        self._file.write(chunk)
+        self._hasher.update(chunk)
+        self._size += len(chunk)
+
+    def commit(self, key: str, validators: BlobValidators) -> Path:
+        """Move the finished document into the store under the given key and return its path."""
+        self._file.close()
+        return self._store.commit(
+            key=key,
+            temp_path=self._temp_path,
+            digest=self._hasher.hexdigest(),
+            size=self._size,
+            validators=validators,
+        )
+
+    def abort(self) -> None:
+        """Discard the partially written document."""
+        self._file.close()
+        self._temp_path.unlink(missing_ok=True)
+
+
+class BlobStore:
+    """Stores documents once per content hash and maps arXiv IDs onto them.
+
+    Versioned IDs never expire; unversioned IDs expire after a TTL because
+    they resolve to whatever version is current. The total size of stored
+    objects is kept under a byte budget by evicting the least recently used.
+    The upstream's ETag and Last-Modified are kept with each key, so an
+    expired document that is still on disk can be revalidated with a
+    conditional request instead of downloaded again. The object count and
+    total size are kept in memory, so ``stats()`` never scans the index.
+    Access times of hits are also kept in memory and written with the next
+    commit, which is the only place they are read, so a hit writes nothing.
+    """
+
+    def __init__(self, directory: Path, suffix: str, max_bytes: int, unversioned_ttl_seconds: float) -> None:
+        """Create the store directories and open the index database."""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+        if unversioned_ttl_seconds <= 0.0:
+            raise ValueError("unversioned_ttl_seconds must be greater than 0")
+
+        self._objects_directory = directory / "objects"
+        self._temp_directory = directory / "tmp"
+        self._objects_directory.mkdir(parents=True, exist_ok=True)
+        self._temp_directory.mkdir(parents=True, exist_ok=True)
+        self._suffix = suffix
+        self._max_bytes = max_bytes
+        self._unversioned_ttl_seconds = unversioned_ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(directory / "index.sqlite3"), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS refs (key TEXT PRIMARY KEY, digest TEXT NOT NULL, expires_at REAL, etag TEXT, last_modified TEXT)",
+        )
+        self._add_validator_columns()
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS objects (digest TEXT PRIMARY KEY, size INTEGER NOT NULL, last_access REAL NOT NULL)",
+        )
+        self._connection.commit()
+        totals: tuple[int, int | None] = self._connection.execute("SELECT COUNT(*), SUM(size) FROM objects").fetchone()
+        self._objects = totals[0]
+        self._stored_bytes = 0
+        if totals[1] is not None:
+            self._stored_bytes = totals[1]
+        self._accessed: dict[str, float] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._revalidations = 0
+
+    def close(self) -> None:
+        """Write pending access times and close the index database connection."""
+        with self._lock:
+            self._flush_accesses()
+            self._connection.commit()
+            self._connection.close()
+
+    def lookup(self, key: str) -> Path | None:
+        """Return the stored file for a key and mark it as recently used, or None on a miss."""
+        with self._lock:
+            row: tuple[str, float | None] | None = self._connection.execute(
+                "SELECT digest, expires_at FROM refs WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= time.time()):
+                self._misses += 1
+                return None
+
+            path = self._object_path(row[0])
+            if not path.exists():
+                size_row: tuple[int] | None = self._connection.execute("SELECT size FROM objects WHERE digest = ?", (row[0],)).fetchone()
+                if size_row is not None:
+                    self._forget_object(row[0], size_row[0])
+                else:
+                    self._connection.execute("DELETE FROM refs WHERE digest = ?", (row[0],))
+                self._connection.commit()
+                self._misses += 1
+                return None
+
+            self._accessed[row[0]] = time.time()
+            self._hits += 1
+            return path
+
+    def lookup_expired(self, key: str) -> ExpiredBlob | None:
+        """Return an expired key's document and validators when the document is still on disk and can be revalidated."""
+        with self._lock:
+            row: tuple[str, float | None, str | None, str | None] | None = self._connection.execute(
+                "SELECT digest, expires_at, etag, last_modified FROM refs WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None or row[1] is None or row[1] > time.time():
+            return None
+        if row[2] is None and row[3] is None:
+            return None
+
+        path = self._object_path(row[0])
+        if not path.exists():
+            return None
+        return ExpiredBlob(path=path, validators=BlobValidators(etag=row[2], last_modified=row[3]))
+
+    def renew(self, key: str, validators: BlobValidators) -> Path | None:
+        """Restart an expired key's TTL after the upstream confirmed the stored document is current.
+
+        Returns the stored file, or None when it was evicted in the meantime.
+        """
+        with self._lock:
+            row: tuple[str] | None = self._connection.execute("SELECT digest FROM refs WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            path = self._object_path(row[0])
+            if not path.exists():
+                return None
+
+            self._connection.execute(
+                "UPDATE refs SET expires_at = ?, etag = ?, last_modified = ? WHERE key = ?",
+                (self._expires_at(key), validators.etag, validators.last_modified, key),
+            )
+            self._connection.commit()
+            self._accessed[row[0]] = time.time()
+            self._revalidations += 1
+            return path
+
+    def open_writer(self) -> BlobWriter:
+        """Start writing a new document into a temporary file."""
+        file_descriptor, temp_name = tempfile.mkstemp(dir=self._temp_directory, suffix=self._suffix)
+        os.close(file_descriptor)
+        return BlobWriter(store=self, temp_path=Path(temp_name))
+
+    def commit(self, key: str, temp_path: Path, digest: str, size: int, validators: BlobValidators) -> Path:
+        """Register a fully written temporary file under its content hash, then enforce the byte budget."""
+        path = self._object_path(digest)
+        with self._lock:
+            if path.exists():
+                temp_path.unlink()
+            else:
+                temp_path.replace(path)
+
+            size_row: tuple[int] | None = self._connection.execute("SELECT size FROM objects WHERE digest = ?", (digest,)).fetchone()
+            if size_row is None:
+                self._objects += 1
+                self._stored_bytes += size
+            else:
+                self._stored_bytes += size - size_row[0]
+            self._flush_accesses()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO objects (digest, size, last_access) VALUES (?, ?, ?)",
+                (digest, size, time.time()),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO refs (key, digest, expires_at, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+                (key, digest, self._expires_at(key), validators.etag, validators.last_modified),
+            )
+            self._evict_over_budget(protected_digest=digest)
+            self._connection.commit()
+
+        return path
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss/eviction/revalidation counters and current object count and size."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "revalidations": self._revalidations,
+            "entries": self._objects,
+            "bytes": self._stored_bytes,
+            "max_bytes": self._max_bytes,
+        }
+
+    def _evict_over_budget(self, protected_digest: str) -> None:
+        """Delete least recently used objects until the total size fits the budget.
+
+        The object that was just committed is never evicted, so a document
+        larger than the whole budget is still served once.
+        """
+        if self._stored_bytes <= self._max_bytes:
+            return
+
+        rows: list[tuple[str, int]] = self._connection.execute(
+            "SELECT digest, size FROM objects ORDER BY last_access ASC",
+        ).fetchall()
+        for digest, size in rows:
+            if self._stored_bytes <= self._max_bytes:
+                break
+            if digest == protected_digest:
+                continue
+            self._object_path(digest).unlink(missing_ok=True)
+            self._forget_object(digest, size)
+            self._evictions += 1
+
+    def _forget_object(self, digest: str, size: int) -> None:
+        """Delete an object and every key pointing at it from the index, and drop it from the running totals."""
+        self._connection.execute("DELETE FROM refs WHERE digest = ?", (digest,))
+        self._connection.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+        self._accessed.pop(digest, None)
+        self._objects -= 1
+        self._stored_bytes -= size
+
+    def _flush_accesses(self) -> None:
+        """Write the access times recorded since the last flush into the current transaction."""
+        if not self._accessed:
+            return
+        self._connection.executemany(
+            "UPDATE objects SET last_access = ? WHERE digest = ?",
+            [(accessed_at, digest) for digest, accessed_at in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _add_validator_columns(self) -> None:
+        """Add the validator columns to an index created before they existed."""
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(refs)").fetchall()}
+        if "etag" not in columns:
+            self._connection.execute("ALTER TABLE refs ADD COLUMN etag TEXT")
+        if "last_modified" not in columns:
+            self._connection.execute("ALTER TABLE refs ADD COLUMN last_modified TEXT")
+
+    def _object_path(self, digest: str) -> Path:
+        """Return the on-disk path for a content hash."""
+        return self._objects_directory / f"{digest}{self._suffix}"
+
+    def _expires_at(self, key: str) -> float | None:
+        """Return the expiry timestamp for a key, or None for immutable versioned IDs."""
+        if is_versioned_id(key):
+            return None
+        return time.time() + self._unversioned_ttl_seconds
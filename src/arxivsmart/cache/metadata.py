@@ -0,0 +1,109 @@
+"""Persistent SQLite cache for parsed arXiv paper metadata."""
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from arxivsmart.arxiv.ids import is_versioned_id
+from arxivsmart.arxiv.types import Author, Paper
+
+
+class MetadataCache:
+    """On-disk store of paper metadata keyed by the requested arXiv ID.
+
+    Versioned IDs are immutable on arXiv and never expire. Unversioned IDs
+    resolve to whatever version is current, so they expire after a TTL.
+    The entry count is kept in memory, so ``stats()`` never scans the table.
+    """
+
+    def __init__(self, database_path: Path, unversioned_ttl_seconds: float) -> None:
+        """Open (or create) the cache database at the given path."""
+        if unversioned_ttl_seconds <= 0.0:
+            raise ValueError("unversioned_ttl_seconds must be greater than 0")
+
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._unversioned_ttl_seconds = unversioned_ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(database_path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS papers (arxiv_id TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL)",
+        )
+        self._connection.commit()
+        count_row: tuple[int] = self._connection.execute("SELECT COUNT(*) FROM papers").fetchone()
+        self._entries = count_row[0]
+        self._hits = 0
+        self._misses = 0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, arxiv_id: str) -> Paper | None:
+        """Return the cached paper for an ID, or None when absent or expired."""
+        with self._lock:
+            row: tuple[str, float | None] | None = self._connection.execute(
+                "SELECT payload, expires_at FROM papers WHERE arxiv_id = ?",
+                (arxiv_id,),
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= time.time()):
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        return _decode_paper(row[0])
+
+    def put(self, arxiv_id: str, paper: Paper) -> None:
+        """Store a paper under the requested ID and under its resolved versioned ID."""
+        payload = json.dumps(asdict(paper))
+        rows = [(arxiv_id, payload, self._expires_at(arxiv_id))]
+        if paper.arxiv_id != arxiv_id:
+            rows.append((paper.arxiv_id, payload, self._expires_at(paper.arxiv_id)))
+
+        with self._lock:
+            for row in rows:
+                known: tuple[int] | None = self._connection.execute("SELECT 1 FROM papers WHERE arxiv_id = ?", (row[0],)).fetchone()
+                if known is None:
+                    self._entries += 1
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO papers (arxiv_id, payload, expires_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters and the number of stored entries."""
+        return {"hits": self._hits, "misses": self._misses, "entries": self._entries}
+
+    def _expires_at(self, arxiv_id: str) -> float | None:
+        """Return the expiry timestamp for an ID, or None for immutable versioned IDs."""
+        if is_versioned_id(arxiv_id):
+            return None
+        return time.time() + self._unversioned_ttl_seconds
+
+
+def _decode_paper(payload: str) -> Paper:
+    """Rebuild a Paper from its stored JSON payload."""
+    data: dict[str, Any] = json.loads(payload)
+    authors = tuple(Author(name=author["name"], affiliation=author["affiliation"]) for author in data["authors"])
+    return Paper(
+        arxiv_id=data["arxiv_id"],
+        title=data["title"],
+        summary=data["summary"],
+        authors=authors,
+        categories=tuple(sys.intern(category) for category in data["categories"]),
+        primary_category=sys.intern(data["primary_category"]),
+        published=data["published"],
+        updated=data["updated"],
+        pdf_url=data["pdf_url"],
+        abstract_url=data["abstract_url"],
+        doi=data["doi"],
+        comment=data["comment"],
+        journal_ref=data["journal_ref"],
+    )
@@ -0,0 +1,134 @@
+"""In-memory TTL cache for search results with stale-while-revalidate."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from arxivsmart.arxiv.types import SearchResult
+from arxivsmart.memory import approximate_size
+
+
+@dataclass(frozen=True)
+class SearchKey:
+    """Cache key for one search request, built from the canonical query.
+
+    ``upstream_query`` is the query as the caller wrote it. It is what arXiv
+    is sent and takes no part in equality, so spellings that canonicalize
+    alike share one entry.
+    """
+
+    query: str
+    upstream_query: str = field(compare=False)
+    start: int
+    max_results: int
+    sort_by: str
+    sort_order: str
+
+
+@dataclass(frozen=True)
+class SearchLookup:
+    """A cached search result and whether it is past its soft TTL."""
+
+    result: SearchResult
+    is_stale: bool
+
+
+@dataclass(frozen=True)
+class _SearchEntry:
+    """A stored search result and the monotonic time it was stored."""
+
+    result: SearchResult
+    stored_at: float
+
+
+class SearchCache:
+    """Bounded LRU cache of search results.
+
+    Entries younger than the soft TTL are fresh. Entries between the soft
+    and hard TTL are returned as stale so the caller can serve them while
+    refreshing in the background. Entries older than the hard TTL are misses.
+    """
+
+    def __init__(self, soft_ttl_seconds: float, hard_ttl_seconds: float, max_entries: int) -> None:
+        """Initialize an empty cache with explicit TTLs and capacity."""
+        if soft_ttl_seconds <= 0.0:
+            raise ValueError("soft_ttl_seconds must be greater than 0")
+        if hard_ttl_seconds < soft_ttl_seconds:
+            raise ValueError("hard_ttl_seconds must be greater than or equal to soft_ttl_seconds")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+
+        self._soft_ttl_seconds = soft_ttl_seconds
+        self._hard_ttl_seconds = hard_ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[SearchKey, _SearchEntry] = OrderedDict()
+        self._refreshing: set[SearchKey] = set()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refreshes = 0
+
+    def get(self, key: SearchKey) -> SearchLookup | None:
+        """Return the cached result for a key, or None when absent or past the hard TTL."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry.stored_at > self._hard_ttl_seconds:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            is_stale = now - entry.stored_at > self._soft_ttl_seconds
+            if is_stale:
+                self._stale_hits += 1
+            else:
+                self._hits += 1
+            return SearchLookup(result=entry.result, is_stale=is_stale)
+
+    def put(self, key: SearchKey, result: SearchResult) -> None:
+        """Store a fresh result, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = _SearchEntry(result=result, stored_at=time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def begin_refresh(self, key: SearchKey) -> bool:
+        """Claim the background refresh of a key; False when one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: SearchKey, refreshed: bool) -> None:
+        """Release the refresh claim on a key, counting it when new data was stored."""
+        with self._lock:
+            self._refreshing.discard(key)
+            if refreshed:
+                self._refreshes += 1
+
+    def memory_bytes(self) -> int:
+        """Measure the approximate memory held by the stored entries.
+
+        Entries are immutable, so they are walked outside the lock; a string
+        or paper shared by several entries, such as overlapping windows, is
+        counted once. The walk visits every stored object, so it is meant for
+        occasional diagnostics rather than every request.
+        """
+        with self._lock:
+            entries = dict(self._entries)
+        return approximate_size(entries)
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss/refresh counters and the number of stored entries."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "refreshes": self._refreshes,
+                "entries": len(self._entries),
+            }
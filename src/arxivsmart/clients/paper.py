@@ -16,6 +16,29 @@ class PaperClient(BaseClient):
         data = self._request(method="GET", path=f"/v1/paper/{arxiv_id}", payload=None, require_healthy=True)
         return _parse_paper_detail(data)
 
+    def get_papers(self, arxiv_ids: list[str]) -> list[Paper | None]:
+        """Get metadata for many papers in request order, with None for IDs that were not found."""
+        payload: dict[str, object] = {"arxiv_ids": arxiv_ids}
+        data = self._request(method="POST", path="/v1/papers", payload=payload, require_healthy=True)
+
+        raw_results = data["papers"]
+        if not isinstance(raw_results, list):
+            raise RuntimeError("papers must be a list")
+
+        papers: list[Paper | None] = []
+        for raw_result in cast(list[object], raw_results):
+            if not isinstance(raw_result, dict):
+                raise RuntimeError("each paper result must be an object")
+            result = cast(dict[str, object], raw_result)
+            raw_paper = result["paper"]
+            if raw_paper is None:
+                papers.append(None)
+            elif isinstance(raw_paper, dict):
+                papers.append(_parse_paper_detail(cast(dict[str, object], raw_paper)))
+            else:
+                raise RuntimeError("paper must be an object or null")
+        return papers
+
     def download_pdf(self, arxiv_id: str) -> bytes:
         """Download PDF bytes for a paper."""
         self._ensure_healthy()
@@ -46,7 +69,7 @@ def _require_str(data: dict[str, object], key: str) -> str:
     return value
 
 
-def _require_str_list(data: dict[str, object], key: str) -> list[str]:
+def _require_str_list(data: dict[str, object], key: str) -> tuple[str, ...]:
     """Extract and validate a required list of strings from a data dict."""
     raw = data[key]
     if not isinstance(raw, list):
@@ -56,10 +79,10 @@ def _require_str_list(data: dict[str, object], key: str) -> list[str]:
         if not isinstance(item, str):
             raise RuntimeError(f"{key} items must be strings")
         result.append(item)
-    return result
+    return tuple(result)
 
 
-def _parse_authors(data: dict[str, object]) -> list[Author]:
+def _parse_authors(data: dict[str, object]) -> tuple[Author, ...]:
     """Parse author detail objects from response data."""
     raw_authors = data["authors"]
     if not isinstance(raw_authors, list):
@@ -77,7 +100,7 @@ def _parse_authors(data: dict[str, object]) -> list[Author]:
         if not isinstance(affiliation, str):
             raise RuntimeError("author affiliation must be a string")
         authors.append(Author(name=name, affiliation=affiliation))
-    return authors
+    return tuple(authors)
 
 
 def _parse_paper_detail(data: dict[str, object]) -> Paper:
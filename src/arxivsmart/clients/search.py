@@ -45,7 +45,7 @@ def _require_int(data: dict[str, object], key: str) -> int:
     return value
 
 
-def _parse_authors_summary(data: dict[str, object]) -> list[Author]:
+def _parse_authors_summary(data: dict[str, object]) -> tuple[Author, ...]:
     """Parse author name strings from search response summary."""
     raw_authors = data["authors"]
     if not isinstance(raw_authors, list):
@@ -56,7 +56,7 @@ def _parse_authors_summary(data: dict[str, object]) -> list[Author]:
         if not isinstance(raw_author, str):
             raise RuntimeError("author name must be a string")
         authors.append(Author(name=raw_author, affiliation=""))
-    return authors
+    return tuple(authors)
 
 
 def _parse_search_result(data: dict[str, object]) -> SearchResult:
@@ -75,7 +75,7 @@ def _parse_search_result(data: dict[str, object]) -> SearchResult:
         total_results=_require_int(data, "total_results"),
         start_index=_require_int(data, "start_index"),
         items_per_page=_require_int(data, "items_per_page"),
-        papers=papers,
+        papers=tuple(papers),
     )
 
 
@@ -86,7 +86,7 @@ def _parse_paper_summary(data: dict[str, object]) -> Paper:
         title=_require_str(data, "title"),
         summary=_require_str(data, "summary"),
         authors=_parse_authors_summary(data),
-        categories=[],
+        categories=(),
         primary_category=_require_str(data, "primary_category"),
         published=_require_str(data, "published"),
         updated=_require_str(data, "updated"),
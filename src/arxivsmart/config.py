@@ -1,5 +1,6 @@
 """Configuration models and loader for arxivsmart."""
 
+from importlib.util import find_spec
 from pathlib import Path
 
 import yaml
@@ -52,8 +53,26 @@ class ArxivConfig(BaseModel):
     pdf_base_url: str
     html_base_url: str
     rate_limit_seconds: float
+    rate_limit_max_seconds: float
+    rate_limit_backoff_factor: float
+    rate_limit_recovery_successes: int
+    api_max_queue_depth: int
+    pdf_max_queue_depth: int
+    throttle_max_retries: int
     request_timeout_seconds: float
     max_results_limit: int
+    id_list_batch_size: int
+    api_max_concurrency: int
+    api_workers: int
+    pdf_max_concurrency: int
+    pdf_workers: int
+    html_max_concurrency: int
+    html_workers: int
+    keepalive_expiry_seconds: float
+    api_http2: bool
+    pdf_http2: bool
+    html_http2: bool
+    warm_up_connections: bool
 
     @field_validator("base_url")
     @classmethod
@@ -87,6 +106,54 @@ class ArxivConfig(BaseModel):
             raise ValueError("arxiv.rate_limit_seconds must be greater than 0")
         return value
 
+    @field_validator("rate_limit_max_seconds")
+    @classmethod
+    def validate_rate_limit_max_seconds(cls, value: float) -> float:
+        """Ensure the throttled rate limit ceiling is strictly positive."""
+        if value <= 0.0:
+            raise ValueError("arxiv.rate_limit_max_seconds must be greater than 0")
+        return value
+
+    @field_validator("rate_limit_backoff_factor")
+    @classmethod
+    def validate_rate_limit_backoff_factor(cls, value: float) -> float:
+        """Ensure throttling actually grows the interval."""
+        if value <= 1.0:
+            raise ValueError("arxiv.rate_limit_backoff_factor must be greater than 1")
+        return value
+
+    @field_validator("rate_limit_recovery_successes")
+    @classmethod
+    def validate_rate_limit_recovery_successes(cls, value: int) -> int:
+        """Ensure the recovery streak length is strictly positive."""
+        if value <= 0:
+            raise ValueError("arxiv.rate_limit_recovery_successes must be greater than 0")
+        return value
+
+    @field_validator("api_max_queue_depth")
+    @classmethod
+    def validate_api_max_queue_depth(cls, value: int) -> int:
+        """Ensure the API limiter admits at least one queued caller."""
+        if value <= 0:
+            raise ValueError("arxiv.api_max_queue_depth must be greater than 0")
+        return value
+
+    @field_validator("pdf_max_queue_depth")
+    @classmethod
+    def validate_pdf_max_queue_depth(cls, value: int) -> int:
+        """Ensure the PDF limiter admits at least one queued caller."""
+        if value <= 0:
+            raise ValueError("arxiv.pdf_max_queue_depth must be greater than 0")
+        return value
+
+    @field_validator("throttle_max_retries")
+    @classmethod
+    def validate_throttle_max_retries(cls, value: int) -> int:
+        """Ensure the retry budget is not negative."""
+        if value < 0:
+            raise ValueError("arxiv.throttle_max_retries must be greater than or equal to 0")
+        return value
+
     @field_validator("request_timeout_seconds")
     @classmethod
     def validate_request_timeout_seconds(cls, value: float) -> float:
@@ -103,6 +170,194 @@ class ArxivConfig(BaseModel):
             raise ValueError("arxiv.max_results_limit must be greater than 0")
         return value
 
+    @field_validator("id_list_batch_size")
+    @classmethod
+    def validate_id_list_batch_size(cls, value: int) -> int:
+        """Ensure id_list batch size is strictly positive."""
+        if value <= 0:
+            raise ValueError("arxiv.id_list_batch_size must be greater than 0")
+        return value
+
+    @field_validator("api_max_concurrency")
+    @classmethod
+    def validate_api_max_concurrency(cls, value: int) -> int:
+        """Ensure API request concurrency is strictly positive."""
+        if value <= 0:
+            raise ValueError("arxiv.api_max_concurrency must be greater than 0")
+        return value
+
+    @field_validator("api_workers")
+    @classmethod
+    def validate_api_workers(cls, value: int) -> int:
+        """Ensure API worker thread count is strictly positive."""
+        if value <= 0:
+            raise ValueError("arxiv.api_workers must be greater than 0")
+        return value
+
+    @field_validator("pdf_max_concurrency")
+    @classmethod
+    def validate_pdf_max_concurrency(cls, value: int) -> int:
+        """Ensure PDF request concurrency is strictly positive."""
+        if value <= 0:
+            raise ValueError("arxiv.pdf_max_concurrency must be greater than 0")
+        return value
+
+    @field_validator("pdf_workers")
+    @classmethod
+    def validate_pdf_workers(cls, value: int) -> int:
+        """Ensure PDF worker thread count is strictly positive."""
+        if value <= 0:
+            raise ValueError("arxiv.pdf_workers must be greater than 0")
+        return value
+
+    @field_validator("html_max_concurrency")
+    @classmethod
+    def validate_html_max_concurrency(cls, value: int) -> int:
+        """Ensure HTML request concurrency is strictly positive."""
+        if value <= 0:
+            raise ValueError("arxiv.html_max_concurrency must be greater than 0")
+        return value
+
+    @field_validator("html_workers")
+    @classmethod
+    def validate_html_workers(cls, value: int) -> int:
+        """Ensure HTML worker thread count is strictly positive."""
+        if value <= 0:
+            raise ValueError("arxiv.html_workers must be greater than 0")
+        return value
+
+    @field_validator("keepalive_expiry_seconds")
+    @classmethod
+    def validate_keepalive_expiry_seconds(cls, value: float) -> float:
+        """Ensure idle connection lifetime is strictly positive."""
+        if value <= 0.0:
+            raise ValueError("arxiv.keepalive_expiry_seconds must be greater than 0")
+        return value
+
+
+class CacheConfig(BaseModel):
+    """Local cache settings."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    directory: str
+    metadata_unversioned_ttl_seconds: float
+    pdf_max_bytes: int
+    pdf_unversioned_ttl_seconds: float
+    html_max_bytes: int
+    html_unversioned_ttl_seconds: float
+    search_soft_ttl_seconds: float
+    search_hard_ttl_seconds: float
+    search_max_entries: int
+    search_overfetch_window: int | None
+
+    @field_validator("directory")
+    @classmethod
+    def validate_directory(cls, value: str) -> str:
+        """Ensure cache directory is non-empty text."""
+        if value.strip() == "":
+            raise ValueError("cache.directory must not be empty")
+        return value
+
+    @field_validator("metadata_unversioned_ttl_seconds")
+    @classmethod
+    def validate_metadata_unversioned_ttl_seconds(cls, value: float) -> float:
+        """Ensure unversioned metadata TTL is strictly positive."""
+        if value <= 0.0:
+            raise ValueError("cache.metadata_unversioned_ttl_seconds must be greater than 0")
+        return value
+
+    @field_validator("pdf_max_bytes")
+    @classmethod
+    def validate_pdf_max_bytes(cls, value: int) -> int:
+        """Ensure PDF byte budget is strictly positive."""
+        if value <= 0:
+            raise ValueError("cache.pdf_max_bytes must be greater than 0")
+        return value
+
+    @field_validator("pdf_unversioned_ttl_seconds")
+    @classmethod
+    def validate_pdf_unversioned_ttl_seconds(cls, value: float) -> float:
+        """Ensure unversioned PDF TTL is strictly positive."""
+        if value <= 0.0:
+            raise ValueError("cache.pdf_unversioned_ttl_seconds must be greater than 0")
+        return value
+
+    @field_validator("html_max_bytes")
+    @classmethod
+    def validate_html_max_bytes(cls, value: int) -> int:
+        """Ensure HTML byte budget is strictly positive."""
+        if value <= 0:
+            raise ValueError("cache.html_max_bytes must be greater than 0")
+        return value
+
+    @field_validator("html_unversioned_ttl_seconds")
+    @classmethod
+    def validate_html_unversioned_ttl_seconds(cls, value: float) -> float:
+        """Ensure unversioned HTML TTL is strictly positive."""
+        if value <= 0.0:
+            raise ValueError("cache.html_unversioned_ttl_seconds must be greater than 0")
+        return value
+
+    @field_validator("search_soft_ttl_seconds")
+    @classmethod
+    def validate_search_soft_ttl_seconds(cls, value: float) -> float:
+        """Ensure search soft TTL is strictly positive."""
+        if value <= 0.0:
+            raise ValueError("cache.search_soft_ttl_seconds must be greater than 0")
+        return value
+
+    @field_validator("search_hard_ttl_seconds")
+    @classmethod
+    def validate_search_hard_ttl_seconds(cls, value: float) -> float:
+        """Ensure search hard TTL is strictly positive."""
+        if value <= 0.0:
+            raise ValueError("cache.search_hard_ttl_seconds must be greater than 0")
+        return value
+
+    @field_validator("search_max_entries")
+    @classmethod
+    def validate_search_max_entries(cls, value: int) -> int:
+        """Ensure search cache capacity is strictly positive."""
+        if value <= 0:
+            raise ValueError("cache.search_max_entries must be greater than 0")
+        return value
+
+    @field_validator("search_overfetch_window")
+    @classmethod
+    def validate_search_overfetch_window(cls, value: int | None) -> int | None:
+        """Ensure the over-fetch window, when enabled, is strictly positive."""
+        if value is not None and value <= 0:
+            raise ValueError("cache.search_overfetch_window must be greater than 0 or null")
+        return value
+
+
+class DebugConfig(BaseModel):
+    """Live diagnostics endpoints, off unless enabled."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    profiler_enabled: bool
+    profiler_max_seconds: float
+    tracemalloc_enabled: bool
+    tracemalloc_top_allocators: int
+
+    @field_validator("profiler_max_seconds")
+    @classmethod
+    def validate_profiler_max_seconds(cls, value: float) -> float:
+        """Ensure the longest allowed profile is strictly positive."""
+        if value <= 0.0:
+            raise ValueError("debug.profiler_max_seconds must be greater than 0")
+        return value
+
+    @field_validator("tracemalloc_top_allocators")
+    @classmethod
+    def validate_tracemalloc_top_allocators(cls, value: int) -> int:
+        """Ensure at least one allocator is reported."""
+        if value <= 0:
+            raise ValueError("debug.tracemalloc_top_allocators must be greater than 0")
+        return value
+
 
 class Config(BaseModel):
     """Root application configuration."""
@@ -111,6 +366,8 @@ class Config(BaseModel):
 
     service: ServiceConfig
     arxiv: ArxivConfig
+    cache: CacheConfig
+    debug: DebugConfig
 
     @classmethod
     def from_yaml(cls, config_path: Path) -> "Config":
@@ -134,5 +391,17 @@ class Config(BaseModel):
         """Return arXiv configuration."""
         return self.arxiv
 
+    def get_cache_config(self) -> CacheConfig:
+        """Return cache configuration."""
+        return self.cache
+
+    def get_debug_config(self) -> DebugConfig:
+        """Return debug endpoint configuration."""
+        return self.debug
+
     def validate_startup(self) -> None:
         """Validate prerequisites required to boot the service."""
+        arxiv_config = self.get_arxiv_config()
+        http2_enabled = any((arxiv_config.api_http2, arxiv_config.pdf_http2, arxiv_config.html_http2))
+        if http2_enabled and find_spec("h2") is None:
+            raise ValueError("arxiv.*_http2 requires the h2 package; install it or disable HTTP/2")
@@ -0,0 +1,149 @@
+"""Memory accounting: process RSS, bytes held by in-flight upstream bodies, and tracemalloc's top allocators."""
+
+import os
+import resource
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Literal
+
+from arxivsmart.profiler import short_path
+
+type BodyKind = Literal["feed", "pdf", "html", "markdown"]
+
+BODY_KINDS: tuple[BodyKind, ...] = ("feed", "pdf", "html", "markdown")
+
+
+class BodyLedger:
+    """Bytes currently held by upstream bodies and the text derived from them, by kind.
+
+    Call sites hold a body's size for as long as they keep the body: an
+    Atom feed while it is parsed, a PDF chunk while it is written and passed
+    on, an ar5iv page while it is stored or converted, and HTML or markdown
+    text while its response is encoded. Holding only updates a few counters,
+    so the ledger is always on; it is updated on the event loop, so no
+    locking is needed. Peaks are kept per kind and for the total since startup.
+    """
+
+    def __init__(self) -> None:
+        """Start with nothing held."""
+        self._held: dict[BodyKind, int] = dict.fromkeys(BODY_KINDS, 0)
+        self._peaks: dict[BodyKind, int] = dict.fromkeys(BODY_KINDS, 0)
+        self._total = 0
+        self._peak_total = 0
+
+    @contextmanager
+    def hold(self, kind: BodyKind, size_bytes: int) -> Iterator[None]:
+        """Count the bytes as held until the block exits."""
+        self._held[kind] += size_bytes
+        self._peaks[kind] = max(self._peaks[kind], self._held[kind])
+        self._total += size_bytes
+        self._peak_total = max(self._peak_total, self._total)
+        try:
+            yield
+        finally:
+            self._held[kind] -= size_bytes
+            self._total -= size_bytes
+
+    def held_bytes(self) -> dict[BodyKind, int]:
+        """Return the bytes held now per kind."""
+        return dict(self._held)
+
+    def peak_bytes(self) -> dict[BodyKind, int]:
+        """Return the most bytes held at once per kind since startup."""
+        return dict(self._peaks)
+
+    def stats(self) -> dict[str, int | float]:
+        """Return held and peak bytes per kind and in total."""
+        stats: dict[str, int | float] = {}
+        for kind in BODY_KINDS:
+            stats[f"{kind}_bytes"] = self._held[kind]
+            stats[f"{kind}_peak_bytes"] = self._peaks[kind]
+        stats["total_bytes"] = self._total
+        stats["total_peak_bytes"] = self._peak_total
+        return stats
+
+
+@dataclass(frozen=True)
+class Allocator:
+    """Memory still allocated from one source line, as traced by tracemalloc."""
+
+    location: str
+    size_bytes: int
+    blocks: int
+
+
+@dataclass(frozen=True)
+class TracedMemory:
+    """Totals of the memory traced by tracemalloc and the lines holding the most of it."""
+
+    traced_bytes: int
+    peak_traced_bytes: int
+    top_allocators: tuple[Allocator, ...]
+
+
+def approximate_size(value: object) -> int:
+    """Return the bytes of a value and everything it holds through tuples, lists, dicts, and dataclasses.
+
+    Objects reached more than once, such as interned category strings
+    shared by many papers, are counted once.
+    """
+    seen: set[int] = set()
+    pending = [value]
+    total = 0
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, tuple | list):
+            pending.extend(current)
+        elif isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif is_dataclass(current):
+            pending.extend(getattr(current, field.name) for field in fields(current))
+    return total
+
+
+def resident_set_bytes() -> int | None:
+    """Return the process's current resident set size, or None where /proc is not available."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except OSError:
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def peak_resident_set_bytes() -> int:
+    """Return the largest resident set size the process has reached."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kibibytes.
+    if sys.platform == "darwin":
+        return peak
+    return peak * 1024
+
+
+def traced_memory(limit: int) -> TracedMemory | None:
+    """Return traced totals and the source lines holding the most traced memory, or None when not tracing.
+
+    Taking the snapshot walks every traced block, so call it off the event loop.
+    """
+    if not tracemalloc.is_tracing():
+        return None
+
+    traced_bytes, peak_traced_bytes = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+    allocators = tuple(
+        Allocator(
+            location=f"{short_path(statistic.traceback[0].filename)}:{statistic.traceback[0].lineno}",
+            size_bytes=statistic.size,
+            blocks=statistic.count,
+        )
+        for statistic in snapshot.statistics("lineno")[:limit]
+    )
+    return TracedMemory(traced_bytes=traced_bytes, peak_traced_bytes=peak_traced_bytes, top_allocators=allocators)
@@ -0,0 +1,111 @@
+"""Histograms and a writer for the Prometheus text exposition format."""
+
+import bisect
+import math
+
+LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+type Labels = dict[str, str]
+
+
+class Histogram:
+    """Counts observations into fixed upper-bound buckets and keeps their sum.
+
+    Observations are made on the event loop, so no locking is needed.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Initialize with ascending bucket upper bounds; a final +Inf bucket is implied."""
+        if not buckets or list(buckets) != sorted(buckets):
+            raise ValueError("buckets must be a non-empty ascending sequence")
+
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count one observation in the first bucket whose upper bound it does not exceed."""
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._sum += value
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Return each upper bound, ending with +Inf, paired with the number of observations at or below it."""
+        bounds = [*self._buckets, math.inf]
+        cumulative: list[tuple[float, int]] = []
+        running = 0
+        for bound, count in zip(bounds, self._counts, strict=True):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative
+
+    def count(self) -> int:
+        """Return the number of observations."""
+        return sum(self._counts)
+
+    def total(self) -> float:
+        """Return the sum of all observed values."""
+        return self._sum
+
+
+class Exposition:
+    """Collects metric families and renders them in the Prometheus text exposition format, version 0.0.4.
+
+    Each family is written with its HELP and TYPE lines followed by all of
+    its samples, so callers pass every labelled sample of a family at once.
+    """
+
+    def __init__(self) -> None:
+        """Start with no families."""
+        self._lines: list[str] = []
+
+    def counter(self, name: str, help_text: str, samples: list[tuple[Labels, float]]) -> None:
+        """Add a counter family; by convention its name ends in ``_total``."""
+        self._header(name, "counter", help_text)
+        for labels, value in samples:
+            self._sample(name, labels, value)
+
+    def gauge(self, name: str, help_text: str, samples: list[tuple[Labels, float]]) -> None:
+        """Add a gauge family."""
+        self._header(name, "gauge", help_text)
+        for labels, value in samples:
+            self._sample(name, labels, value)
+
+    def histogram(self, name: str, help_text: str, samples: list[tuple[Labels, Histogram]]) -> None:
+        """Add a histogram family as cumulative ``_bucket`` series plus ``_sum`` and ``_count``."""
+        self._header(name, "histogram", help_text)
+        for labels, histogram in samples:
+            for bound, count in histogram.cumulative_counts():
+                self._sample(f"{name}_bucket", {**labels, "le": _format_value(bound)}, count)
+            self._sample(f"{name}_sum", labels, histogram.total())
+            self._sample(f"{name}_count", labels, histogram.count())
+
+    def render(self) -> str:
+        """Return the collected families as exposition text."""
+        return "\n".join(self._lines) + "\n"
+
+    def _header(self, name: str, metric_type: str, help_text: str) -> None:
+        """Write the HELP and TYPE lines that open a family."""
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {metric_type}")
+
+    def _sample(self, name: str, labels: Labels, value: float) -> None:
+        """Write one sample line."""
+        if not labels:
+            self._lines.append(f"{name} {_format_value(value)}")
+            return
+        rendered = ",".join(f'{key}="{_escape_label_value(label)}"' for key, label in labels.items())
+        self._lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value or bucket bound, writing infinity as Prometheus spells it."""
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int):
+        return str(value)
+    return repr(value)
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape backslashes, double quotes, and newlines in a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
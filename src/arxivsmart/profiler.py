@@ -0,0 +1,103 @@
+"""Sampling CPU profiler producing collapsed stacks for flamegraph tools."""
+
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+# Innermost frames of threads that are parked waiting for work or I/O rather than running Python code.
+_IDLE_FRAMES = frozenset(
+    {
+        ("thread.py", "_worker"),
+        ("selectors.py", "select"),
+        ("threading.py", "wait"),
+        ("queue.py", "get"),
+    },
+)
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is still recording."""
+
+
+class SamplingProfiler:
+    """Samples the Python stack of every thread at a fixed interval and counts identical stacks.
+
+    Sampling reads ``sys._current_frames()`` from a separate thread, so the
+    event loop and the upstream pools' worker threads are profiled as they
+    run, with no tracing hooks installed and nothing to restart. Each stack
+    is rooted at its thread's name, so flamegraphs split by thread. Threads
+    parked waiting for work or I/O are left out unless idle samples are
+    requested. One profile records at a time.
+    """
+
+    def __init__(self, interval_seconds: float) -> None:
+        """Initialize with the time between samples."""
+        if interval_seconds <= 0.0:
+            raise ValueError("interval_seconds must be greater than 0")
+
+        self._interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+
+    def profile(self, duration_seconds: float, include_idle: bool) -> str:
+        """Sample on the calling thread for the duration and return the stacks in collapsed format.
+
+        Each output line is a semicolon-separated stack, outermost frame
+        first, followed by a space and the number of samples that saw it,
+        as consumed by flamegraph.pl, speedscope, and similar tools.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("a profile is already recording")
+        try:
+            counts = self._sample(duration_seconds, include_idle)
+        finally:
+            self._lock.release()
+        return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+
+    def _sample(self, duration_seconds: float, include_idle: bool) -> Counter[str]:
+        """Collect stack samples of every other thread until the duration has passed."""
+        own_ident = threading.get_ident()
+        counts: Counter[str] = Counter()
+        deadline = time.monotonic() + duration_seconds
+        while time.monotonic() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if not include_idle and _is_idle(frame):
+                    continue
+                thread_name = f"thread {ident}"
+                if ident in names:
+                    thread_name = names[ident]
+                counts[_collapse(thread_name, frame)] += 1
+            time.sleep(self._interval_seconds)
+        return counts
+
+
+def _is_idle(frame: FrameType) -> bool:
+    """Return whether a thread's innermost frame is one where threads wait for work or I/O."""
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in _IDLE_FRAMES
+
+
+def _collapse(thread_name: str, frame: FrameType) -> str:
+    """Render a stack as ``thread;outer;...;inner`` with one ``function (file:line)`` label per frame."""
+    labels: list[str] = []
+    current: FrameType | None = frame
+    while current is not None:
+        code = current.f_code
+        labels.append(f"{code.co_qualname} ({short_path(code.co_filename)}:{code.co_firstlineno})")
+        current = current.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+def short_path(filename: str) -> str:
+    """Strip the installation prefix from standard library and site-packages paths."""
+    for key in ("purelib", "platlib", "stdlib"):
+        prefix = sysconfig.get_path(key)
+        if filename.startswith(prefix + os.sep):
+            return filename[len(prefix) + 1 :]
+    return filename
@@ -0,0 +1,68 @@
+"""Per-request time breakdown by phase, reported in the Server-Timing response header.
+
+The request's ServerTiming lives in a context variable, so the rate
+limiter, the upstream pools, and the response helpers can record into it
+without it being passed through every call. Tasks started while handling
+a request inherit it; work shared between requests, such as a batched
+paper lookup, is timed separately and merged into each request it served.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class ServerTiming:
+    """Accumulated seconds per phase, in the order the phases were first recorded."""
+
+    def __init__(self) -> None:
+        """Start with no phases."""
+        self._durations: dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase; a phase recorded twice, such as a retried upstream request, accumulates."""
+        if phase not in self._durations:
+            self._durations[phase] = 0.0
+        self._durations[phase] += seconds
+
+    def merge(self, other: "ServerTiming") -> None:
+        """Add every phase of another timing to this one."""
+        for phase, seconds in other.durations().items():
+            self.add(phase, seconds)
+
+    def durations(self) -> dict[str, float]:
+        """Return seconds per phase."""
+        return dict(self._durations)
+
+    def header_value(self, total_seconds: float) -> str:
+        """Render the phases and the given total as a Server-Timing header value in milliseconds."""
+        entries = [*self._durations.items(), ("total", total_seconds)]
+        return ", ".join(f"{phase};dur={seconds * 1000:.1f}" for phase, seconds in entries)
+
+
+_current: ContextVar[ServerTiming | None] = ContextVar("server_timing", default=None)
+
+
+@contextmanager
+def collect_server_timing() -> Iterator[ServerTiming]:
+    """Record phases in the current context into a new ServerTiming until the block exits."""
+    timing = ServerTiming()
+    token = _current.set(timing)
+    try:
+        yield timing
+    finally:
+        _current.reset(token)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Add time to a phase of the timing being collected, if any."""
+    timing = _current.get()
+    if timing is not None:
+        timing.add(phase, seconds)
+
+
+def record_phases(other: ServerTiming) -> None:
+    """Merge a separately collected timing into the timing being collected, if any."""
+    timing = _current.get()
+    if timing is not None:
+        timing.merge(other)
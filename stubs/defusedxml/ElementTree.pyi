@@ -4,3 +4,8 @@ from xml.etree.ElementTree import Element as Element
 
 def fromstring(text: str | bytes) -> Element: ...
 def parse(source: str) -> Element: ...
+
+class XMLParser:
+    def __init__(self, *, target: object = ...) -> None: ...
+    def feed(self, data: bytes) -> None: ...
+    def close(self) -> object: ...
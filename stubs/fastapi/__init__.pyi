@@ -1,6 +1,6 @@
 """Type stubs for fastapi — covers only the API surface used by arxivsmart."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from contextlib import AbstractAsyncContextManager
 from typing import Any
 
@@ -21,6 +21,7 @@ class FastAPI:
     ) -> None: ...
     def add_exception_handler(self, exc_class: type[Exception], handler: Any) -> None: ...
     def include_router(self, router: "APIRouter", **kwargs: Any) -> None: ...
+    def add_middleware(self, middleware_class: Any, **kwargs: Any) -> None: ...
     async def __call__(self, scope: Any, receive: Any, send: Any) -> None: ...
 
 class APIRouter:
@@ -32,6 +33,7 @@ class APIRouter:
 
 class Request:
     app: FastAPI
+    headers: Mapping[str, str]
 
     def __init__(self, scope: Scope, **kwargs: Any) -> None: ...
     async def json(self) -> Any: ...
@@ -1,12 +1,18 @@
 """Type stubs for fastapi.responses — covers only the API surface used by arxivsmart."""
 
+from collections.abc import AsyncIterable, Iterable, MutableMapping
+from os import PathLike
 from typing import Any
 
+from starlette.background import BackgroundTask
+
 class JSONResponse:
     status_code: int
     body: bytes
+    headers: MutableMapping[str, str]
 
     def __init__(self, *, status_code: int = ..., content: Any = ..., **kwargs: Any) -> None: ...
+    def render(self, content: Any) -> bytes: ...
 
 class Response:
     status_code: int
@@ -14,3 +20,17 @@ class Response:
     media_type: str | None
 
     def __init__(self, *, content: Any = ..., status_code: int = ..., headers: dict[str, str] | None = ..., media_type: str | None = ..., **kwargs: Any) -> None: ...
+
+class FileResponse(Response):
+    def __init__(self, path: str | PathLike[str], *, status_code: int = ..., headers: dict[str, str] | None = ..., media_type: str | None = ..., **kwargs: Any) -> None: ...
+
+class StreamingResponse(Response):
+    def __init__(
+        self,
+        content: Iterable[str | bytes] | AsyncIterable[str | bytes],
+        *,
+        status_code: int = ...,
+        headers: dict[str, str] | None = ...,
+        media_type: str | None = ...,
+        background: BackgroundTask | None = ...,
+    ) -> None: ...
@@ -1,5 +1,6 @@
 """Type stubs for httpx — covers only the API surface used by arxivsmart."""
 
+from collections.abc import AsyncIterator
 from types import TracebackType
 from typing import Any
 
@@ -10,6 +11,11 @@ class Response:
     headers: dict[str, str]
 
     def json(self) -> Any: ...
+    def aiter_bytes(self, chunk_size: int | None = ...) -> AsyncIterator[bytes]: ...
+    async def aread(self) -> bytes: ...
+    async def aclose(self) -> None: ...
+
+class Request: ...
 
 class Client:
     def __init__(self, *, base_url: str = ..., timeout: float = ..., **kwargs: Any) -> None: ...
@@ -24,3 +30,22 @@ class Client:
     def request(self, *, method: str, url: str, json: Any = ..., **kwargs: Any) -> Response: ...
     def get(self, url: str, **kwargs: Any) -> Response: ...
     def post(self, url: str, **kwargs: Any) -> Response: ...
+
+class HTTPError(Exception): ...
+
+class Limits:
+    def __init__(
+        self,
+        *,
+        max_connections: int | None = ...,
+        max_keepalive_connections: int | None = ...,
+        keepalive_expiry: float | None = ...,
+    ) -> None: ...
+
+class AsyncClient:
+    def __init__(self, *, timeout: float = ..., limits: Limits = ..., http2: bool = ..., **kwargs: Any) -> None: ...
+    async def aclose(self) -> None: ...
+    async def get(self, url: str, **kwargs: Any) -> Response: ...
+    async def head(self, url: str, **kwargs: Any) -> Response: ...
+    def build_request(self, method: str, url: str, **kwargs: Any) -> Request: ...
+    async def send(self, request: Request, *, stream: bool = ..., **kwargs: Any) -> Response: ...
@@ -0,0 +1,7 @@
+"""Type stubs for starlette.background — covers only the API surface used by arxivsmart."""
+
+from collections.abc import Callable
+from typing import Any
+
+class BackgroundTask:
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None: ...
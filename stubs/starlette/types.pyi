@@ -1,5 +1,10 @@
 """Type stubs for starlette.types — covers only the API surface used by arxivsmart."""
 
+from collections.abc import Awaitable, Callable, MutableMapping
 from typing import Any
 
 Scope = dict[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
@@ -3,11 +3,21 @@
 import pytest
 from pydantic import ValidationError
 
-from arxivsmart.api.models.info import HealthResponse, InfoResponse, ShutdownResponse
-from arxivsmart.api.models.paper import AuthorDetail, PaperContentResponse, PaperDetailResponse
+from arxivsmart.api.models.info import HealthResponse, InfoResponse, ProfileRequest, ShutdownResponse
+from arxivsmart.api.models.paper import PaperContentResponse, PapersRequest
 from arxivsmart.api.models.search import PaperSummary, SearchRequest, SearchResponse
 
 
+class TestProfileRequest:
+    def test_valid_request(self):
+        req = ProfileRequest(seconds=10.0, include_idle=False)
+        assert req.seconds == 10.0
+
+    def test_zero_seconds_raises(self):
+        with pytest.raises(ValidationError):
+            ProfileRequest(seconds=0.0, include_idle=False)
+
+
 class TestSearchRequest:
     def test_valid_request(self):
         req = SearchRequest(
@@ -82,7 +92,7 @@ class TestPaperSummary:
             updated="2023-01-01",
             pdf_url="https://arxiv.org/pdf/2301.00001v1",
         )
-        assert summary.arxiv_id == "2301.00001v1"
+        assert summary["arxiv_id"] == "2301.00001v1"
 
 
 class TestSearchResponse:
@@ -104,7 +114,7 @@ class TestSearchResponse:
                 )
             ],
         )
-        assert resp.total_results == 1
+        assert resp["total_results"] == 1
 
 
 class TestHealthResponse:
@@ -119,8 +129,9 @@ class TestHealthResponse:
 
 class TestInfoResponse:
     def test_valid(self):
-        resp = InfoResponse(config={"key": "value"})
+        resp = InfoResponse(config={"key": "value"}, stats={"metadata_cache": {"hits": 1}})
         assert resp.config["key"] == "value"
+        assert resp.stats["metadata_cache"]["hits"] == 1
 
 
 class TestShutdownResponse:
@@ -129,26 +140,6 @@ class TestShutdownResponse:
         assert resp.message == "shutdown initiated"
 
 
-class TestPaperDetailResponse:
-    def test_valid(self):
-        resp = PaperDetailResponse(
-            arxiv_id="2301.00001v1",
-            title="Test",
-            summary="Abstract",
-            authors=[AuthorDetail(name="Alice", affiliation="MIT")],
-            categories=["cs.AI"],
-            primary_category="cs.AI",
-            published="2023-01-01",
-            updated="2023-01-01",
-            pdf_url="https://arxiv.org/pdf/2301.00001v1",
-            abstract_url="http://arxiv.org/abs/2301.00001v1",
-            doi="10.1234/test",
-            comment="10 pages",
-            journal_ref="Nature",
-        )
-        assert resp.arxiv_id == "2301.00001v1"
-
-
 class TestPaperContentResponse:
     def test_html_content(self):
         resp = PaperContentResponse(
@@ -156,7 +147,7 @@ class TestPaperContentResponse:
             content="<html>test</html>",
             content_type="html",
         )
-        assert resp.content_type == "html"
+        assert resp["content_type"] == "html"
 
     def test_markdown_content(self):
         resp = PaperContentResponse(
@@ -164,4 +155,22 @@ class TestPaperContentResponse:
             content="# Title",
             content_type="markdown",
         )
-        assert resp.content_type == "markdown"
+        assert resp["content_type"] == "markdown"
+
+
+class TestPapersRequest:
+    def test_valid(self):
+        req = PapersRequest(arxiv_ids=["2301.00001v1", "2302.00002"])
+        assert len(req.arxiv_ids) == 2
+
+    def test_empty_list_raises(self):
+        with pytest.raises(ValidationError):
+            PapersRequest(arxiv_ids=[])
+
+    def test_blank_id_raises(self):
+        with pytest.raises(ValidationError):
+            PapersRequest(arxiv_ids=["2301.00001v1", "  "])
+
+    def test_too_many_ids_raises(self):
+        with pytest.raises(ValidationError):
+            PapersRequest(arxiv_ids=["2301.00001"] * 2001)
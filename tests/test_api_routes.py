@@ -1,15 +1,18 @@
 """Tests for API routes using FastAPI TestClient."""
 
-from unittest.mock import patch
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
 from arxivsmart.api.app import create_app
-from arxivsmart.arxiv.types import Author, Paper, SearchResult
-from arxivsmart.config import ArxivConfig, Config, ServiceConfig
+from arxivsmart.arxiv.client import ArxivClient
+from arxivsmart.arxiv.rate_limiter import RateLimiterFullError
+from arxivsmart.arxiv.types import Author, Paper, SearchFeedHeader, SearchResult
+from arxivsmart.config import ArxivConfig, CacheConfig, Config, DebugConfig, ServiceConfig
 
 
-def _make_config() -> Config:
+def _make_config(cache_dir) -> Config:
     return Config(
         service=ServiceConfig(
             host="127.0.0.1",
@@ -22,14 +25,50 @@ def _make_config() -> Config:
             pdf_base_url="https://arxiv.org/pdf",
             html_base_url="https://ar5iv.labs.arxiv.org/html",
             rate_limit_seconds=0.01,
+            rate_limit_max_seconds=60.0,
+            rate_limit_backoff_factor=2.0,
+            rate_limit_recovery_successes=10,
+            api_max_queue_depth=20,
+            pdf_max_queue_depth=20,
+            throttle_max_retries=2,
             request_timeout_seconds=30.0,
             max_results_limit=2000,
+            id_list_batch_size=100,
+            api_max_concurrency=1,
+            api_workers=2,
+            pdf_max_concurrency=4,
+            pdf_workers=2,
+            html_max_concurrency=8,
+            html_workers=4,
+            keepalive_expiry_seconds=60.0,
+            api_http2=False,
+            pdf_http2=False,
+            html_http2=False,
+            warm_up_connections=False,
+        ),
+        cache=CacheConfig(
+            directory=str(cache_dir),
+            metadata_unversioned_ttl_seconds=60.0,
+            pdf_max_bytes=1024 * 1024,
+            pdf_unversioned_ttl_seconds=60.0,
+            html_max_bytes=536870912,
+            html_unversioned_ttl_seconds=86400.0,
+            search_soft_ttl_seconds=60.0,
+            search_hard_ttl_seconds=600.0,
+            search_max_entries=100,
+            search_overfetch_window=100,
+        ),
+        debug=DebugConfig(
+            profiler_enabled=False,
+            profiler_max_seconds=60.0,
+            tracemalloc_enabled=False,
+            tracemalloc_top_allocators=25,
         ),
     )
 
 
-def _make_app():
-    config = _make_config()
+def _make_app(cache_dir):
+    config = _make_config(cache_dir)
     return create_app(config=config)
 
 
@@ -38,13 +77,13 @@ def _sample_search_result() -> SearchResult:
         total_results=1,
         start_index=0,
         items_per_page=1,
-        papers=[
+        papers=(
             Paper(
                 arxiv_id="2301.00001v1",
                 title="Test Paper",
                 summary="Test abstract.",
-                authors=[Author(name="Alice", affiliation="MIT")],
-                categories=["cs.AI"],
+                authors=(Author(name="Alice", affiliation="MIT"),),
+                categories=("cs.AI",),
                 primary_category="cs.AI",
                 published="2023-01-01T00:00:00Z",
                 updated="2023-01-01T00:00:00Z",
@@ -54,13 +93,18 @@ def _sample_search_result() -> SearchResult:
                 comment="10 pages",
                 journal_ref="Nature 2023",
             ),
-        ],
+        ),
     )
 
 
+async def _async_items(items):
+    for item in items:
+        yield item
+
+
 class TestHealthEndpoint:
-    def test_health_returns_200(self):
-        app = _make_app()
+    def test_health_returns_200(self, tmp_path):
+        app = _make_app(tmp_path)
         client = TestClient(app)
         resp = client.get("/v1/health")
         assert resp.status_code == 200
@@ -70,21 +114,164 @@ class TestHealthEndpoint:
 
 
 class TestInfoEndpoint:
-    def test_info_returns_config(self):
-        app = _make_app()
+    def test_info_returns_config(self, tmp_path):
+        app = _make_app(tmp_path)
         client = TestClient(app)
         resp = client.get("/v1/info")
         assert resp.status_code == 200
         data = resp.json()
         assert "config" in data["data"]
+        assert data["data"]["stats"]["metadata_cache"] == {"hits": 0, "misses": 0, "entries": 0}
+
+
+class TestMetricsEndpoint:
+    def test_metrics_uses_text_exposition_format(self, tmp_path):
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+        assert "# TYPE arxivsmart_rate_limiter_wait_seconds histogram" in resp.text
+        assert 'arxivsmart_rate_limiter_queue_depth{limiter="pdf",priority="interactive"} 0' in resp.text
+
+    @patch.object(ArxivClient, "get_paper", new_callable=AsyncMock)
+    def test_metrics_count_requests_by_route_template(self, mock_get_paper, tmp_path):
+        mock_get_paper.return_value = _sample_search_result().papers[0]
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        client.get("/v1/paper/2301.00001v1")
+        client.get("/v1/paper/2301.00002v1")
+        client.get("/v1/missing")
+
+        text = client.get("/v1/metrics").text
+        assert 'arxivsmart_http_requests_total{method="GET",route="/v1/paper/{arxiv_id}",status="200"} 2' in text
+        assert 'arxivsmart_http_requests_total{method="GET",route="unmatched",status="404"} 1' in text
+        assert 'arxivsmart_http_request_duration_seconds_count{method="GET",route="/v1/paper/{arxiv_id}"} 2' in text
+
+    def test_metrics_report_cache_hit_ratio_once_looked_up(self, tmp_path):
+        app = _make_app(tmp_path)
+        app.state.metadata_cache.get("2301.00001v1")
+        client = TestClient(app)
+
+        text = client.get("/v1/metrics").text
+        assert 'arxivsmart_cache_misses_total{cache="metadata"} 1' in text
+        assert 'arxivsmart_cache_hit_ratio{cache="metadata"} 0.0' in text
+        assert 'arxivsmart_cache_hit_ratio{cache="search"}' not in text
+
+
+class TestQueueEndpoint:
+    def test_lists_each_limiter_queue(self, tmp_path):
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/queue")
+        assert resp.status_code == 200
+        limiters = resp.json()["data"]["limiters"]
+        assert set(limiters) == {"api", "pdf"}
+        assert limiters["api"] == {"max_queue_depth": 20, "interval_seconds": 0.01, "waiters": []}
+
+
+class TestMemoryEndpoint:
+    def test_reports_rss_bodies_and_caches(self, tmp_path):
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/debug/memory")
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert data["peak_rss_bytes"] > 0
+        assert data["body_bytes"] == {"feed": 0, "pdf": 0, "html": 0, "markdown": 0}
+        assert data["cache_bytes"]["search"] > 0
+        assert data["tracemalloc"] is None
+
+    def test_lists_top_allocators_when_tracing(self, tmp_path):
+        config = _make_config(tmp_path).model_copy(
+            update={
+                "debug": DebugConfig(
+                    profiler_enabled=False,
+                    profiler_max_seconds=60.0,
+                    tracemalloc_enabled=True,
+                    tracemalloc_top_allocators=3,
+                ),
+            },
+        )
+        with TestClient(create_app(config=config)) as client:
+            data = client.get("/v1/debug/memory").json()["data"]
+
+        assert data["tracemalloc"]["traced_bytes"] > 0
+        assert len(data["tracemalloc"]["top_allocators"]) == 3
+
+
+class TestProfileEndpoint:
+    def test_disabled_by_default(self, tmp_path):
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.post("/v1/profile", json={"seconds": 0.01, "include_idle": False})
+        assert resp.status_code == 403
+        assert "debug.profiler_enabled" in resp.json()["error"]
+
+    def test_returns_collapsed_stacks_when_enabled(self, tmp_path):
+        config = _make_config(tmp_path).model_copy(
+            update={
+                "debug": DebugConfig(
+                    profiler_enabled=True,
+                    profiler_max_seconds=1.0,
+                    tracemalloc_enabled=False,
+                    tracemalloc_top_allocators=25,
+                )
+            },
+        )
+        client = TestClient(create_app(config=config))
+        resp = client.post("/v1/profile", json={"seconds": 0.05, "include_idle": True})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "text/plain; charset=utf-8"
+        assert "attachment" in resp.headers["content-disposition"]
+        stack, count = resp.text.splitlines()[0].rsplit(" ", 1)
+        assert ";" in stack
+        assert int(count) > 0
+
+    def test_duration_over_limit_returns_400(self, tmp_path):
+        config = _make_config(tmp_path).model_copy(
+            update={
+                "debug": DebugConfig(
+                    profiler_enabled=True,
+                    profiler_max_seconds=1.0,
+                    tracemalloc_enabled=False,
+                    tracemalloc_top_allocators=25,
+                )
+            },
+        )
+        client = TestClient(create_app(config=config))
+        resp = client.post("/v1/profile", json={"seconds": 5.0, "include_idle": False})
+        assert resp.status_code == 400
+        assert "debug.profiler_max_seconds" in resp.json()["error"]
+
+
+class TestServerTimingHeader:
+    @patch.object(ArxivClient, "search", new_callable=AsyncMock)
+    def test_search_reports_serialize_and_total(self, mock_search, tmp_path):
+        mock_search.return_value = _sample_search_result()
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.post(
+            "/v1/search",
+            json={"query": "test", "start": 0, "max_results": 10, "sort_by": "relevance", "sort_order": "descending"},
+        )
+        phases = [entry.split(";")[0] for entry in resp.headers["server-timing"].split(", ")]
+        assert phases == ["serialize", "total"]
+
+    def test_error_responses_carry_the_header(self, tmp_path):
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/paper/2301.00001", headers={"X-Request-Priority": "urgent"})
+        assert resp.status_code == 400
+        assert resp.headers["server-timing"].startswith("serialize;dur=")
 
 
 class TestSearchEndpoint:
-    @patch("arxivsmart.api.routes_search.asyncio.to_thread")
-    def test_search_returns_results(self, mock_to_thread):
-        mock_to_thread.return_value = _sample_search_result()
+    @patch.object(ArxivClient, "search", new_callable=AsyncMock)
+    def test_search_returns_results(self, mock_search, tmp_path):
+        mock_search.return_value = _sample_search_result()
 
-        app = _make_app()
+        app = _make_app(tmp_path)
         client = TestClient(app)
         resp = client.post(
             "/v1/search",
@@ -101,53 +288,204 @@ class TestSearchEndpoint:
         assert data["data"]["total_results"] == 1
         assert len(data["data"]["papers"]) == 1
 
-    def test_search_invalid_body_returns_400(self):
-        app = _make_app()
+    @patch.object(ArxivClient, "search", new_callable=AsyncMock)
+    def test_search_summary_fields_match_envelope(self, mock_search, tmp_path):
+        mock_search.return_value = _sample_search_result()
+
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.post(
+            "/v1/search",
+            json={
+                "query": "quantum computing",
+                "start": 0,
+                "max_results": 10,
+                "sort_by": "relevance",
+                "sort_order": "descending",
+            },
+        )
+        assert resp.json()["data"]["papers"][0] == {
+            "arxiv_id": "2301.00001v1",
+            "title": "Test Paper",
+            "summary": "Test abstract.",
+            "authors": ["Alice"],
+            "primary_category": "cs.AI",
+            "published": "2023-01-01T00:00:00Z",
+            "updated": "2023-01-01T00:00:00Z",
+            "pdf_url": "http://arxiv.org/pdf/2301.00001v1",
+        }
+
+    @patch.object(ArxivClient, "stream_search", new_callable=AsyncMock)
+    def test_search_ndjson_streams_one_envelope_per_line(self, mock_stream_search, tmp_path):
+        result = _sample_search_result()
+        header = SearchFeedHeader(total_results=1, start_index=0, items_per_page=1)
+        mock_stream_search.return_value = _async_items([header, *result.papers])
+
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.post(
+            "/v1/search",
+            json={
+                "query": "quantum computing",
+                "start": 0,
+                "max_results": 10,
+                "sort_by": "relevance",
+                "sort_order": "descending",
+            },
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert lines[0]["data"]["feed"]["total_results"] == 1
+        assert lines[1]["data"]["paper"]["arxiv_id"] == "2301.00001v1"
+
+    def test_search_invalid_body_returns_400(self, tmp_path):
+        app = _make_app(tmp_path)
         client = TestClient(app)
         resp = client.post("/v1/search", json={"query": ""})
         assert resp.status_code == 400
 
 
 class TestPaperEndpoint:
-    @patch("arxivsmart.api.routes_paper.asyncio.to_thread")
-    def test_get_paper_returns_detail(self, mock_to_thread):
-        mock_to_thread.return_value = _sample_search_result().papers[0]
+    @patch.object(ArxivClient, "get_paper", new_callable=AsyncMock)
+    def test_full_limiter_queue_returns_429_with_retry_after(self, mock_get_paper, tmp_path):
+        mock_get_paper.side_effect = RateLimiterFullError("rate limiter queue is full (20 waiting); retry in about 61s", 60.4)
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/paper/2301.00001v1")
+        assert resp.status_code == 429
+        assert resp.headers["retry-after"] == "61"
+        assert "queue is full" in resp.json()["error"]
 
-        app = _make_app()
+    @patch.object(ArxivClient, "get_paper", new_callable=AsyncMock)
+    def test_get_paper_returns_detail(self, mock_get_paper, tmp_path):
+        mock_get_paper.return_value = _sample_search_result().papers[0]
+
+        app = _make_app(tmp_path)
         client = TestClient(app)
         resp = client.get("/v1/paper/2301.00001v1")
         assert resp.status_code == 200
         data = resp.json()
         assert data["data"]["arxiv_id"] == "2301.00001v1"
 
-    @patch("arxivsmart.api.routes_paper.asyncio.to_thread")
-    def test_get_paper_pdf_returns_bytes(self, mock_to_thread):
-        mock_to_thread.return_value = b"%PDF-1.4 fake"
+    @patch.object(ArxivClient, "get_paper", new_callable=AsyncMock)
+    def test_get_paper_encodes_domain_object_in_field_order(self, mock_get_paper, tmp_path):
+        mock_get_paper.return_value = _sample_search_result().papers[0]
+
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/paper/2301.00001v1")
+        assert resp.headers["content-type"] == "application/json"
+        body = resp.json()
+        assert body["status"] == 200
+        assert list(body["data"]) == [
+            "arxiv_id",
+            "title",
+            "summary",
+            "authors",
+            "categories",
+            "primary_category",
+            "published",
+            "updated",
+            "pdf_url",
+            "abstract_url",
+            "doi",
+            "comment",
+            "journal_ref",
+        ]
+        assert body["data"]["authors"] == [{"name": "Alice", "affiliation": "MIT"}]
+
+    @patch.object(ArxivClient, "get_paper", new_callable=AsyncMock)
+    def test_get_paper_passes_request_priority(self, mock_get_paper, tmp_path):
+        mock_get_paper.return_value = _sample_search_result().papers[0]
+
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/paper/2301.00001v1", headers={"X-Request-Priority": "interactive"})
+        assert resp.status_code == 200
+        mock_get_paper.assert_awaited_once_with("2301.00001v1", "interactive")
+
+    def test_get_paper_malformed_id_returns_400(self, tmp_path):
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/paper/2301.001")
+        assert resp.status_code == 400
+        assert "invalid arXiv ID" in resp.json()["error"]
+
+    def test_get_paper_unknown_priority_returns_400(self, tmp_path):
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/paper/2301.00001v1", headers={"X-Request-Priority": "urgent"})
+        assert resp.status_code == 400
+
+    @patch.object(ArxivClient, "download_pdf", new_callable=AsyncMock)
+    def test_get_paper_pdf_returns_bytes(self, mock_download_pdf, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+        mock_download_pdf.return_value = pdf_path
+
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.get("/v1/paper/2301.00001v1/pdf")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/pdf"
+        assert resp.content == b"%PDF-1.4 fake"
 
-        app = _make_app()
+    @patch.object(ArxivClient, "download_pdf", new_callable=AsyncMock)
+    def test_get_paper_pdf_streams_on_store_miss(self, mock_download_pdf, tmp_path):
+        pdf_stream = MagicMock(spec=["__aiter__", "aclose"])
+        pdf_stream.__aiter__.return_value = [b"%PDF-1.4 ", b"fake"]
+        pdf_stream.aclose = AsyncMock()
+        mock_download_pdf.return_value = pdf_stream
+
+        app = _make_app(tmp_path)
         client = TestClient(app)
         resp = client.get("/v1/paper/2301.00001v1/pdf")
         assert resp.status_code == 200
         assert resp.headers["content-type"] == "application/pdf"
+        assert resp.content == b"%PDF-1.4 fake"
+        pdf_stream.aclose.assert_awaited_once()
 
-    @patch("arxivsmart.api.routes_paper.asyncio.to_thread")
-    def test_get_paper_html_returns_content(self, mock_to_thread):
-        mock_to_thread.return_value = "<html>content</html>"
+    @patch.object(ArxivClient, "fetch_html", new_callable=AsyncMock)
+    def test_get_paper_html_returns_content(self, mock_fetch_html, tmp_path):
+        mock_fetch_html.return_value = "<html>content</html>"
 
-        app = _make_app()
+        app = _make_app(tmp_path)
         client = TestClient(app)
         resp = client.get("/v1/paper/2301.00001v1/html")
         assert resp.status_code == 200
         data = resp.json()
         assert data["data"]["content_type"] == "html"
 
-    @patch("arxivsmart.api.routes_paper.asyncio.to_thread")
-    def test_get_paper_markdown_returns_content(self, mock_to_thread):
-        mock_to_thread.return_value = "# Title\n\nContent"
+    @patch.object(ArxivClient, "fetch_markdown", new_callable=AsyncMock)
+    def test_get_paper_markdown_returns_content(self, mock_fetch_markdown, tmp_path):
+        mock_fetch_markdown.return_value = "# Title\n\nContent"
 
-        app = _make_app()
+        app = _make_app(tmp_path)
         client = TestClient(app)
         resp = client.get("/v1/paper/2301.00001v1/markdown")
         assert resp.status_code == 200
         data = resp.json()
         assert data["data"]["content_type"] == "markdown"
+
+
+class TestPapersEndpoint:
+    @patch.object(ArxivClient, "get_papers", new_callable=AsyncMock)
+    def test_get_papers_returns_results_in_order(self, mock_get_papers, tmp_path):
+        mock_get_papers.return_value = [_sample_search_result().papers[0], None]
+
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.post("/v1/papers", json={"arxiv_ids": ["2301.00001v1", "9999.99999"]})
+        assert resp.status_code == 200
+        papers = resp.json()["data"]["papers"]
+        assert papers[0]["found"] is True
+        assert papers[0]["paper"]["arxiv_id"] == "2301.00001v1"
+        assert papers[1] == {"arxiv_id": "9999.99999", "found": False, "paper": None}
+
+    def test_get_papers_empty_list_returns_400(self, tmp_path):
+        app = _make_app(tmp_path)
+        client = TestClient(app)
+        resp = client.post("/v1/papers", json={"arxiv_ids": []})
+        assert resp.status_code == 400
@@ -4,6 +4,7 @@ import json
 from unittest.mock import MagicMock
 
 from arxivsmart.api.utils import ensure_healthy, error_response, success_response
+from arxivsmart.arxiv.types import Author
 
 
 class TestSuccessResponse:
@@ -14,6 +15,11 @@ class TestSuccessResponse:
         assert body["status"] == 200
         assert body["data"]["key"] == "value"
 
+    def test_encodes_dataclasses_directly(self):
+        author = Author(name="Alice", affiliation="MIT")
+        resp = success_response(status=200, data={"authors": [author]})
+        assert resp.body == b'{"status":200,"data":{"authors":[{"name":"Alice","affiliation":"MIT"}]}}'
+
 
 class TestErrorResponse:
     def test_returns_json_with_status_and_error(self):
@@ -1,11 +1,21 @@
 """Tests for the arXiv API client."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
-from arxivsmart.arxiv.client import ArxivClient
-from arxivsmart.arxiv.rate_limiter import RateLimiter
+from arxivsmart.arxiv.client import ArxivClient, InvalidIdError
+from arxivsmart.arxiv.pdf_stream import PdfStream
+from arxivsmart.arxiv.rate_limiter import RateLimiter, UpstreamThrottledError
+from arxivsmart.arxiv.types import SearchFeedHeader
+from arxivsmart.cache.blob_store import BlobStore, BlobValidators
+from arxivsmart.cache.metadata import MetadataCache
+from arxivsmart.cache.search import SearchCache
 from arxivsmart.config import ArxivConfig
 
 SAMPLE_SEARCH_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
@@ -28,138 +38,795 @@ SAMPLE_SEARCH_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
 </feed>"""
 
 
+def _make_feed(start: int, count: int, total: int) -> bytes:
+    entries = "".join(
+        f"""
+  <entry>
+    <id>http://arxiv.org/abs/2301.{index:05d}v1</id>
+    <title>Paper {index}</title>
+    <summary>Abstract {index}.</summary>
+    <author><name>Author</name></author>
+    <category term="cs.AI" />
+    <arxiv:primary_category term="cs.AI" />
+    <published>2023-01-01T00:00:00Z</published>
+    <updated>2023-01-01T00:00:00Z</updated>
+  </entry>"""
+        for index in range(start, start + count)
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+      xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"
+      xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <opensearch:totalResults>{total}</opensearch:totalResults>
+  <opensearch:startIndex>{start}</opensearch:startIndex>
+  <opensearch:itemsPerPage>{count}</opensearch:itemsPerPage>{entries}
+</feed>""".encode()
+
+
 def _make_config() -> ArxivConfig:
     return ArxivConfig(
         base_url="https://export.arxiv.org/api/query",
         pdf_base_url="https://arxiv.org/pdf",
         html_base_url="https://ar5iv.labs.arxiv.org/html",
         rate_limit_seconds=0.01,
+        rate_limit_max_seconds=1.0,
+        rate_limit_backoff_factor=2.0,
+        rate_limit_recovery_successes=3,
+        api_max_queue_depth=20,
+        pdf_max_queue_depth=20,
+        throttle_max_retries=1,
         request_timeout_seconds=30.0,
         max_results_limit=2000,
+        id_list_batch_size=100,
+        api_max_concurrency=1,
+        api_workers=2,
+        pdf_max_concurrency=4,
+        pdf_workers=2,
+        html_max_concurrency=8,
+        html_workers=4,
+        keepalive_expiry_seconds=60.0,
+        api_http2=False,
+        pdf_http2=False,
+        html_http2=False,
+        warm_up_connections=False,
     )
 
 
+def _make_rate_limiter(config: ArxivConfig) -> RateLimiter:
+    return RateLimiter(
+        min_interval_seconds=config.rate_limit_seconds,
+        max_interval_seconds=config.rate_limit_max_seconds,
+        backoff_factor=config.rate_limit_backoff_factor,
+        recovery_successes=config.rate_limit_recovery_successes,
+        max_queue_depth=config.api_max_queue_depth,
+    )
+
+
+def _make_metadata_cache(tmp_path) -> MetadataCache:
+    return MetadataCache(database_path=tmp_path / "metadata.sqlite3", unversioned_ttl_seconds=60.0)
+
+
+def _make_pdf_store(tmp_path) -> BlobStore:
+    return BlobStore(directory=tmp_path / "pdf", suffix=".pdf", max_bytes=1024 * 1024, unversioned_ttl_seconds=60.0)
+
+
+def _make_html_store(tmp_path) -> BlobStore:
+    return BlobStore(directory=tmp_path / "html", suffix=".html", max_bytes=1024 * 1024, unversioned_ttl_seconds=60.0)
+
+
+def _make_search_cache() -> SearchCache:
+    return SearchCache(soft_ttl_seconds=60.0, hard_ttl_seconds=600.0, max_entries=100)
+
+
 def _make_mock_response(status_code=200, content=b"", text=""):
     mock_response = MagicMock()
     mock_response.status_code = status_code
     mock_response.content = content
     mock_response.text = text
+    mock_response.headers = {}
+    mock_response.aiter_bytes.return_value = _async_chunks([content])
+    mock_response.aread = AsyncMock(return_value=content)
+    mock_response.aclose = AsyncMock()
     return mock_response
 
 
+def _make_mock_http():
+    mock_http = MagicMock()
+    mock_http.get = AsyncMock()
+    mock_http.send = AsyncMock()
+    mock_http.aclose = AsyncMock()
+    return mock_http
+
+
+async def _async_chunks(chunks: list[bytes]):
+    for chunk in chunks:
+        yield chunk
+
+
+def _make_client(tmp_path, **overrides: Any) -> ArxivClient:
+    config = overrides.get("config", _make_config())
+    rate_limiter = _make_rate_limiter(config)
+    arguments: dict[str, Any] = {
+        "config": config,
+        "api_rate_limiter": rate_limiter,
+        "pdf_rate_limiter": rate_limiter,
+        "metadata_cache": _make_metadata_cache(tmp_path),
+        "pdf_store": _make_pdf_store(tmp_path),
+        "html_store": _make_html_store(tmp_path),
+        "search_cache": _make_search_cache(),
+        "search_overfetch_window": None,
+    }
+    return ArxivClient(**(arguments | overrides))
+
+
+async def _wait_for_pdf_followers(client: ArxivClient, count: int) -> None:
+    """Wait until the given number of callers have joined the PDF download in flight."""
+    for _ in range(1000):
+        if client.stats()["pdf_flight"]["merged"] >= count:
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("follower never joined the PDF download")
+
+
+@pytest.fixture
+def mock_client_cls():
+    with patch("arxivsmart.arxiv.client.httpx.AsyncClient") as mock_client_cls:
+        mock_client_cls.return_value = _make_mock_http()
+        yield mock_client_cls
+
+
+@pytest.fixture
+def mock_http(mock_client_cls):
+    return mock_client_cls.return_value
+
+
 class TestArxivClientSearch:
-    @patch("arxivsmart.arxiv.client.httpx.Client")
-    def test_search_returns_results(self, mock_client_cls):
-        mock_http = MagicMock()
+    async def test_search_returns_results(self, mock_http, tmp_path):
         mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
-        mock_client_cls.return_value = mock_http
 
-        config = _make_config()
-        rate_limiter = RateLimiter(min_interval_seconds=config.rate_limit_seconds)
-        client = ArxivClient(config=config, api_rate_limiter=rate_limiter, pdf_rate_limiter=rate_limiter)
+        client = _make_client(tmp_path)
 
-        result = client.search(
+        result = await client.search(
             query="quantum computing",
             start=0,
             max_results=10,
             sort_by="relevance",
             sort_order="descending",
+            priority="normal",
         )
 
         assert result.total_results == 1
         assert len(result.papers) == 1
         assert result.papers[0].arxiv_id == "2301.00001v1"
 
-    @patch("arxivsmart.arxiv.client.httpx.Client")
-    def test_search_non_200_raises(self, mock_client_cls):
-        mock_http = MagicMock()
-        mock_http.get.return_value = _make_mock_response(status_code=503, text="Service Unavailable")
-        mock_client_cls.return_value = mock_http
+    async def test_search_records_upstream_response_on_api_pool(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
 
-        config = _make_config()
-        rate_limiter = RateLimiter(min_interval_seconds=config.rate_limit_seconds)
-        client = ArxivClient(config=config, api_rate_limiter=rate_limiter, pdf_rate_limiter=rate_limiter)
+        client = _make_client(tmp_path)
 
-        with pytest.raises(RuntimeError, match="arXiv API returned status 503"):
-            client.search(
+        await client.search(
+            query="quantum computing",
+            start=0,
+            max_results=10,
+            sort_by="relevance",
+            sort_order="descending",
+            priority="normal",
+        )
+
+        api_pool = client.upstream_pools()["api"]
+        assert api_pool.response_statuses() == {"200": 1}
+        assert api_pool.stats()["bytes_received"] == len(SAMPLE_SEARCH_XML)
+        assert api_pool.task_histograms()["parse_feed"].count() == 1
+        assert client.rate_limiters()["api"].wait_histogram().count() == 1
+
+    async def test_search_equivalent_queries_share_cache_entry(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+
+        client = _make_client(tmp_path)
+
+        await client.search(
+            query="TI:quantum AND au:smith", start=0, max_results=10, sort_by="relevance", sort_order="descending", priority="normal"
+        )
+        await client.search(
+            query="ti:quantum   AND AU:smith", start=0, max_results=10, sort_by="relevance", sort_order="descending", priority="normal"
+        )
+
+        assert mock_http.get.call_count == 1
+        assert mock_http.get.call_args.kwargs["params"]["search_query"] == "TI:quantum AND au:smith"
+
+    async def test_search_stale_entry_served_and_refreshed(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+
+        search_cache = SearchCache(soft_ttl_seconds=0.01, hard_ttl_seconds=600.0, max_entries=100)
+        client = _make_client(tmp_path, search_cache=search_cache)
+
+        await client.search(query="quantum", start=0, max_results=10, sort_by="relevance", sort_order="descending", priority="normal")
+        await asyncio.sleep(0.02)
+        result = await client.search(
+            query="quantum", start=0, max_results=10, sort_by="relevance", sort_order="descending", priority="normal"
+        )
+        assert result.total_results == 1
+
+        deadline = time.monotonic() + 2.0
+        while search_cache.stats()["refreshes"] == 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+        assert search_cache.stats()["stale_hits"] == 1
+        assert search_cache.stats()["refreshes"] == 1
+        assert mock_http.get.call_count == 2
+
+    async def test_search_pages_served_from_overfetched_window(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=_make_feed(start=0, count=50, total=500))
+
+        client = _make_client(tmp_path, search_overfetch_window=50)
+
+        first_page = await client.search(
+            query="quantum", start=0, max_results=10, sort_by="relevance", sort_order="descending", priority="normal"
+        )
+        third_page = await client.search(
+            query="quantum", start=20, max_results=10, sort_by="relevance", sort_order="descending", priority="normal"
+        )
+
+        assert mock_http.get.call_count == 1
+        params = mock_http.get.call_args.kwargs["params"]
+        assert params["start"] == 0
+        assert params["max_results"] == 50
+        assert [paper.arxiv_id for paper in first_page.papers] == [f"2301.{i:05d}v1" for i in range(10)]
+        assert [paper.arxiv_id for paper in third_page.papers] == [f"2301.{i:05d}v1" for i in range(20, 30)]
+        assert third_page.start_index == 20
+        assert third_page.items_per_page == 10
+        assert third_page.total_results == 500
+
+    async def test_search_crossing_window_boundary_fetches_directly(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=_make_feed(start=45, count=10, total=500))
+
+        client = _make_client(tmp_path, search_overfetch_window=50)
+
+        await client.search(query="quantum", start=45, max_results=10, sort_by="relevance", sort_order="descending", priority="normal")
+
+        params = mock_http.get.call_args.kwargs["params"]
+        assert params["start"] == 45
+        assert params["max_results"] == 10
+
+    def test_overfetch_window_above_max_results_limit_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="must not exceed max_results_limit"):
+            _make_client(tmp_path, search_overfetch_window=5000)
+
+    async def test_search_non_200_raises(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=500, text="Internal Server Error")
+
+        client = _make_client(tmp_path)
+
+        with pytest.raises(RuntimeError, match="arXiv API returned status 500"):
+            await client.search(
                 query="test",
                 start=0,
                 max_results=10,
                 sort_by="relevance",
                 sort_order="descending",
+                priority="normal",
             )
 
+    async def test_search_throttled_is_retried_after_retry_after(self, mock_http, tmp_path):
+        throttled = _make_mock_response(status_code=503, text="Service Unavailable")
+        throttled.headers = {"retry-after": "0.1"}
+        mock_http.get.side_effect = [throttled, _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)]
+
+        client = _make_client(tmp_path)
+
+        start = time.monotonic()
+        result = await client.search(
+            query="test",
+            start=0,
+            max_results=10,
+            sort_by="relevance",
+            sort_order="descending",
+            priority="normal",
+        )
+
+        assert result.total_results == 1
+        assert time.monotonic() - start >= 0.09
+        assert mock_http.get.await_count == 2
+        throttled.aclose.assert_awaited_once()
+        assert client.stats()["api_rate_limiter"]["interval_seconds"] == pytest.approx(0.02)
+
+    async def test_search_throttled_beyond_retries_raises(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=429, text="Too Many Requests")
+
+        client = _make_client(tmp_path)
+
+        with pytest.raises(UpstreamThrottledError, match="429"):
+            await client.search(
+                query="test",
+                start=0,
+                max_results=10,
+                sort_by="relevance",
+                sort_order="descending",
+                priority="normal",
+            )
+        assert mock_http.get.await_count == _make_config().throttle_max_retries + 1
+
 
 class TestArxivClientGetPaper:
-    @patch("arxivsmart.arxiv.client.httpx.Client")
-    def test_get_paper_returns_paper(self, mock_client_cls):
-        mock_http = MagicMock()
+    async def test_get_paper_returns_paper(self, mock_http, tmp_path):
         mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
-        mock_client_cls.return_value = mock_http
 
-        config = _make_config()
-        rate_limiter = RateLimiter(min_interval_seconds=config.rate_limit_seconds)
-        client = ArxivClient(config=config, api_rate_limiter=rate_limiter, pdf_rate_limiter=rate_limiter)
+        client = _make_client(tmp_path)
 
-        paper = client.get_paper("2301.00001v1")
+        paper = await client.get_paper("2301.00001v1", "normal")
         assert paper.arxiv_id == "2301.00001v1"
         assert paper.title == "Test Paper"
 
+    async def test_get_paper_repeat_served_from_cache(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+
+        client = _make_client(tmp_path)
+
+        first = await client.get_paper("2301.00001v1", "normal")
+        second = await client.get_paper("2301.00001v1", "normal")
+
+        assert first == second
+        assert mock_http.get.call_count == 1
+        assert client.stats()["metadata_cache"]["hits"] == 1
+
+    async def test_concurrent_get_paper_calls_are_coalesced(self, mock_http, tmp_path):
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.1)
+            return _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+
+        mock_http.get.side_effect = slow_get
+
+        client = _make_client(tmp_path)
+
+        await asyncio.gather(*(client.get_paper("2301.00001v1", "normal") for _ in range(5)))
+
+        assert mock_http.get.call_count == 1
+        stats = client.stats()
+        assert stats["paper_flight"]["merged"] + stats["metadata_cache"]["hits"] == 4
+
+    async def test_get_paper_malformed_id_raises_without_request(self, mock_http, tmp_path):
+
+        client = _make_client(tmp_path)
+
+        with pytest.raises(InvalidIdError, match="invalid arXiv ID"):
+            await client.get_paper("2301.001", "normal")
+        mock_http.get.assert_not_called()
+
+    async def test_rejected_shared_batch_retries_each_lookup_alone(self, mock_http, tmp_path):
+        async def get(url, params):
+            if params["id_list"] == "2301.00001":
+                return _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+            if params["id_list"] == "2301.99999":
+                return _make_mock_response(status_code=200, content=_make_feed(start=0, count=0, total=0))
+            return _make_mock_response(status_code=400, text="incorrect id format")
+
+        mock_http.get.side_effect = get
+
+        client = _make_client(tmp_path)
+
+        found, missing = await asyncio.gather(
+            client.get_paper("2301.00001", "normal"),
+            client.get_paper("2301.99999", "normal"),
+            return_exceptions=True,
+        )
+
+        assert not isinstance(found, BaseException)
+        assert found.arxiv_id == "2301.00001v1"
+        assert isinstance(missing, ValueError)
+        assert mock_http.get.call_count == 3
+
+
+class TestArxivClientGetPapers:
+    async def test_get_papers_preserves_order_and_marks_missing(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+
+        client = _make_client(tmp_path)
+
+        papers = await client.get_papers(["9999.99999", "2301.00001"], "normal")
+
+        assert papers[0] is None
+        assert papers[1] is not None
+        assert papers[1].arxiv_id == "2301.00001v1"
+        params = mock_http.get.call_args.kwargs["params"]
+        assert params["id_list"] == "9999.99999,2301.00001"
+        assert params["max_results"] == 2
+
+    async def test_get_papers_splits_into_id_list_chunks_and_skips_cached(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+
+        client = _make_client(tmp_path, config=_make_config().model_copy(update={"id_list_batch_size": 2}))
+
+        await client.get_papers(["2301.00001v1", "2301.00002", "2301.00003", "2301.00004"], "normal")
+        assert mock_http.get.call_count == 2
+
+        await client.get_papers(["2301.00001v1"], "normal")
+        assert mock_http.get.call_count == 2
+
+    async def test_get_papers_marks_malformed_ids_missing_without_sending_them(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+
+        client = _make_client(tmp_path)
+
+        papers = await client.get_papers(["2301.001", "2301.00001"], "normal")
+
+        assert papers[0] is None
+        assert papers[1] is not None
+        assert mock_http.get.call_args.kwargs["params"]["id_list"] == "2301.00001"
+
+    async def test_get_papers_rejected_chunk_falls_back_to_single_ids(self, mock_http, tmp_path):
+        async def get(url, params):
+            if params["id_list"] == "2301.00001":
+                return _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+            return _make_mock_response(status_code=400, text="incorrect id format")
+
+        mock_http.get.side_effect = get
+
+        client = _make_client(tmp_path)
+
+        papers = await client.get_papers(["2301.00001", "2301.99999"], "normal")
+
+        assert papers[0] is not None
+        assert papers[1] is None
+        assert [call.kwargs["params"]["id_list"] for call in mock_http.get.call_args_list] == [
+            "2301.00001,2301.99999",
+            "2301.00001",
+            "2301.99999",
+        ]
+
+
+class TestArxivClientStreamSearch:
+    async def test_stream_search_yields_header_then_papers(self, mock_http, tmp_path):
+        mock_response = _make_mock_response(status_code=200)
+        feed = _make_feed(start=0, count=3, total=3)
+        mock_response.aiter_bytes.return_value = _async_chunks([feed[index : index + 64] for index in range(0, len(feed), 64)])
+        mock_http.send.return_value = mock_response
+
+        client = _make_client(tmp_path)
+
+        items = [
+            item
+            async for item in await client.stream_search(
+                query="test", start=0, max_results=3, sort_by="relevance", sort_order="descending", priority="normal"
+            )
+        ]
+
+        assert items[0] == SearchFeedHeader(total_results=3, start_index=0, items_per_page=3)
+        assert [item.arxiv_id for item in items[1:]] == ["2301.00000v1", "2301.00001v1", "2301.00002v1"]
+        mock_response.aclose.assert_called()
+
+    async def test_stream_search_completed_feed_is_cached(self, mock_http, tmp_path):
+        mock_http.send.return_value = _make_mock_response(status_code=200, content=_make_feed(start=0, count=2, total=2))
+
+        client = _make_client(tmp_path)
+
+        streamed = [
+            item
+            async for item in await client.stream_search(
+                query="test", start=0, max_results=2, sort_by="relevance", sort_order="descending", priority="normal"
+            )
+        ]
+        replayed = [
+            item
+            async for item in await client.stream_search(
+                query="test", start=0, max_results=2, sort_by="relevance", sort_order="descending", priority="normal"
+            )
+        ]
+        result = await client.search(query="test", start=0, max_results=2, sort_by="relevance", sort_order="descending", priority="normal")
+
+        assert replayed == streamed
+        assert len(result.papers) == 2
+        assert mock_http.send.call_count == 1
+        mock_http.get.assert_not_called()
+
+    async def test_stream_search_non_200_raises_before_iteration(self, mock_http, tmp_path):
+        mock_http.send.return_value = _make_mock_response(status_code=500, text="Internal Server Error")
+
+        client = _make_client(tmp_path)
+
+        with pytest.raises(RuntimeError, match="status 500"):
+            await client.stream_search(
+                query="test", start=0, max_results=2, sort_by="relevance", sort_order="descending", priority="normal"
+            )
+
+    async def test_stream_search_closed_unread_releases_pool(self, mock_http, tmp_path):
+        mock_http.send.return_value = _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+
+        client = _make_client(tmp_path)
+
+        items = await client.stream_search(
+            query="test",
+            start=0,
+            max_results=10,
+            sort_by="relevance",
+            sort_order="descending",
+            priority="normal",
+        )
+        assert client.stats()["api_pool"]["in_flight"] == 1
+        await items.aclose()
+        assert client.stats()["api_pool"]["in_flight"] == 0
+
+    async def test_stream_search_releases_pool_before_client_reads(self, mock_http, tmp_path):
+        mock_http.send.return_value = _make_mock_response(status_code=200, content=_make_feed(start=0, count=3, total=3))
+
+        client = _make_client(tmp_path)
+
+        stream = await client.stream_search(
+            query="test", start=0, max_results=3, sort_by="relevance", sort_order="descending", priority="normal"
+        )
+        for _ in range(100):
+            if client.stats()["api_pool"]["in_flight"] == 0:
+                break
+            await asyncio.sleep(0)
+
+        assert client.stats()["api_pool"]["in_flight"] == 0
+        items = [item async for item in stream]
+        assert [item.arxiv_id for item in items[1:]] == ["2301.00000v1", "2301.00001v1", "2301.00002v1"]
+
 
 class TestArxivClientDownloadPdf:
-    @patch("arxivsmart.arxiv.client.httpx.Client")
-    def test_download_pdf_returns_bytes(self, mock_client_cls):
-        mock_http = MagicMock()
-        mock_http.get.return_value = _make_mock_response(status_code=200, content=b"%PDF-1.4 fake content")
-        mock_client_cls.return_value = mock_http
+    async def test_download_pdf_streams_and_stores(self, mock_http, tmp_path):
+        mock_response = _make_mock_response(status_code=200)
+        mock_response.aiter_bytes.return_value = _async_chunks([b"%PDF-1.4 ", b"fake content"])
+        mock_http.send.return_value = mock_response
+
+        pdf_store = _make_pdf_store(tmp_path)
+        client = _make_client(tmp_path, pdf_store=pdf_store)
+
+        pdf_stream = await client.download_pdf("2301.00001v1", "normal")
+        assert isinstance(pdf_stream, PdfStream)
+        assert [chunk async for chunk in pdf_stream] == [b"%PDF-1.4 ", b"fake content"]
+        mock_response.aclose.assert_called()
+
+        stored_path = pdf_store.lookup("2301.00001v1")
+        assert stored_path is not None
+        assert stored_path.read_bytes() == b"%PDF-1.4 fake content"
+        assert client.body_ledger().held_bytes()["pdf"] == 0
+        assert client.body_ledger().peak_bytes()["pdf"] == len(b"fake content")
+
+    async def test_download_pdf_expired_revalidated_on_304(self, mock_http, tmp_path):
+        not_modified = _make_mock_response(status_code=304)
+        mock_http.send.return_value = not_modified
+
+        pdf_store = _make_pdf_store(tmp_path)
+        writer = pdf_store.open_writer()
+        writer.write(b"%PDF-1.4 stored")
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1000.0):
+            stored_path = writer.commit("2301.00001", BlobValidators(etag='"abc"', last_modified=None))
+        client = _make_client(tmp_path, pdf_store=pdf_store)
+
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1061.0):
+            result = await client.download_pdf("2301.00001", "normal")
+
+        assert result == stored_path
+        assert mock_http.build_request.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        not_modified.aclose.assert_awaited_once()
+        assert client.stats()["pdf_pool"]["in_flight"] == 0
+
+    async def test_download_pdf_repeat_served_from_store(self, mock_http, tmp_path):
+        mock_http.send.return_value = _make_mock_response(status_code=200, content=b"%PDF-1.4 fake content")
+
+        client = _make_client(tmp_path)
+
+        first = await client.download_pdf("2301.00001v1", "normal")
+        assert isinstance(first, PdfStream)
+        [chunk async for chunk in first]
+        second = await client.download_pdf("2301.00001v1", "normal")
+
+        assert isinstance(second, Path)
+        assert second.read_bytes() == b"%PDF-1.4 fake content"
+        assert mock_http.send.call_count == 1
+
+    async def test_download_pdf_closed_early_is_not_stored(self, mock_http, tmp_path):
+        mock_response = _make_mock_response(status_code=200)
+        mock_response.aiter_bytes.return_value = _async_chunks([b"%PDF-1.4 ", b"fake content"])
+        mock_http.send.return_value = mock_response
+
+        pdf_store = _make_pdf_store(tmp_path)
+        client = _make_client(tmp_path, pdf_store=pdf_store)
+
+        pdf_stream = await client.download_pdf("2301.00001v1", "normal")
+        assert isinstance(pdf_stream, PdfStream)
+        chunks = aiter(pdf_stream)
+        await anext(chunks)
+        await pdf_stream.aclose()
+
+        mock_response.aclose.assert_called()
+        assert pdf_store.lookup("2301.00001v1") is None
+        assert client.stats()["pdf_flight"]["in_flight"] == 0
+
+    async def test_download_pdf_cancelled_leader_releases_flight(self, mock_http, tmp_path):
+        upstream_called = asyncio.Event()
+
+        async def send(request, stream):
+            if not upstream_called.is_set():
+                upstream_called.set()
+                await asyncio.Event().wait()
+            return _make_mock_response(status_code=200, content=b"%PDF-1.4 fake content")
+
+        mock_http.send.side_effect = send
+
+        client = _make_client(tmp_path)
+
+        leader = asyncio.create_task(client.download_pdf("2301.00001v1", "normal"))
+        await upstream_called.wait()
+        follower = asyncio.create_task(client.download_pdf("2301.00001v1", "normal"))
+        await _wait_for_pdf_followers(client, 1)
+        leader.cancel()
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await asyncio.wait_for(follower, timeout=1.0)
+        assert client.stats()["pdf_flight"]["in_flight"] == 0
+
+        retry = await asyncio.wait_for(client.download_pdf("2301.00001v1", "normal"), timeout=1.0)
+        assert isinstance(retry, PdfStream)
+        assert [chunk async for chunk in retry] == [b"%PDF-1.4 fake content"]
+
+    async def test_download_pdf_writer_failure_closes_response_and_fails_followers(self, mock_http, tmp_path):
+        upstream_called = asyncio.Event()
+        release_upstream = asyncio.Event()
+        mock_response = _make_mock_response(status_code=200, content=b"%PDF-1.4 fake content")
+
+        async def send(request, stream):
+            upstream_called.set()
+            await release_upstream.wait()
+            return mock_response
 
-        config = _make_config()
-        rate_limiter = RateLimiter(min_interval_seconds=config.rate_limit_seconds)
-        client = ArxivClient(config=config, api_rate_limiter=rate_limiter, pdf_rate_limiter=rate_limiter)
+        mock_http.send.side_effect = send
+
+        pdf_store = _make_pdf_store(tmp_path)
+        client = _make_client(tmp_path, pdf_store=pdf_store)
 
-        pdf_bytes = client.download_pdf("2301.00001v1")
-        assert pdf_bytes == b"%PDF-1.4 fake content"
+        with patch.object(pdf_store, "open_writer", side_effect=OSError("No space left on device")):
+            leader = asyncio.create_task(client.download_pdf("2301.00001v1", "normal"))
+            await upstream_called.wait()
+            follower = asyncio.create_task(client.download_pdf("2301.00001v1", "normal"))
+            await _wait_for_pdf_followers(client, 1)
+            release_upstream.set()
 
-    @patch("arxivsmart.arxiv.client.httpx.Client")
-    def test_download_pdf_non_200_raises(self, mock_client_cls):
-        mock_http = MagicMock()
-        mock_http.get.return_value = _make_mock_response(status_code=404)
-        mock_client_cls.return_value = mock_http
+            with pytest.raises(OSError, match="No space left"):
+                await leader
+            with pytest.raises(OSError, match="No space left"):
+                await asyncio.wait_for(follower, timeout=1.0)
 
-        config = _make_config()
-        rate_limiter = RateLimiter(min_interval_seconds=config.rate_limit_seconds)
-        client = ArxivClient(config=config, api_rate_limiter=rate_limiter, pdf_rate_limiter=rate_limiter)
+        mock_response.aclose.assert_awaited_once()
+        assert client.stats()["pdf_pool"]["in_flight"] == 0
+        assert client.stats()["pdf_flight"]["in_flight"] == 0
+
+    async def test_download_pdf_non_200_raises(self, mock_http, tmp_path):
+        mock_http.send.return_value = _make_mock_response(status_code=404)
+
+        client = _make_client(tmp_path)
 
         with pytest.raises(RuntimeError, match="PDF download failed"):
-            client.download_pdf("nonexistent")
+            await client.download_pdf("nonexistent", "normal")
+        assert client.stats()["pdf_flight"]["in_flight"] == 0
 
 
 class TestArxivClientFetchHtml:
-    @patch("arxivsmart.arxiv.client.httpx.Client")
-    def test_fetch_html_returns_string(self, mock_client_cls):
-        mock_http = MagicMock()
+    async def test_fetch_html_returns_string(self, mock_http, tmp_path):
         mock_http.get.return_value = _make_mock_response(status_code=200, text="<html><body>paper content</body></html>")
-        mock_client_cls.return_value = mock_http
 
-        config = _make_config()
-        rate_limiter = RateLimiter(min_interval_seconds=config.rate_limit_seconds)
-        client = ArxivClient(config=config, api_rate_limiter=rate_limiter, pdf_rate_limiter=rate_limiter)
+        client = _make_client(tmp_path)
 
-        html = client.fetch_html("2301.00001v1")
+        html = await client.fetch_html("2301.00001v1")
         assert "<html>" in html
+        assert client.body_ledger().held_bytes()["html"] == 0
+        assert client.body_ledger().peak_bytes()["html"] > 0
+
+    async def test_fetch_html_not_delayed_by_api_queue(self, mock_http, tmp_path):
+        api_release = asyncio.Event()
+
+        async def get(url, **kwargs):
+            if url.startswith("https://export.arxiv.org"):
+                await api_release.wait()
+                return _make_mock_response(status_code=200, content=SAMPLE_SEARCH_XML)
+            return _make_mock_response(status_code=200, text="<html>paper</html>")
+
+        mock_http.get.side_effect = get
+
+        client = _make_client(tmp_path)
+
+        searches = [
+            asyncio.create_task(
+                client.search(
+                    query=f"query {index}",
+                    start=0,
+                    max_results=10,
+                    sort_by="relevance",
+                    sort_order="descending",
+                    priority="normal",
+                )
+            )
+            for index in range(5)
+        ]
+        await asyncio.sleep(0.01)
+
+        html = await asyncio.wait_for(client.fetch_html("2301.00001v1"), timeout=0.5)
+        assert "paper" in html
+        assert client.stats()["api_pool"]["in_flight"] == 1
+
+        api_release.set()
+        await asyncio.gather(*searches)
+        await client.close()
+
+    async def test_fetch_html_repeat_served_from_store(self, mock_http, tmp_path):
+        mock_http.get.return_value = _make_mock_response(status_code=200, text="<html>stored</html>")
+
+        client = _make_client(tmp_path)
+
+        assert await client.fetch_html("2301.00001v1") == "<html>stored</html>"
+        assert await client.fetch_html("2301.00001v1") == "<html>stored</html>"
+        assert mock_http.get.await_count == 1
+
+    async def test_fetch_html_expired_revalidated_on_304(self, mock_http, tmp_path):
+        first = _make_mock_response(status_code=200, text="<html>v1</html>")
+        first.headers = {"etag": '"abc"', "last-modified": "Tue, 01 Oct 2024 00:00:00 GMT"}
+        mock_http.get.side_effect = [first, _make_mock_response(status_code=304)]
+
+        html_store = _make_html_store(tmp_path)
+        client = _make_client(tmp_path, html_store=html_store)
+
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1000.0):
+            await client.fetch_html("2301.00001")
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1061.0):
+            assert await client.fetch_html("2301.00001") == "<html>v1</html>"
+
+        conditional = mock_http.get.await_args_list[1].kwargs["headers"]
+        assert conditional == {"If-None-Match": '"abc"', "If-Modified-Since": "Tue, 01 Oct 2024 00:00:00 GMT"}
+        assert html_store.stats()["revalidations"] == 1
 
 
 class TestArxivClientFetchMarkdown:
-    @patch("arxivsmart.arxiv.client.httpx.Client")
-    def test_fetch_markdown_converts_html(self, mock_client_cls):
-        mock_http = MagicMock()
+    async def test_fetch_markdown_converts_html(self, mock_http, tmp_path):
         mock_http.get.return_value = _make_mock_response(status_code=200, text="<html><body><h1>Title</h1><p>Content</p></body></html>")
-        mock_client_cls.return_value = mock_http
 
-        config = _make_config()
-        rate_limiter = RateLimiter(min_interval_seconds=config.rate_limit_seconds)
-        client = ArxivClient(config=config, api_rate_limiter=rate_limiter, pdf_rate_limiter=rate_limiter)
+        client = _make_client(tmp_path)
 
-        md = client.fetch_markdown("2301.00001v1")
+        md = await client.fetch_markdown("2301.00001v1")
         assert isinstance(md, str)
         assert len(md) > 0
+
+
+class TestArxivClientConnections:
+    def test_api_host_limited_to_single_connection(self, mock_client_cls, tmp_path):
+
+        config = _make_config()
+        _make_client(tmp_path)
+
+        limits = [call.kwargs["limits"] for call in mock_client_cls.call_args_list]
+        assert len(limits) == 3
+        assert limits[0].max_connections == 1
+        assert limits[1].max_connections == config.pdf_max_concurrency
+        assert limits[2].max_connections == config.html_max_concurrency
+        assert all(limit.keepalive_expiry == config.keepalive_expiry_seconds for limit in limits)
+
+    def test_api_concurrency_above_one_requires_http2(self, tmp_path):
+        config = _make_config().model_copy(update={"api_max_concurrency": 2})
+        with pytest.raises(ValueError, match="api_http2"):
+            _make_client(tmp_path, config=config)
+
+    async def test_warm_up_opens_each_host(self, mock_http, tmp_path):
+        mock_http.head = AsyncMock(return_value=_make_mock_response(status_code=200))
+
+        config = _make_config()
+        client = _make_client(tmp_path, api_rate_limiter=_make_rate_limiter(config), pdf_rate_limiter=_make_rate_limiter(config))
+
+        await client.warm_up()
+
+        urls = sorted(call.args[0] for call in mock_http.head.await_args_list)
+        assert urls == sorted([config.base_url, config.pdf_base_url, config.html_base_url])
+        assert client.stats()["api_rate_limiter"]["background_granted"] == 1
+
+    async def test_warm_up_skips_busy_limiter_and_survives_errors(self, mock_http, tmp_path):
+        mock_http.head = AsyncMock(side_effect=httpx.ConnectError("unreachable"))
+
+        config = _make_config()
+        api_rate_limiter = _make_rate_limiter(config)
+        client = _make_client(tmp_path, api_rate_limiter=api_rate_limiter, pdf_rate_limiter=_make_rate_limiter(config))
+
+        await api_rate_limiter.acquire("normal")
+        await client.warm_up()
+        api_rate_limiter.release()
+
+        urls = sorted(call.args[0] for call in mock_http.head.await_args_list)
+        assert urls == sorted([config.pdf_base_url, config.html_base_url])
@@ -0,0 +1,158 @@
+"""Tests for the content-addressed blob store."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from arxivsmart.cache.blob_store import BlobStore, BlobValidators
+
+
+def _make_store(tmp_path, max_bytes: int) -> BlobStore:
+    return BlobStore(directory=tmp_path / "pdf", suffix=".pdf", max_bytes=max_bytes, unversioned_ttl_seconds=60.0)
+
+
+def _store_bytes(store: BlobStore, key: str, content: bytes):
+    writer = store.open_writer()
+    writer.write(content[: len(content) // 2])
+    writer.write(content[len(content) // 2 :])
+    return writer.commit(key, BlobValidators(etag=None, last_modified=None))
+
+
+class TestBlobStore:
+    def test_invalid_max_bytes_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="must be greater than 0"):
+            _make_store(tmp_path, max_bytes=0)
+
+    def test_commit_then_lookup(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        assert store.lookup("2301.00001v1") is None
+
+        path = _store_bytes(store, "2301.00001v1", b"%PDF-1.4 one")
+        assert path.read_bytes() == b"%PDF-1.4 one"
+        assert store.lookup("2301.00001v1") == path
+
+        stats = store.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["bytes"] == len(b"%PDF-1.4 one")
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        first = _store_bytes(store, "2301.00001", b"%PDF-1.4 same")
+        second = _store_bytes(store, "2301.00001v3", b"%PDF-1.4 same")
+
+        assert first == second
+        assert store.stats()["entries"] == 1
+
+    def test_evicts_least_recently_used_over_budget(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=20)
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1.0):
+            _store_bytes(store, "a.1v1", b"0123456789")
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=2.0):
+            _store_bytes(store, "b.1v1", b"abcdefghij")
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=3.0):
+            assert store.lookup("a.1v1") is not None
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=4.0):
+            _store_bytes(store, "c.1v1", b"ABCDEFGHIJ")
+
+        assert store.lookup("b.1v1") is None
+        assert store.lookup("a.1v1") is not None
+        assert store.lookup("c.1v1") is not None
+        stats = store.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 20
+
+    def test_totals_are_restored_when_reopened(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        _store_bytes(store, "a.1v1", b"0123456789")
+        _store_bytes(store, "b.1v1", b"abcde")
+        store.close()
+
+        reopened = _make_store(tmp_path, max_bytes=1024)
+        assert reopened.stats()["entries"] == 2
+        assert reopened.stats()["bytes"] == 15
+
+    def test_missing_object_file_is_dropped_from_totals(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        path = _store_bytes(store, "a.1v1", b"0123456789")
+        path.unlink()
+
+        assert store.lookup("a.1v1") is None
+        assert store.stats()["entries"] == 0
+        assert store.stats()["bytes"] == 0
+
+    def test_hit_access_time_is_written_with_the_next_commit(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1.0):
+            _store_bytes(store, "a.1v1", b"0123456789")
+        index = sqlite3.connect(str(tmp_path / "pdf" / "index.sqlite3"))
+
+        def last_access() -> float:
+            return index.execute("SELECT MIN(last_access) FROM objects").fetchone()[0]
+
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=2.0):
+            assert store.lookup("a.1v1") is not None
+        assert last_access() == 1.0
+
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=3.0):
+            _store_bytes(store, "b.1v1", b"abcdefghij")
+        assert last_access() == 2.0
+        index.close()
+
+    def test_oversized_document_is_kept_until_next_commit(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=4)
+        path = _store_bytes(store, "a.1v1", b"0123456789")
+        assert path.exists()
+
+    def test_unversioned_key_expires(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1000.0):
+            _store_bytes(store, "2301.00001", b"%PDF-1.4")
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1061.0):
+            assert store.lookup("2301.00001") is None
+
+    def test_abort_removes_temp_file(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        writer = store.open_writer()
+        writer.write(b"partial")
+        writer.abort()
+        assert list((tmp_path / "pdf" / "tmp").iterdir()) == []
+
+    def test_expired_key_with_validators_can_be_renewed(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        writer = store.open_writer()
+        writer.write(b"%PDF-1.4")
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1000.0):
+            path = writer.commit("2301.00001", BlobValidators(etag='"v1"', last_modified=None))
+            assert store.lookup_expired("2301.00001") is None
+
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1061.0):
+            expired = store.lookup_expired("2301.00001")
+            assert expired is not None
+            assert expired.path == path
+            assert expired.validators == BlobValidators(etag='"v1"', last_modified=None)
+
+            assert store.renew("2301.00001", BlobValidators(etag='"v1"', last_modified="Tue, 01 Oct 2024 00:00:00 GMT")) == path
+            assert store.lookup("2301.00001") == path
+        assert store.stats()["revalidations"] == 1
+
+    def test_expired_key_without_validators_is_not_revalidated(self, tmp_path):
+        store = _make_store(tmp_path, max_bytes=1024)
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1000.0):
+            _store_bytes(store, "2301.00001", b"%PDF-1.4")
+        with patch("arxivsmart.cache.blob_store.time.time", return_value=1061.0):
+            assert store.lookup_expired("2301.00001") is None
+
+    def test_index_without_validator_columns_is_migrated(self, tmp_path):
+        (tmp_path / "pdf").mkdir()
+        connection = sqlite3.connect(str(tmp_path / "pdf" / "index.sqlite3"))
+        connection.execute("CREATE TABLE refs (key TEXT PRIMARY KEY, digest TEXT NOT NULL, expires_at REAL)")
+        connection.commit()
+        connection.close()
+
+        store = _make_store(tmp_path, max_bytes=1024)
+        path = _store_bytes(store, "2301.00001v1", b"%PDF-1.4")
+        assert store.lookup("2301.00001v1") == path
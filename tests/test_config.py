@@ -2,12 +2,13 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 from pydantic import ValidationError
 
-from arxivsmart.config import ArxivConfig, Config, ServiceConfig
+from arxivsmart.config import ArxivConfig, CacheConfig, Config, DebugConfig, ServiceConfig
 
 
 def _write_yaml(path: Path, data: dict) -> None:
@@ -28,8 +29,44 @@ def _valid_config_data() -> dict:
             "pdf_base_url": "https://arxiv.org/pdf",
             "html_base_url": "https://ar5iv.labs.arxiv.org/html",
             "rate_limit_seconds": 3.0,
+            "rate_limit_max_seconds": 60.0,
+            "rate_limit_backoff_factor": 2.0,
+            "rate_limit_recovery_successes": 10,
+            "api_max_queue_depth": 20,
+            "pdf_max_queue_depth": 20,
+            "throttle_max_retries": 2,
             "request_timeout_seconds": 30.0,
             "max_results_limit": 2000,
+            "id_list_batch_size": 100,
+            "api_max_concurrency": 1,
+            "api_workers": 2,
+            "pdf_max_concurrency": 4,
+            "pdf_workers": 2,
+            "html_max_concurrency": 8,
+            "html_workers": 4,
+            "keepalive_expiry_seconds": 60.0,
+            "api_http2": False,
+            "pdf_http2": False,
+            "html_http2": False,
+            "warm_up_connections": False,
+        },
+        "cache": {
+            "directory": ".cache/arxivsmart",
+            "metadata_unversioned_ttl_seconds": 86400.0,
+            "pdf_max_bytes": 2147483648,
+            "pdf_unversioned_ttl_seconds": 86400.0,
+            "html_max_bytes": 536870912,
+            "html_unversioned_ttl_seconds": 86400.0,
+            "search_soft_ttl_seconds": 3600.0,
+            "search_hard_ttl_seconds": 86400.0,
+            "search_max_entries": 1000,
+            "search_overfetch_window": 100,
+        },
+        "debug": {
+            "profiler_enabled": False,
+            "profiler_max_seconds": 60.0,
+            "tracemalloc_enabled": False,
+            "tracemalloc_top_allocators": 25,
         },
     }
 
@@ -64,8 +101,26 @@ class TestArxivConfig:
             pdf_base_url="https://arxiv.org/pdf",
             html_base_url="https://ar5iv.labs.arxiv.org/html",
             rate_limit_seconds=3.0,
+            rate_limit_max_seconds=60.0,
+            rate_limit_backoff_factor=2.0,
+            rate_limit_recovery_successes=10,
+            api_max_queue_depth=20,
+            pdf_max_queue_depth=20,
+            throttle_max_retries=2,
             request_timeout_seconds=30.0,
             max_results_limit=2000,
+            id_list_batch_size=100,
+            api_max_concurrency=1,
+            api_workers=2,
+            pdf_max_concurrency=4,
+            pdf_workers=2,
+            html_max_concurrency=8,
+            html_workers=4,
+            keepalive_expiry_seconds=60.0,
+            api_http2=False,
+            pdf_http2=False,
+            html_http2=False,
+            warm_up_connections=False,
         )
         assert config.rate_limit_seconds == 3.0
 
@@ -76,8 +131,26 @@ class TestArxivConfig:
                 pdf_base_url="https://arxiv.org/pdf",
                 html_base_url="https://ar5iv.labs.arxiv.org/html",
                 rate_limit_seconds=3.0,
+                rate_limit_max_seconds=60.0,
+                rate_limit_backoff_factor=2.0,
+                rate_limit_recovery_successes=10,
+                api_max_queue_depth=20,
+                pdf_max_queue_depth=20,
+                throttle_max_retries=2,
                 request_timeout_seconds=30.0,
                 max_results_limit=2000,
+                id_list_batch_size=100,
+                api_max_concurrency=1,
+                api_workers=2,
+                pdf_max_concurrency=4,
+                pdf_workers=2,
+                html_max_concurrency=8,
+                html_workers=4,
+                keepalive_expiry_seconds=60.0,
+                api_http2=False,
+                pdf_http2=False,
+                html_http2=False,
+                warm_up_connections=False,
             )
 
     def test_zero_rate_limit_raises(self):
@@ -87,8 +160,26 @@ class TestArxivConfig:
                 pdf_base_url="https://arxiv.org/pdf",
                 html_base_url="https://ar5iv.labs.arxiv.org/html",
                 rate_limit_seconds=0.0,
+                rate_limit_max_seconds=60.0,
+                rate_limit_backoff_factor=2.0,
+                rate_limit_recovery_successes=10,
+                api_max_queue_depth=20,
+                pdf_max_queue_depth=20,
+                throttle_max_retries=2,
                 request_timeout_seconds=30.0,
                 max_results_limit=2000,
+                id_list_batch_size=100,
+                api_max_concurrency=1,
+                api_workers=2,
+                pdf_max_concurrency=4,
+                pdf_workers=2,
+                html_max_concurrency=8,
+                html_workers=4,
+                keepalive_expiry_seconds=60.0,
+                api_http2=False,
+                pdf_http2=False,
+                html_http2=False,
+                warm_up_connections=False,
             )
 
     def test_negative_timeout_raises(self):
@@ -98,8 +189,26 @@ class TestArxivConfig:
                 pdf_base_url="https://arxiv.org/pdf",
                 html_base_url="https://ar5iv.labs.arxiv.org/html",
                 rate_limit_seconds=3.0,
+                rate_limit_max_seconds=60.0,
+                rate_limit_backoff_factor=2.0,
+                rate_limit_recovery_successes=10,
+                api_max_queue_depth=20,
+                pdf_max_queue_depth=20,
+                throttle_max_retries=2,
                 request_timeout_seconds=-1.0,
                 max_results_limit=2000,
+                id_list_batch_size=100,
+                api_max_concurrency=1,
+                api_workers=2,
+                pdf_max_concurrency=4,
+                pdf_workers=2,
+                html_max_concurrency=8,
+                html_workers=4,
+                keepalive_expiry_seconds=60.0,
+                api_http2=False,
+                pdf_http2=False,
+                html_http2=False,
+                warm_up_connections=False,
             )
 
     def test_zero_max_results_raises(self):
@@ -109,11 +218,119 @@ class TestArxivConfig:
                 pdf_base_url="https://arxiv.org/pdf",
                 html_base_url="https://ar5iv.labs.arxiv.org/html",
                 rate_limit_seconds=3.0,
+                rate_limit_max_seconds=60.0,
+                rate_limit_backoff_factor=2.0,
+                rate_limit_recovery_successes=10,
+                api_max_queue_depth=20,
+                pdf_max_queue_depth=20,
+                throttle_max_retries=2,
                 request_timeout_seconds=30.0,
                 max_results_limit=0,
+                id_list_batch_size=100,
+                api_max_concurrency=1,
+                api_workers=2,
+                pdf_max_concurrency=4,
+                pdf_workers=2,
+                html_max_concurrency=8,
+                html_workers=4,
+                keepalive_expiry_seconds=60.0,
+                api_http2=False,
+                pdf_http2=False,
+                html_http2=False,
+                warm_up_connections=False,
+            )
+
+    def test_backoff_factor_of_one_raises(self):
+        with pytest.raises(ValidationError):
+            ArxivConfig(
+                base_url="https://export.arxiv.org/api/query",
+                pdf_base_url="https://arxiv.org/pdf",
+                html_base_url="https://ar5iv.labs.arxiv.org/html",
+                rate_limit_seconds=3.0,
+                rate_limit_max_seconds=60.0,
+                rate_limit_backoff_factor=1.0,
+                rate_limit_recovery_successes=10,
+                api_max_queue_depth=20,
+                pdf_max_queue_depth=20,
+                throttle_max_retries=2,
+                request_timeout_seconds=30.0,
+                max_results_limit=2000,
+                id_list_batch_size=100,
+                api_max_concurrency=1,
+                api_workers=2,
+                pdf_max_concurrency=4,
+                pdf_workers=2,
+                html_max_concurrency=8,
+                html_workers=4,
+                keepalive_expiry_seconds=60.0,
+                api_http2=False,
+                pdf_http2=False,
+                html_http2=False,
+                warm_up_connections=False,
             )
 
 
+def _valid_cache_config_data() -> dict:
+    return _valid_config_data()["cache"]
+
+    def test_zero_max_queue_depth_raises(self):
+        with pytest.raises(ValidationError):
+            ArxivConfig(**{**_valid_config_data()["arxiv"], "api_max_queue_depth": 0})
+
+
+class TestCacheConfig:
+    def test_valid_cache_config(self):
+        config = CacheConfig(**_valid_cache_config_data())
+        assert config.metadata_unversioned_ttl_seconds == 86400.0
+        assert config.pdf_max_bytes == 2147483648
+
+    def test_empty_directory_raises(self):
+        with pytest.raises(ValidationError):
+            CacheConfig(**{**_valid_cache_config_data(), "directory": "  "})
+
+    def test_zero_metadata_ttl_raises(self):
+        with pytest.raises(ValidationError):
+            CacheConfig(**{**_valid_cache_config_data(), "metadata_unversioned_ttl_seconds": 0.0})
+
+    def test_zero_pdf_max_bytes_raises(self):
+        with pytest.raises(ValidationError):
+            CacheConfig(**{**_valid_cache_config_data(), "pdf_max_bytes": 0})
+
+    def test_zero_pdf_ttl_raises(self):
+        with pytest.raises(ValidationError):
+            CacheConfig(**{**_valid_cache_config_data(), "pdf_unversioned_ttl_seconds": 0.0})
+
+    def test_zero_search_soft_ttl_raises(self):
+        with pytest.raises(ValidationError):
+            CacheConfig(**{**_valid_cache_config_data(), "search_soft_ttl_seconds": 0.0})
+
+    def test_null_overfetch_window_disables(self):
+        config = CacheConfig(**{**_valid_cache_config_data(), "search_overfetch_window": None})
+        assert config.search_overfetch_window is None
+
+    def test_zero_overfetch_window_raises(self):
+        with pytest.raises(ValidationError):
+            CacheConfig(**{**_valid_cache_config_data(), "search_overfetch_window": 0})
+
+    def test_zero_search_max_entries_raises(self):
+        with pytest.raises(ValidationError):
+            CacheConfig(**{**_valid_cache_config_data(), "search_max_entries": 0})
+
+
+class TestDebugConfig:
+    def test_valid_debug_config(self):
+        config = DebugConfig(**_valid_config_data()["debug"])
+        assert config.profiler_enabled is False
+
+    def test_zero_profiler_max_seconds_raises(self):
+        with pytest.raises(ValidationError):
+            DebugConfig(**{**_valid_config_data()["debug"], "profiler_max_seconds": 0.0})
+
+    def test_zero_tracemalloc_top_allocators_raises(self):
+        with pytest.raises(ValidationError):
+            DebugConfig(**{**_valid_config_data()["debug"], "tracemalloc_top_allocators": 0})
+
+
 class TestConfig:
     def test_from_yaml_valid(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -159,9 +376,28 @@ class TestConfig:
             arxiv = config.get_arxiv_config()
             assert arxiv.max_results_limit == 2000
 
+    def test_get_cache_config(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            _write_yaml(config_path, _valid_config_data())
+            config = Config.from_yaml(config_path)
+            cache = config.get_cache_config()
+            assert cache.directory == ".cache/arxivsmart"
+
+    def test_get_debug_config(self):
+        config = Config.model_validate(_valid_config_data())
+        assert config.get_debug_config().profiler_max_seconds == 60.0
+
     def test_validate_startup_does_not_raise(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / "config.yaml"
             _write_yaml(config_path, _valid_config_data())
             config = Config.from_yaml(config_path)
             config.validate_startup()
+
+    def test_validate_startup_http2_without_h2_raises(self):
+        data = _valid_config_data()
+        data["arxiv"]["pdf_http2"] = True
+        config = Config.model_validate(data)
+        with patch("arxivsmart.config.find_spec", return_value=None), pytest.raises(ValueError, match="h2"):
+            config.validate_startup()
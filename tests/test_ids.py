@@ -0,0 +1,33 @@
+"""Tests for arXiv identifier helpers."""
+
+from arxivsmart.arxiv.ids import is_valid_id, is_versioned_id, strip_version
+
+
+class TestIsValidId:
+    def test_accepts_new_style_ids(self):
+        assert is_valid_id("0704.0001")
+        assert is_valid_id("2301.00001")
+        assert is_valid_id("2301.00001v12")
+
+    def test_accepts_old_style_ids(self):
+        assert is_valid_id("hep-th/9901001")
+        assert is_valid_id("math.GT/0309136v2")
+        assert is_valid_id("cond-mat/0011010")
+
+    def test_rejects_malformed_ids(self):
+        assert not is_valid_id("")
+        assert not is_valid_id("2301.001")
+        assert not is_valid_id("2301.00001v")
+        assert not is_valid_id("2301.00001,2301.00002")
+        assert not is_valid_id(" 2301.00001")
+        assert not is_valid_id("hep-th/990100")
+
+
+class TestVersions:
+    def test_versioned_id(self):
+        assert is_versioned_id("2301.00001v2")
+        assert not is_versioned_id("2301.00001")
+
+    def test_strip_version(self):
+        assert strip_version("2301.00001v2") == "2301.00001"
+        assert strip_version("hep-th/9901001") == "hep-th/9901001"
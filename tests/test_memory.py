@@ -0,0 +1,68 @@
+"""Tests for memory accounting."""
+
+import tracemalloc
+
+from arxivsmart.arxiv.types import Author
+from arxivsmart.memory import BodyLedger, approximate_size, peak_resident_set_bytes, resident_set_bytes, traced_memory
+
+
+class TestBodyLedger:
+    def test_hold_counts_until_the_block_exits(self):
+        ledger = BodyLedger()
+        with ledger.hold("pdf", 100):
+            with ledger.hold("pdf", 50):
+                assert ledger.held_bytes()["pdf"] == 150
+            with ledger.hold("markdown", 70):
+                assert ledger.stats()["total_bytes"] == 170
+
+        assert ledger.held_bytes() == {"feed": 0, "pdf": 0, "html": 0, "markdown": 0}
+        assert ledger.peak_bytes()["pdf"] == 150
+        assert ledger.peak_bytes()["markdown"] == 70
+        assert ledger.stats()["total_peak_bytes"] == 170
+
+    def test_hold_releases_when_the_block_raises(self):
+        ledger = BodyLedger()
+        try:
+            with ledger.hold("html", 10):
+                raise RuntimeError("conversion failed")
+        except RuntimeError:
+            pass
+        assert ledger.held_bytes()["html"] == 0
+
+
+class TestApproximateSize:
+    def test_walks_dataclasses_and_counts_shared_objects_once(self):
+        name = "x" * 1000
+        one = approximate_size((Author(name=name, affiliation=""),))
+        two = approximate_size((Author(name=name, affiliation=""), Author(name=name, affiliation="")))
+
+        assert one > 1000
+        assert two - one < 1000
+
+
+class TestProcessMemory:
+    def test_resident_set_is_reported(self):
+        rss = resident_set_bytes()
+        assert rss is None or rss > 0
+        assert peak_resident_set_bytes() > 0
+
+
+class TestTracedMemory:
+    def test_none_when_not_tracing(self):
+        assert not tracemalloc.is_tracing()
+        assert traced_memory(5) is None
+
+    def test_lists_top_allocators_when_tracing(self):
+        tracemalloc.start()
+        try:
+            held = [bytearray(100_000) for _ in range(5)]
+            traced = traced_memory(3)
+        finally:
+            tracemalloc.stop()
+
+        assert traced is not None
+        assert len(held) == 5
+        assert 0 < len(traced.top_allocators) <= 3
+        assert "test_memory.py:" in traced.top_allocators[0].location
+        assert traced.top_allocators[0].size_bytes >= 500_000
+        assert traced.traced_bytes >= traced.top_allocators[0].size_bytes
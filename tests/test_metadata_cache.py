@@ -0,0 +1,88 @@
+"""Tests for the persistent metadata cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from arxivsmart.arxiv.types import Author, Paper
+from arxivsmart.cache.metadata import MetadataCache
+
+
+def _make_paper(arxiv_id: str) -> Paper:
+    return Paper(
+        arxiv_id=arxiv_id,
+        title="Test Paper",
+        summary="Abstract.",
+        authors=(Author(name="Alice", affiliation="MIT"),),
+        categories=("cs.AI", "cs.LG"),
+        primary_category="cs.AI",
+        published="2023-01-01T00:00:00Z",
+        updated="2023-01-01T00:00:00Z",
+        pdf_url="http://arxiv.org/pdf/2301.00001v2",
+        abstract_url="http://arxiv.org/abs/2301.00001v2",
+        doi="",
+        comment="",
+        journal_ref="",
+    )
+
+
+class TestMetadataCache:
+    def test_invalid_ttl_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="must be greater than 0"):
+            MetadataCache(database_path=tmp_path / "metadata.sqlite3", unversioned_ttl_seconds=0.0)
+
+    def test_miss_then_hit_round_trips_paper(self, tmp_path):
+        cache = MetadataCache(database_path=tmp_path / "metadata.sqlite3", unversioned_ttl_seconds=60.0)
+        paper = _make_paper("2301.00001v2")
+
+        assert cache.get("2301.00001v2") is None
+        cache.put("2301.00001v2", paper)
+        assert cache.get("2301.00001v2") == paper
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_hit_interns_categories(self, tmp_path):
+        cache = MetadataCache(database_path=tmp_path / "metadata.sqlite3", unversioned_ttl_seconds=60.0)
+        cache.put("2301.00001v2", _make_paper("2301.00001v2"))
+        cache.put("2301.00002v1", _make_paper("2301.00002v1"))
+
+        first = cache.get("2301.00001v2")
+        second = cache.get("2301.00002v1")
+        assert first is not None
+        assert second is not None
+        assert first.categories[1] is second.categories[1]
+
+    def test_persists_across_instances(self, tmp_path):
+        database_path = tmp_path / "metadata.sqlite3"
+        cache = MetadataCache(database_path=database_path, unversioned_ttl_seconds=60.0)
+        cache.put("2301.00001v2", _make_paper("2301.00001v2"))
+        cache.close()
+
+        reopened = MetadataCache(database_path=database_path, unversioned_ttl_seconds=60.0)
+        assert reopened.get("2301.00001v2") is not None
+        assert reopened.stats()["entries"] == 1
+
+    def test_replacing_an_entry_keeps_the_count(self, tmp_path):
+        cache = MetadataCache(database_path=tmp_path / "metadata.sqlite3", unversioned_ttl_seconds=60.0)
+        cache.put("2301.00001", _make_paper("2301.00001v2"))
+        cache.put("2301.00001", _make_paper("2301.00001v2"))
+        cache.put("2301.00001v2", _make_paper("2301.00001v2"))
+
+        assert cache.stats()["entries"] == 2
+
+    def test_unversioned_id_expires_after_ttl(self, tmp_path):
+        cache = MetadataCache(database_path=tmp_path / "metadata.sqlite3", unversioned_ttl_seconds=60.0)
+        with patch("arxivsmart.cache.metadata.time.time", return_value=1000.0):
+            cache.put("2301.00001", _make_paper("2301.00001v2"))
+
+        with patch("arxivsmart.cache.metadata.time.time", return_value=1059.0):
+            assert cache.get("2301.00001") is not None
+        with patch("arxivsmart.cache.metadata.time.time", return_value=1061.0):
+            assert cache.get("2301.00001") is None
+
+    def test_unversioned_put_also_caches_resolved_version_forever(self, tmp_path):
+        cache = MetadataCache(database_path=tmp_path / "metadata.sqlite3", unversioned_ttl_seconds=60.0)
+        with patch("arxivsmart.cache.metadata.time.time", return_value=1000.0):
+            cache.put("2301.00001", _make_paper("2301.00001v2"))
+
+        with patch("arxivsmart.cache.metadata.time.time", return_value=10_000_000.0):
+            assert cache.get("2301.00001v2") is not None
@@ -0,0 +1,55 @@
+"""Tests for histograms and the Prometheus exposition writer."""
+
+import pytest
+
+from arxivsmart.metrics import Exposition, Histogram
+
+
+class TestHistogram:
+    def test_unsorted_buckets_raise(self):
+        with pytest.raises(ValueError, match="buckets must be a non-empty ascending sequence"):
+            Histogram((1.0, 0.5))
+
+    def test_observations_land_in_cumulative_buckets(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative_counts() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+        assert histogram.count() == 4
+        assert histogram.total() == pytest.approx(3.65)
+
+
+class TestExposition:
+    def test_counter_and_gauge_lines(self):
+        exposition = Exposition()
+        exposition.counter("requests_total", "Requests.", [({"route": "/v1/search"}, 3)])
+        exposition.gauge("queue_depth", "Waiters.", [({}, 1.5)])
+
+        assert exposition.render() == (
+            "# HELP requests_total Requests.\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{route="/v1/search"} 3\n'
+            "# HELP queue_depth Waiters.\n"
+            "# TYPE queue_depth gauge\n"
+            "queue_depth 1.5\n"
+        )
+
+    def test_histogram_lines(self):
+        histogram = Histogram((0.5,))
+        histogram.observe(0.25)
+        exposition = Exposition()
+        exposition.histogram("wait_seconds", "Wait.", [({"limiter": "api"}, histogram)])
+
+        assert exposition.render().splitlines()[2:] == [
+            'wait_seconds_bucket{limiter="api",le="0.5"} 1',
+            'wait_seconds_bucket{limiter="api",le="+Inf"} 1',
+            'wait_seconds_sum{limiter="api"} 0.25',
+            'wait_seconds_count{limiter="api"} 1',
+        ]
+
+    def test_label_values_are_escaped(self):
+        exposition = Exposition()
+        exposition.gauge("value", "Value.", [({"name": 'a"b\\c\nd'}, 1)])
+
+        assert exposition.render().splitlines()[2] == 'value{name="a\\"b\\\\c\\nd"} 1'
@@ -0,0 +1,183 @@
+"""Tests for micro-batching of concurrent single-paper lookups."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from arxivsmart.arxiv.paper_batcher import PaperBatcher
+from arxivsmart.arxiv.rate_limiter import RateLimiter, RateLimiterFullError, UpstreamThrottledError
+from arxivsmart.arxiv.types import Paper
+from arxivsmart.server_timing import collect_server_timing
+
+
+def _make_rate_limiter(min_interval_seconds: float) -> RateLimiter:
+    return RateLimiter(
+        min_interval_seconds=min_interval_seconds,
+        max_interval_seconds=1.0,
+        backoff_factor=2.0,
+        recovery_successes=2,
+        max_queue_depth=100,
+    )
+
+
+def _make_paper(arxiv_id: str) -> Paper:
+    return Paper(
+        arxiv_id=arxiv_id,
+        title="Test Paper",
+        summary="Abstract.",
+        authors=(),
+        categories=("cs.AI",),
+        primary_category="cs.AI",
+        published="2023-01-01T00:00:00Z",
+        updated="2023-01-01T00:00:00Z",
+        pdf_url="",
+        abstract_url="",
+        doi="",
+        comment="",
+        journal_ref="",
+    )
+
+
+class TestPaperBatcher:
+    def test_invalid_batch_size_raises(self):
+        with pytest.raises(ValueError, match="must be greater than 0"):
+            PaperBatcher(rate_limiter=_make_rate_limiter(0.01), fetch_batch=AsyncMock(return_value={}), max_batch_size=0, max_retries=1)
+
+    async def test_single_lookup_found_and_missing(self):
+        batcher = PaperBatcher(
+            rate_limiter=_make_rate_limiter(0.01),
+            fetch_batch=AsyncMock(return_value={"a": _make_paper("a")}),
+            max_batch_size=10,
+            max_retries=1,
+        )
+        found = await batcher.lookup("a", "normal")
+        assert found is not None
+        assert found.arxiv_id == "a"
+        assert await batcher.lookup("b", "normal") is None
+
+    async def test_every_lookup_in_a_batch_gets_its_timing(self):
+        batcher = PaperBatcher(
+            rate_limiter=_make_rate_limiter(0.01),
+            fetch_batch=AsyncMock(return_value={"a": _make_paper("a"), "b": _make_paper("b")}),
+            max_batch_size=10,
+            max_retries=1,
+        )
+
+        async def timed_lookup(arxiv_id: str) -> dict[str, float]:
+            with collect_server_timing() as timing:
+                await batcher.lookup(arxiv_id, "normal")
+            return timing.durations()
+
+        first, second = await asyncio.gather(timed_lookup("a"), timed_lookup("b"))
+        assert first == second
+        assert "limiter" in first
+
+    async def test_concurrent_lookups_share_batches(self):
+        batches: list[list[str]] = []
+
+        async def fetch(ids: list[str]) -> dict[str, Paper]:
+            batches.append(ids)
+            await asyncio.sleep(0.05)
+            return {arxiv_id: _make_paper(arxiv_id) for arxiv_id in ids}
+
+        batcher = PaperBatcher(rate_limiter=_make_rate_limiter(0.2), fetch_batch=fetch, max_batch_size=100, max_retries=1)
+        ids = [f"id{i}" for i in range(10)]
+        results = await asyncio.gather(*(batcher.lookup(arxiv_id, "normal") for arxiv_id in ids))
+
+        assert len(batches) <= 2
+        assert sorted(arxiv_id for batch in batches for arxiv_id in batch) == sorted(ids)
+        assert all(paper is not None and paper.arxiv_id == arxiv_id for arxiv_id, paper in zip(ids, results, strict=True))
+        assert batcher.stats()["lookups"] == 10
+
+    async def test_batches_respect_max_size(self):
+        batches: list[list[str]] = []
+
+        async def fetch(ids: list[str]) -> dict[str, Paper]:
+            batches.append(ids)
+            return {}
+
+        batcher = PaperBatcher(rate_limiter=_make_rate_limiter(0.05), fetch_batch=fetch, max_batch_size=2, max_retries=1)
+        await asyncio.gather(*(batcher.lookup(f"id{i}", "normal") for i in range(5)))
+
+        assert all(len(batch) <= 2 for batch in batches)
+        assert sum(len(batch) for batch in batches) == 5
+
+    async def test_fetch_error_propagates_to_batch(self):
+        fetch = AsyncMock(side_effect=RuntimeError("arXiv API returned status 503"))
+        batcher = PaperBatcher(rate_limiter=_make_rate_limiter(0.01), fetch_batch=fetch, max_batch_size=10, max_retries=1)
+        with pytest.raises(RuntimeError, match="503"):
+            await batcher.lookup("a", "normal")
+
+    async def test_cancelled_dispatcher_fails_batched_and_pending_lookups(self):
+        dispatchers: list[asyncio.Task] = []
+
+        async def fetch(ids: list[str]) -> dict[str, Paper]:
+            dispatchers.append(asyncio.current_task())
+            await asyncio.Event().wait()
+            return {}
+
+        batcher = PaperBatcher(rate_limiter=_make_rate_limiter(0.01), fetch_batch=fetch, max_batch_size=2, max_retries=1)
+        lookups = [asyncio.create_task(batcher.lookup(arxiv_id, "normal")) for arxiv_id in ("a", "b", "c")]
+        while not dispatchers:
+            await asyncio.sleep(0)
+        dispatchers[0].cancel()
+        results = await asyncio.wait_for(asyncio.gather(*lookups, return_exceptions=True), timeout=1.0)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert batcher.stats()["pending"] == 0
+
+    async def test_rejection_by_a_full_limiter_fails_every_pending_lookup(self):
+        limiter = RateLimiter(
+            min_interval_seconds=0.01,
+            max_interval_seconds=1.0,
+            backoff_factor=2.0,
+            recovery_successes=2,
+            max_queue_depth=1,
+        )
+        fetch = AsyncMock(return_value={})
+        batcher = PaperBatcher(rate_limiter=limiter, fetch_batch=fetch, max_batch_size=10, max_retries=1)
+
+        await limiter.acquire("normal")
+        queued = asyncio.create_task(limiter.acquire("normal"))
+        await asyncio.sleep(0)
+        lookups = [asyncio.create_task(batcher.lookup(arxiv_id, "normal")) for arxiv_id in ("a", "b")]
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+
+        assert all(isinstance(result, RateLimiterFullError) for result in results)
+        assert batcher.stats()["pending"] == 0
+        fetch.assert_not_called()
+
+        queued.cancel()
+        await asyncio.gather(queued, return_exceptions=True)
+        limiter.release()
+
+    async def test_dispatcher_queues_at_most_urgent_pending_priority(self):
+        limiter = _make_rate_limiter(0.01)
+        batcher = PaperBatcher(rate_limiter=limiter, fetch_batch=AsyncMock(return_value={}), max_batch_size=10, max_retries=1)
+
+        await limiter.acquire("normal")
+        lookups = [
+            asyncio.create_task(batcher.lookup("a", "background")),
+            asyncio.create_task(batcher.lookup("b", "interactive")),
+        ]
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*lookups)
+
+        assert limiter.stats()["interactive_granted"] == 1
+        assert batcher.stats()["batches"] == 1
+
+    async def test_throttled_batch_is_retried_in_a_new_slot(self):
+        limiter = _make_rate_limiter(0.01)
+        fetch = AsyncMock(
+            side_effect=[UpstreamThrottledError("arXiv returned status 503", retry_after_seconds=None), {"a": _make_paper("a")}]
+        )
+        batcher = PaperBatcher(rate_limiter=limiter, fetch_batch=fetch, max_batch_size=10, max_retries=1)
+
+        paper = await batcher.lookup("a", "normal")
+
+        assert paper is not None
+        assert fetch.await_count == 2
+        assert limiter.stats()["retried"] == 1
+        assert batcher.stats()["batches"] == 1
@@ -1,9 +1,11 @@
 """Tests for the arXiv Atom XML parser."""
 
+from xml.etree.ElementTree import ParseError
+
 import pytest
 
-from arxivsmart.arxiv.parser import parse_author, parse_search_response
-from arxivsmart.arxiv.types import Author
+from arxivsmart.arxiv.parser import SearchFeedParser, parse_author, parse_search_response
+from arxivsmart.arxiv.types import Author, Paper, SearchFeedHeader
 
 SAMPLE_ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
 <feed xmlns="http://www.w3.org/2005/Atom"
@@ -75,7 +77,7 @@ class TestParseSearchResponse:
         assert paper.authors[0].affiliation == "MIT"
         assert paper.authors[1].name == "Bob Jones"
         assert paper.authors[1].affiliation == ""
-        assert paper.categories == ["cs.AI", "cs.LG"]
+        assert paper.categories == ("cs.AI", "cs.LG")
         assert paper.primary_category == "cs.AI"
         assert paper.published == "2023-01-01T00:00:00Z"
         assert paper.updated == "2023-01-02T00:00:00Z"
@@ -93,6 +95,41 @@ class TestParseSearchResponse:
         assert paper.journal_ref == ""
         assert paper.pdf_url == ""
 
+    def test_categories_are_interned_and_papers_slotted(self):
+        first = parse_search_response(SAMPLE_ATOM_FEED).papers[0]
+        second = parse_search_response(SAMPLE_ATOM_FEED).papers[0]
+        assert first.primary_category is second.primary_category
+        assert first.categories[1] is second.categories[1]
+        assert not hasattr(first, "__dict__")
+
+    @pytest.mark.parametrize(
+        ("element", "message"),
+        [
+            (b"<published>2023-02-01T00:00:00Z</published>", "missing required element: atom:published"),
+            (b"<title>Minimal Paper</title>", "missing required element: atom:title"),
+            (b'<arxiv:primary_category term="math.CO" />', "missing arxiv:primary_category element"),
+            (b"<name>Charlie Brown</name>", "missing required element: atom:name"),
+        ],
+    )
+    def test_missing_required_element_raises(self, element, message):
+        with pytest.raises(ValueError, match=message):
+            parse_search_response(SAMPLE_ENTRY_NO_OPTIONAL.replace(element, b""))
+
+    def test_primary_category_without_term_raises(self):
+        feed = SAMPLE_ENTRY_NO_OPTIONAL.replace(b'<arxiv:primary_category term="math.CO" />', b"<arxiv:primary_category />")
+        with pytest.raises(ValueError, match="primary_category element missing term attribute"):
+            parse_search_response(feed)
+
+    def test_single_valued_fields_keep_first_occurrence(self):
+        feed = SAMPLE_ATOM_FEED.replace(
+            b"<arxiv:doi>10.1234/test</arxiv:doi>",
+            b"<arxiv:doi>10.1234/test</arxiv:doi><arxiv:doi>10.9999/other</arxiv:doi>"
+            b'<link href="http://arxiv.org/pdf/other" title="pdf" />',
+        )
+        paper = parse_search_response(feed).papers[0]
+        assert paper.doi == "10.1234/test"
+        assert paper.pdf_url == "http://arxiv.org/pdf/2301.00001v1"
+
     def test_malformed_xml_raises(self):
         from xml.etree.ElementTree import ParseError
 
@@ -100,6 +137,38 @@ class TestParseSearchResponse:
             parse_search_response(b"not xml at all")
 
 
+class TestSearchFeedParser:
+    def test_yields_header_then_entries_from_small_chunks(self):
+        parser = SearchFeedParser()
+        items = []
+        for index in range(0, len(SAMPLE_ATOM_FEED), 7):
+            items.extend(parser.feed(SAMPLE_ATOM_FEED[index : index + 7]))
+        items.extend(parser.close())
+
+        assert items[0] == SearchFeedHeader(total_results=1, start_index=0, items_per_page=1)
+        assert len(items) == 2
+        assert isinstance(items[1], Paper)
+        assert items[1] == parse_search_response(SAMPLE_ATOM_FEED).papers[0]
+
+    def test_first_paper_before_feed_finishes(self):
+        truncated = SAMPLE_ATOM_FEED[: SAMPLE_ATOM_FEED.index(b"</entry>") + len(b"</entry>")]
+        items = SearchFeedParser().feed(truncated)
+
+        assert isinstance(items[0], SearchFeedHeader)
+        assert isinstance(items[1], Paper)
+
+    def test_missing_header_raises(self):
+        feed = SAMPLE_ATOM_FEED.replace(b"<opensearch:startIndex>0</opensearch:startIndex>", b"")
+        with pytest.raises(ValueError, match="opensearch:startIndex"):
+            SearchFeedParser().feed(feed)
+
+    def test_truncated_feed_raises_on_close(self):
+        parser = SearchFeedParser()
+        parser.feed(SAMPLE_ATOM_FEED[:-20])
+        with pytest.raises(ParseError):
+            parser.close()
+
+
 class TestParseAuthor:
     def test_parse_author_with_affiliation(self):
         from xml.etree.ElementTree import Element, SubElement
@@ -0,0 +1,66 @@
+"""Tests for the sampling profiler."""
+
+import threading
+
+import pytest
+
+from arxivsmart.profiler import ProfilerBusyError, SamplingProfiler
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def _run_in_thread(name: str, target, stop: threading.Event) -> threading.Thread:
+    thread = threading.Thread(target=target, args=(stop,), name=name)
+    thread.start()
+    return thread
+
+
+class TestSamplingProfiler:
+    def test_invalid_interval_raises(self):
+        with pytest.raises(ValueError, match="interval_seconds"):
+            SamplingProfiler(interval_seconds=0.0)
+
+    def test_collapsed_stacks_are_rooted_at_the_thread_name(self):
+        stop = threading.Event()
+        thread = _run_in_thread("busy-worker", _spin, stop)
+        try:
+            output = SamplingProfiler(interval_seconds=0.001).profile(0.05, include_idle=False)
+        finally:
+            stop.set()
+            thread.join()
+
+        lines = [line for line in output.splitlines() if line.startswith("busy-worker;")]
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert "_spin (" in stack
+        assert "test_profiler.py:" in stack
+
+    def test_waiting_threads_are_left_out_unless_idle_is_included(self):
+        stop = threading.Event()
+        thread = _run_in_thread("parked-worker", threading.Event.wait, stop)
+        profiler = SamplingProfiler(interval_seconds=0.001)
+        try:
+            busy_only = profiler.profile(0.02, include_idle=False)
+            with_idle = profiler.profile(0.02, include_idle=True)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert "parked-worker;" not in busy_only
+        assert "parked-worker;" in with_idle
+
+    def test_concurrent_profile_raises_busy(self):
+        profiler = SamplingProfiler(interval_seconds=0.001)
+        thread = threading.Thread(target=profiler.profile, args=(0.2, False))
+        thread.start()
+        try:
+            while not profiler._lock.locked():
+                pass
+            with pytest.raises(ProfilerBusyError):
+                profiler.profile(0.01, include_idle=False)
+        finally:
+            thread.join()
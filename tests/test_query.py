@@ -0,0 +1,36 @@
+"""Tests for arXiv query canonicalization."""
+
+from arxivsmart.arxiv.query import canonicalize_query
+
+
+class TestCanonicalizeQuery:
+    def test_collapses_whitespace(self):
+        assert canonicalize_query("  quantum    computing ") == "quantum computing"
+
+    def test_lowercases_field_prefixes(self):
+        assert canonicalize_query("TI:quantum AU:Smith Cat:cs.LG") == "ti:quantum au:Smith cat:cs.LG"
+
+    def test_keeps_term_case(self):
+        assert canonicalize_query("ti:Quantum") == "ti:Quantum"
+
+    def test_keeps_lowercase_operator_words(self):
+        assert canonicalize_query("ti:rock and roll") == "ti:rock and roll"
+        assert canonicalize_query("ti:a or au:b not cat:c") == "ti:a or au:b not cat:c"
+        assert canonicalize_query("ti:rock and roll") != canonicalize_query("ti:rock AND roll")
+
+    def test_merges_and_not_into_andnot(self):
+        assert canonicalize_query("ti:a AND NOT ti:b") == "ti:a ANDNOT ti:b"
+        assert canonicalize_query("ti:a and not ti:b") == "ti:a and not ti:b"
+
+    def test_normalizes_quoted_phrases(self):
+        assert canonicalize_query('TI:"deep    learning"') == 'ti:"deep learning"'
+
+    def test_tightens_parentheses(self):
+        assert canonicalize_query("cat:cs.LG AND ( ti:a OR ti:b )") == "cat:cs.LG AND (ti:a OR ti:b)"
+
+    def test_keeps_field_prefix_on_its_group(self):
+        assert canonicalize_query("ti:(a OR b)") == "ti:(a OR b)"
+        assert canonicalize_query("TI:( neural  OR network ) AND au:smith") == "ti:(neural OR network) AND au:smith"
+
+    def test_unknown_prefix_untouched(self):
+        assert canonicalize_query("Foo:bar") == "Foo:bar"
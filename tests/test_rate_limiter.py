@@ -1,53 +1,68 @@
 """Tests for the arXiv API rate limiter."""
 
-import threading
+import asyncio
 import time
 
 import pytest
 
-from arxivsmart.arxiv.rate_limiter import RateLimiter
+from arxivsmart.arxiv.rate_limiter import RateLimiter, RateLimiterFullError, UpstreamThrottledError
+
+
+def _make_rate_limiter(min_interval_seconds: float) -> RateLimiter:
+    return RateLimiter(
+        min_interval_seconds=min_interval_seconds,
+        max_interval_seconds=1.0,
+        backoff_factor=2.0,
+        recovery_successes=2,
+        max_queue_depth=100,
+    )
+
+
+def _make_bounded_rate_limiter(max_queue_depth: int) -> RateLimiter:
+    return RateLimiter(
+        min_interval_seconds=3.0,
+        max_interval_seconds=60.0,
+        backoff_factor=2.0,
+        recovery_successes=2,
+        max_queue_depth=max_queue_depth,
+    )
 
 
 class TestRateLimiter:
     def test_invalid_interval_raises(self):
         with pytest.raises(ValueError, match="must be greater than 0"):
-            RateLimiter(min_interval_seconds=0.0)
+            _make_rate_limiter(0.0)
 
     def test_negative_interval_raises(self):
         with pytest.raises(ValueError, match="must be greater than 0"):
-            RateLimiter(min_interval_seconds=-1.0)
+            _make_rate_limiter(-1.0)
 
-    def test_context_manager_basic(self):
-        limiter = RateLimiter(min_interval_seconds=0.01)
-        with limiter:
+    async def test_context_manager_basic(self):
+        limiter = _make_rate_limiter(0.01)
+        async with limiter.slot("normal"):
             pass
 
-    def test_rate_limiting_enforces_delay(self):
-        limiter = RateLimiter(min_interval_seconds=0.1)
+    async def test_rate_limiting_enforces_delay(self):
+        limiter = _make_rate_limiter(0.1)
 
-        with limiter:
+        async with limiter.slot("normal"):
             pass
 
         start = time.monotonic()
-        with limiter:
+        async with limiter.slot("normal"):
             elapsed = time.monotonic() - start
 
         assert elapsed >= 0.09
 
-    def test_thread_safety(self):
-        limiter = RateLimiter(min_interval_seconds=0.05)
+    async def test_concurrent_callers_are_spaced(self):
+        limiter = _make_rate_limiter(0.05)
         results: list[float] = []
-        lock = threading.Lock()
 
-        def worker():
-            with limiter, lock:
+        async def worker():
+            async with limiter.slot("normal"):
                 results.append(time.monotonic())
 
-        threads = [threading.Thread(target=worker) for _ in range(3)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        await asyncio.gather(*(worker() for _ in range(3)))
 
         assert len(results) == 3
         sorted_times = sorted(results)
@@ -55,7 +70,284 @@ class TestRateLimiter:
             gap = sorted_times[i] - sorted_times[i - 1]
             assert gap >= 0.04
 
-    def test_acquire_release_manual(self):
-        limiter = RateLimiter(min_interval_seconds=0.01)
-        limiter.acquire()
+    async def test_acquire_release_manual(self):
+        limiter = _make_rate_limiter(0.01)
+        await limiter.acquire("normal")
+        limiter.release()
+
+    async def test_acquire_if_idle_when_free(self):
+        limiter = _make_rate_limiter(0.01)
+        assert await limiter.acquire_if_idle()
+        limiter.release()
+
+    async def test_acquire_if_idle_when_held(self):
+        limiter = _make_rate_limiter(0.01)
+        await limiter.acquire("normal")
+        try:
+            assert not await limiter.acquire_if_idle()
+        finally:
+            limiter.release()
+
+    async def test_queue_depth_counts_waiters(self):
+        limiter = _make_rate_limiter(0.01)
+        await limiter.acquire("normal")
+        waiters = [asyncio.create_task(limiter.acquire("normal")) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth() == 3
+
+        for _ in waiters:
+            limiter.release()
+            await asyncio.sleep(0.02)
+        limiter.release()
+        await asyncio.gather(*waiters)
+        assert limiter.queue_depth() == 0
+
+    async def test_cancelled_waiter_frees_the_lock(self):
+        limiter = _make_rate_limiter(0.2)
+        await limiter.acquire("normal")
+        limiter.release()
+
+        waiter = asyncio.create_task(limiter.acquire("normal"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        await asyncio.wait_for(limiter.acquire("normal"), timeout=1.0)
+        limiter.release()
+
+    async def test_interactive_waiter_overtakes_queued_bulk_work(self):
+        limiter = _make_rate_limiter(0.01)
+        order: list[str] = []
+
+        async def worker(name: str, priority):
+            async with limiter.slot(priority):
+                order.append(name)
+
+        await limiter.acquire("normal")
+        tasks = [asyncio.create_task(worker(f"bulk{i}", "background")) for i in range(3)]
+        tasks += [asyncio.create_task(worker(f"normal{i}", "normal")) for i in range(2)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(worker("user", "interactive")))
+        await asyncio.sleep(0)
         limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["user", "normal0", "normal1", "bulk0", "bulk1", "bulk2"]
+
+    async def test_stats_count_waiters_and_grants_per_class(self):
+        limiter = _make_rate_limiter(0.01)
+        await limiter.acquire("interactive")
+        waiter = asyncio.create_task(limiter.acquire("background"))
+        await asyncio.sleep(0)
+
+        stats = limiter.stats()
+        assert stats["interactive_granted"] == 1
+        assert stats["background_waiting"] == 1
+
+        limiter.release()
+        await waiter
+        limiter.release()
+        assert limiter.stats()["background_granted"] == 1
+
+    async def test_stats_total_time_spent_waiting(self):
+        limiter = _make_rate_limiter(0.05)
+        await limiter.acquire("normal")
+        limiter.release()
+        await limiter.acquire("normal")
+        limiter.release()
+
+        assert limiter.stats()["wait_seconds_total"] == pytest.approx(0.05, abs=0.03)
+
+    async def test_wait_histogram_counts_every_grant(self):
+        limiter = _make_rate_limiter(0.05)
+        await limiter.acquire("normal")
+        limiter.release()
+        await limiter.acquire("interactive")
+        limiter.release()
+
+        histogram = limiter.wait_histogram()
+        assert histogram.count() == 2
+        assert histogram.total() == pytest.approx(limiter.stats()["wait_seconds_total"])
+
+
+class TestAdaptivePacing:
+    def test_max_interval_below_min_raises(self):
+        with pytest.raises(ValueError, match="max_interval_seconds"):
+            RateLimiter(min_interval_seconds=1.0, max_interval_seconds=0.5, backoff_factor=2.0, recovery_successes=1, max_queue_depth=1)
+
+    def test_backoff_factor_must_grow_interval(self):
+        with pytest.raises(ValueError, match="backoff_factor"):
+            RateLimiter(min_interval_seconds=1.0, max_interval_seconds=2.0, backoff_factor=1.0, recovery_successes=1, max_queue_depth=1)
+
+    def test_throttle_grows_interval_up_to_ceiling(self):
+        limiter = _make_rate_limiter(0.3)
+        limiter.record_throttle(None)
+        assert limiter.stats()["interval_seconds"] == pytest.approx(0.6)
+        limiter.record_throttle(None)
+        assert limiter.stats()["interval_seconds"] == pytest.approx(1.0)
+
+    def test_sustained_success_shrinks_interval_to_floor(self):
+        limiter = _make_rate_limiter(0.3)
+        limiter.record_throttle(None)
+        limiter.record_throttle(None)
+
+        limiter.record_success()
+        assert limiter.stats()["interval_seconds"] == pytest.approx(1.0)
+        limiter.record_success()
+        assert limiter.stats()["interval_seconds"] == pytest.approx(0.5)
+        for _ in range(4):
+            limiter.record_success()
+        assert limiter.stats()["interval_seconds"] == pytest.approx(0.3)
+
+    def test_throttle_resets_success_streak(self):
+        limiter = _make_rate_limiter(0.1)
+        limiter.record_throttle(None)
+        limiter.record_success()
+        limiter.record_throttle(None)
+        limiter.record_success()
+        assert limiter.stats()["interval_seconds"] == pytest.approx(0.4)
+
+    async def test_retry_after_holds_next_slot_back(self):
+        limiter = _make_rate_limiter(0.01)
+        limiter.record_throttle(0.2)
+
+        start = time.monotonic()
+        async with limiter.slot("normal"):
+            pass
+        assert time.monotonic() - start >= 0.19
+
+    async def test_run_retries_throttled_call_in_later_slot(self):
+        limiter = _make_rate_limiter(0.01)
+        attempts: list[float] = []
+
+        async def call() -> str:
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise UpstreamThrottledError("arXiv returned status 429", retry_after_seconds=None)
+            return "ok"
+
+        assert await limiter.run("normal", call, 2) == "ok"
+        assert len(attempts) == 2
+        assert attempts[1] - attempts[0] >= 0.019
+        stats = limiter.stats()
+        assert stats["throttled"] == 1
+        assert stats["retried"] == 1
+        assert stats["normal_granted"] == 2
+
+    async def test_run_raises_when_retries_exhausted(self):
+        limiter = _make_rate_limiter(0.01)
+
+        async def call() -> str:
+            raise UpstreamThrottledError("arXiv returned status 503", retry_after_seconds=None)
+
+        with pytest.raises(UpstreamThrottledError, match="503"):
+            await limiter.run("normal", call, 1)
+        assert limiter.stats()["throttled"] == 2
+        assert limiter.queue_depth() == 0
+
+    async def test_retry_queues_behind_waiting_callers(self):
+        limiter = _make_rate_limiter(0.01)
+        order: list[str] = []
+
+        async def throttled_once() -> None:
+            order.append("first")
+            if order.count("first") == 1:
+                await asyncio.sleep(0.02)
+                raise UpstreamThrottledError("arXiv returned status 503", retry_after_seconds=None)
+
+        async def other() -> None:
+            async with limiter.slot("normal"):
+                order.append("other")
+
+        first = asyncio.create_task(limiter.run("normal", throttled_once, 1))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(other())
+        await asyncio.gather(first, second)
+
+        assert order == ["first", "other", "first"]
+
+
+class TestAdmissionControl:
+    def test_invalid_max_queue_depth_raises(self):
+        with pytest.raises(ValueError, match="max_queue_depth"):
+            _make_bounded_rate_limiter(0)
+
+    async def test_full_queue_rejects_with_wait_estimate(self):
+        limiter = _make_bounded_rate_limiter(2)
+        await limiter.acquire("normal")
+        waiters = [asyncio.create_task(limiter.acquire("normal")) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(RateLimiterFullError, match="queue is full") as exc_info:
+            await limiter.acquire("normal")
+        # Two queued callers ahead, each a 3 s interval after the held slot's next window.
+        assert exc_info.value.retry_after_seconds == pytest.approx(9.0, abs=0.1)
+        assert limiter.stats()["normal_rejected"] == 1
+        assert limiter.queue_depth() == 2
+
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    async def test_urgent_caller_takes_the_place_of_the_newest_bulk_waiter(self):
+        limiter = _make_bounded_rate_limiter(2)
+        await limiter.acquire("normal")
+        first = asyncio.create_task(limiter.acquire("background"))
+        newest = asyncio.create_task(limiter.acquire("background"))
+        await asyncio.sleep(0)
+
+        urgent = asyncio.create_task(limiter.acquire("interactive"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(RateLimiterFullError):
+            await newest
+        assert not first.done()
+        assert [caller.priority for caller in limiter.waiters()] == ["interactive", "background"]
+        assert limiter.stats()["background_rejected"] == 1
+
+        for task in (first, urgent):
+            task.cancel()
+        await asyncio.gather(first, urgent, return_exceptions=True)
+
+    async def test_turned_away_waiter_cancelled_before_resuming_does_not_hand_over(self):
+        limiter = _make_bounded_rate_limiter(1)
+        await limiter.acquire("normal")
+        bulk = asyncio.create_task(limiter.acquire("background"))
+        await asyncio.sleep(0)
+
+        urgent = asyncio.create_task(limiter.acquire("interactive"))
+        await asyncio.sleep(0)
+        bulk.cancel()
+        await asyncio.gather(bulk, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert not urgent.done()
+        assert limiter.stats()["interactive_granted"] == 0
+
+        limiter.release()
+        await asyncio.sleep(0)
+        assert limiter.stats()["interactive_granted"] == 1
+
+        urgent.cancel()
+        await asyncio.gather(urgent, return_exceptions=True)
+
+    async def test_waiters_are_listed_in_grant_order_with_growing_etas(self):
+        limiter = _make_bounded_rate_limiter(10)
+        await limiter.acquire("normal")
+        tasks = [
+            asyncio.create_task(limiter.acquire("background")),
+            asyncio.create_task(limiter.acquire("normal")),
+            asyncio.create_task(limiter.acquire("interactive")),
+        ]
+        await asyncio.sleep(0)
+
+        waiters = limiter.waiters()
+        assert [caller.priority for caller in waiters] == ["interactive", "normal", "background"]
+        assert [caller.eta_seconds for caller in waiters] == pytest.approx([3.0, 6.0, 9.0], abs=0.1)
+        assert all(caller.waited_seconds >= 0.0 for caller in waiters)
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert limiter.waiters() == []
@@ -0,0 +1,71 @@
+"""Tests for the in-memory search result cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from arxivsmart.arxiv.types import SearchResult
+from arxivsmart.cache.search import SearchCache, SearchKey
+
+
+def _key(query: str) -> SearchKey:
+    return SearchKey(query=query, upstream_query=query, start=0, max_results=10, sort_by="relevance", sort_order="descending")
+
+
+def _result(total: int) -> SearchResult:
+    return SearchResult(total_results=total, start_index=0, items_per_page=10, papers=())
+
+
+class TestSearchCache:
+    def test_hard_ttl_below_soft_ttl_raises(self):
+        with pytest.raises(ValueError, match="hard_ttl_seconds"):
+            SearchCache(soft_ttl_seconds=10.0, hard_ttl_seconds=5.0, max_entries=10)
+
+    def test_fresh_stale_and_expired(self):
+        cache = SearchCache(soft_ttl_seconds=10.0, hard_ttl_seconds=100.0, max_entries=10)
+        with patch("arxivsmart.cache.search.time.monotonic", return_value=0.0):
+            cache.put(_key("q"), _result(1))
+
+        with patch("arxivsmart.cache.search.time.monotonic", return_value=5.0):
+            lookup = cache.get(_key("q"))
+        assert lookup is not None
+        assert not lookup.is_stale
+
+        with patch("arxivsmart.cache.search.time.monotonic", return_value=50.0):
+            lookup = cache.get(_key("q"))
+        assert lookup is not None
+        assert lookup.is_stale
+
+        with patch("arxivsmart.cache.search.time.monotonic", return_value=101.0):
+            assert cache.get(_key("q")) is None
+
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["stale_hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = SearchCache(soft_ttl_seconds=10.0, hard_ttl_seconds=100.0, max_entries=2)
+        cache.put(_key("a"), _result(1))
+        cache.put(_key("b"), _result(2))
+        cache.get(_key("a"))
+        cache.put(_key("c"), _result(3))
+
+        assert cache.get(_key("b")) is None
+        assert cache.get(_key("a")) is not None
+        assert cache.get(_key("c")) is not None
+
+    def test_memory_bytes_grow_with_entries(self):
+        cache = SearchCache(soft_ttl_seconds=10.0, hard_ttl_seconds=100.0, max_entries=10)
+        empty = cache.memory_bytes()
+        cache.put(_key("a"), _result(1))
+        cache.put(_key("b"), _result(2))
+
+        assert cache.memory_bytes() > empty
+
+    def test_refresh_claim_is_exclusive(self):
+        cache = SearchCache(soft_ttl_seconds=10.0, hard_ttl_seconds=100.0, max_entries=10)
+        assert cache.begin_refresh(_key("q"))
+        assert not cache.begin_refresh(_key("q"))
+        cache.end_refresh(_key("q"), refreshed=True)
+        assert cache.begin_refresh(_key("q"))
+        assert cache.stats()["refreshes"] == 1
@@ -0,0 +1,55 @@
+"""Tests for per-request phase timings."""
+
+import asyncio
+
+import pytest
+
+from arxivsmart.server_timing import ServerTiming, collect_server_timing, record_phase, record_phases
+
+
+class TestServerTiming:
+    def test_header_lists_phases_in_order_then_total(self):
+        timing = ServerTiming()
+        timing.add("limiter", 0.25)
+        timing.add("upstream", 0.1)
+        timing.add("limiter", 0.05)
+
+        assert timing.header_value(0.5) == "limiter;dur=300.0, upstream;dur=100.0, total;dur=500.0"
+
+    def test_merge_adds_phases(self):
+        timing = ServerTiming()
+        timing.add("upstream", 0.1)
+        other = ServerTiming()
+        other.add("upstream", 0.2)
+        other.add("parse_feed", 0.01)
+        timing.merge(other)
+
+        assert timing.durations() == {"upstream": pytest.approx(0.3), "parse_feed": 0.01}
+
+
+class TestCollectServerTiming:
+    def test_record_phase_outside_collection_is_ignored(self):
+        record_phase("upstream", 1.0)
+        with collect_server_timing() as timing:
+            pass
+        assert timing.durations() == {}
+
+    async def test_phases_recorded_in_tasks_reach_the_request_timing(self):
+        with collect_server_timing() as timing:
+            await asyncio.create_task(asyncio.sleep(0))
+            await asyncio.gather(asyncio.to_thread(lambda: None), _record_later("serialize", 0.002))
+
+        assert timing.durations() == {"serialize": 0.002}
+
+    def test_record_phases_merges_into_the_current_timing(self):
+        shared = ServerTiming()
+        shared.add("limiter", 0.5)
+        with collect_server_timing() as timing:
+            record_phases(shared)
+
+        assert timing.durations() == {"limiter": 0.5}
+
+
+async def _record_later(phase: str, seconds: float) -> None:
+    await asyncio.sleep(0)
+    record_phase(phase, seconds)
@@ -0,0 +1,73 @@
+"""Tests for request coalescing."""
+
+import asyncio
+
+import pytest
+
+from arxivsmart.arxiv.single_flight import SingleFlight
+
+
+async def _value(value: int) -> int:
+    return value
+
+
+class TestSingleFlight:
+    async def test_sequential_calls_each_execute(self):
+        flight: SingleFlight[str, int] = SingleFlight()
+        assert await flight.do("a", lambda: _value(1)) == 1
+        assert await flight.do("a", lambda: _value(2)) == 2
+        assert flight.stats() == {"executions": 2, "merged": 0, "in_flight": 0}
+
+    async def test_concurrent_identical_calls_share_one_execution(self):
+        flight: SingleFlight[str, int] = SingleFlight()
+        calls: list[int] = []
+        release = asyncio.Event()
+
+        async def slow() -> int:
+            calls.append(1)
+            await release.wait()
+            return 42
+
+        tasks = [asyncio.create_task(flight.do("a", slow)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [42] * 5
+        assert len(calls) == 1
+        assert flight.stats()["merged"] == 4
+
+    async def test_exception_propagates_to_merged_callers(self):
+        flight: SingleFlight[str, int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def failing() -> int:
+            await release.wait()
+            raise RuntimeError("upstream failed")
+
+        tasks = [asyncio.create_task(flight.do("a", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert len(results) == 3
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flight.stats()["in_flight"] == 0
+
+    async def test_cancelled_follower_does_not_cancel_leader(self):
+        flight: SingleFlight[str, int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def slow() -> int:
+            await release.wait()
+            return 7
+
+        leader = asyncio.create_task(flight.do("a", slow))
+        follower = asyncio.create_task(flight.do("a", slow))
+        await asyncio.sleep(0)
+        follower.cancel()
+        release.set()
+
+        assert await leader == 7
+        with pytest.raises(asyncio.CancelledError):
+            await follower
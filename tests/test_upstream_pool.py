@@ -0,0 +1,92 @@
+"""Tests for per-upstream concurrency limits and worker threads."""
+
+import asyncio
+import threading
+
+import pytest
+
+from arxivsmart.arxiv.upstream_pool import UpstreamPool
+
+
+class TestUpstreamPool:
+    def test_invalid_concurrency_raises(self):
+        with pytest.raises(ValueError, match="max_concurrency must be greater than 0"):
+            UpstreamPool(name="api", max_concurrency=0, workers=1)
+
+    def test_invalid_workers_raises(self):
+        with pytest.raises(ValueError, match="workers must be greater than 0"):
+            UpstreamPool(name="api", max_concurrency=1, workers=0)
+
+    async def test_slot_limits_concurrency_and_counts_saturation(self):
+        pool = UpstreamPool(name="api", max_concurrency=2, workers=1)
+        active = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def request() -> None:
+            nonlocal active, peak
+            async with pool.slot():
+                active += 1
+                peak = max(peak, active)
+                await release.wait()
+                active -= 1
+
+        tasks = [asyncio.create_task(request()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        stats = pool.stats()
+        assert stats["in_flight"] == 2
+        assert stats["waiting"] == 3
+        assert stats["saturated"] == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert peak == 2
+        assert pool.stats()["in_flight"] == 0
+        assert pool.stats()["acquired"] == 5
+        pool.close()
+
+    async def test_run_in_worker_uses_pool_threads(self):
+        pool = UpstreamPool(name="html", max_concurrency=1, workers=1)
+        thread_name = await pool.run_in_worker("probe", lambda: threading.current_thread().name)
+        assert thread_name.startswith("arxivsmart-html")
+        assert pool.stats()["peak_worker_tasks"] == 1
+        pool.close()
+
+    async def test_run_in_worker_times_each_task_name(self):
+        pool = UpstreamPool(name="api", max_concurrency=1, workers=1)
+        await pool.run_in_worker("parse_feed", lambda: None)
+        await pool.run_in_worker("parse_feed", lambda: None)
+        await pool.run_in_worker("markdown", lambda: None)
+
+        histograms = pool.task_histograms()
+        assert histograms["parse_feed"].count() == 2
+        assert histograms["markdown"].count() == 1
+        pool.close()
+
+    def test_records_upstream_responses_and_bytes(self):
+        pool = UpstreamPool(name="pdf", max_concurrency=1, workers=1)
+        pool.record_response("200", 0.2)
+        pool.record_response("200", 0.4)
+        pool.record_response("error", 1.0)
+        pool.record_bytes(1024)
+
+        assert pool.response_statuses() == {"200": 2, "error": 1}
+        assert pool.response_histogram().count() == 3
+        assert pool.stats()["bytes_received"] == 1024
+        pool.close()
+
+    async def test_separate_pools_do_not_block_each_other(self):
+        api_pool = UpstreamPool(name="api", max_concurrency=1, workers=1)
+        html_pool = UpstreamPool(name="html", max_concurrency=1, workers=1)
+        await api_pool.acquire()
+        waiter = asyncio.create_task(api_pool.acquire())
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(html_pool.acquire(), timeout=0.1)
+        html_pool.release()
+
+        api_pool.release()
+        await waiter
+        api_pool.release()
+        api_pool.close()
+        html_pool.close()